@@ -3,14 +3,15 @@ from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_cors import CORS
-from flask_jwt_extended import JWTManager
 from config import config
+from app.utils.replica import RoutingSession
+from app.utils.tokens import CachingJWTManager
 
 # Initialize extensions
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 migrate = Migrate()
 cors = CORS()
-jwt = JWTManager()
+jwt = CachingJWTManager()
 
 def create_app(config_name=None):
     """Create and configure the Flask application."""
@@ -19,9 +20,16 @@ def create_app(config_name=None):
     
     app = Flask(__name__)
     app.config.from_object(config[config_name])
+    app.logger.setLevel(app.config['LOG_LEVEL'])
     
     # Initialize extensions with app
     db.init_app(app)
+    from app.utils.database import init_engine
+    init_engine(app)
+    from app.utils.write_queue import init_write_queue
+    init_write_queue(app)
+    from app.utils.replica import init_read_replica
+    init_read_replica(app)
     migrate.init_app(app, db)
     cors.init_app(app)
     jwt.init_app(app)
@@ -33,14 +41,48 @@ def create_app(config_name=None):
     from app.api.employees import employees_bp
     from app.api.projects import projects_bp
     from app.api.tasks import tasks_bp
+    from app.api.admin import admin_bp
     
     app.register_blueprint(auth_bp, url_prefix='/api/auth')
     app.register_blueprint(users_bp, url_prefix='/api/users')
     app.register_blueprint(employees_bp, url_prefix='/api/v1/employee')
     app.register_blueprint(projects_bp, url_prefix='/api/v1/project')
     app.register_blueprint(tasks_bp, url_prefix='/api/v1/task')
+    app.register_blueprint(admin_bp, url_prefix='/api/admin')
     app.register_blueprint(main_bp, url_prefix='/api')
     
+    # In-process cache for the GET-by-id endpoints
+    from app.utils.cache import init_entity_cache
+    init_entity_cache(app)
+    
+    # Password hashing on a bounded worker pool
+    from app.utils.passwords import init_password_hasher
+    init_password_hasher(app)
+    
+    # The authenticated user is memoized per request, see app.utils.auth
+    from app.utils.auth import forget_current_user
+    app.teardown_request(forget_current_user)
+    
+    # Per-request query counts, slow query and N+1 logging
+    from app.utils.queries import init_query_tracking
+    init_query_tracking(app)
+    
+    # Request metrics at /metrics
+    from app.utils.metrics import init_metrics
+    init_metrics(app)
+    
+    # Opt-in tracemalloc peak and allocation sites per request
+    from app.utils.memory import init_memory_tracking
+    init_memory_tracking(app)
+    
+    # Sampling profiler for selected requests
+    from app.utils.profiler import init_profiler
+    init_profiler(app)
+    
+    # Register CLI commands
+    from app.cli import register_commands
+    register_commands(app)
+    
     # Health check endpoint
     @app.route('/health')
     def health_check():
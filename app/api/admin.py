@@ -0,0 +1,26 @@
+from flask import Blueprint, current_app, jsonify, request, send_from_directory
+from flask_jwt_extended import jwt_required
+from app.utils.profiler import recent_profiles
+
+admin_bp = Blueprint('admin', __name__)
+
+PROFILE_FILES = {'folded': '.folded', 'speedscope': '.speedscope.json'}
+
+@admin_bp.route('/profiles', methods=['GET'])
+@jwt_required()
+def list_profiles():
+    """List recent request profiles, newest first (admin only - simplified for demo)."""
+    if 'profiler' not in current_app.extensions:
+        return jsonify({'error': 'Profiling is disabled'}), 404
+    
+    limit = request.args.get('limit', 50, type=int)
+    return jsonify({'profiles': recent_profiles(limit)}), 200
+
+@admin_bp.route('/profiles/<string:name>/<any(folded, speedscope):kind>', methods=['GET'])
+@jwt_required()
+def get_profile(name, kind):
+    """Download a profile as collapsed stacks or a speedscope file."""
+    if 'profiler' not in current_app.extensions:
+        return jsonify({'error': 'Profiling is disabled'}), 404
+    
+    return send_from_directory(current_app.config['PROFILE_DIR'], name + PROFILE_FILES[kind])
@@ -1,16 +1,22 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, current_app, request, jsonify
 from flask_jwt_extended import create_access_token, create_refresh_token, jwt_required, get_jwt_identity
 from marshmallow import ValidationError
 from app.schemas.auth import LoginSchema, RegisterSchema
 from app.models.user import User
+from app.utils.auth import current_user_profile
+from app.utils.passwords import HasherBusy, password_hasher
 from app import db
-import bcrypt
 
 auth_bp = Blueprint('auth', __name__)
 
 login_schema = LoginSchema()
 register_schema = RegisterSchema()
 
+def _hasher_busy():
+    """Response for when the password hashing queue is full."""
+    retry_after = current_app.config['BCRYPT_RETRY_AFTER']
+    return jsonify({'error': 'Too many authentication requests, try again later'}), 503, {'Retry-After': str(retry_after)}
+
 @auth_bp.route('/login', methods=['POST'])
 def login():
     """User login endpoint."""
@@ -23,8 +29,20 @@ def login():
     # Find user by email
     user = User.query.filter_by(email=data['email']).first()
     
-    if not user or not bcrypt.checkpw(data['password'].encode('utf-8'), user.password_hash):
-        return jsonify({'error': 'Invalid credentials'}), 401
+    hasher = password_hasher()
+    try:
+        if not user or not hasher.check(data['password'], user.password_hash):
+            return jsonify({'error': 'Invalid credentials'}), 401
+    except HasherBusy:
+        return _hasher_busy()
+    
+    # Bring the stored hash to the configured cost while the password is at hand
+    if hasher.needs_rehash(user.password_hash):
+        try:
+            user.password_hash = hasher.hash(data['password'])
+            db.session.commit()
+        except HasherBusy:
+            pass  # Try again on a later login
     
     # Create tokens
     access_token = create_access_token(identity=str(user.id))
@@ -54,7 +72,10 @@ def register():
         return jsonify({'error': 'Email already registered'}), 409
     
     # Hash password
-    password_hash = bcrypt.hashpw(data['password'].encode('utf-8'), bcrypt.gensalt())
+    try:
+        password_hash = password_hasher().hash(data['password'])
+    except HasherBusy:
+        return _hasher_busy()
     
     # Create new user
     user = User(
@@ -98,17 +119,11 @@ def refresh():
 @jwt_required()
 def get_current_user():
     """Get current user information."""
-    current_user_id = get_jwt_identity()
-    user = User.query.get(int(current_user_id))  # Convert back to int for DB query
+    user = current_user_profile()
     
     if not user:
         return jsonify({'error': 'User not found'}), 404
     
     return jsonify({
-        'user': {
-            'id': user.id,
-            'email': user.email,
-            'name': user.name,
-            'created_at': user.created_at.isoformat()
-        }
+        'user': user
     }), 200 
\ No newline at end of file
@@ -1,99 +1,73 @@
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from marshmallow import ValidationError
-from sqlalchemy import or_
+from sqlalchemy import insert
 from app.schemas.employee import (
     EmployeeCreateSchema, EmployeeUpdateSchema, EmployeeResponseSchema,
     EmployeeListSchema, ProjectOperationSchema
 )
+from app.schemas.compiled import compile_loader, compile_schema
 from app.models.employee import Employee
 from app.models.project import Project
+from app.models.employee_project import EmployeeProject
+from app.utils.bulk import bulk_response, load_bulk
+from app.utils.etag import get_entity, is_fresh, make_etag, not_modified, page_etag
+from app.utils.pagination import paginate
+from app.utils.search import apply_search
+from app.utils.streaming import stream_ndjson, wants_ndjson
+from app.utils.write_queue import serialized_write
 from app import db
 import time
+import uuid
 
 employees_bp = Blueprint('employees', __name__)
 
-# Schema instances
-employee_create_schema = EmployeeCreateSchema()
-employee_update_schema = EmployeeUpdateSchema()
-employee_response_schema = EmployeeResponseSchema()
-employees_response_schema = EmployeeResponseSchema(many=True)
+# Schema instances (write and response schemas are compiled once, see app.schemas.compiled)
+employee_create_schema = compile_loader(EmployeeCreateSchema())
+employee_update_schema = compile_loader(EmployeeUpdateSchema())
+employee_response_schema = compile_schema(EmployeeResponseSchema())
+employees_response_schema = compile_schema(EmployeeResponseSchema(many=True))
 employee_list_schema = EmployeeListSchema()
 project_operation_schema = ProjectOperationSchema()
 
 
 def _update_project_employee_relationships(employee_id, projects_to_remove, projects_to_add):
     """
-    Update bidirectional employee-project relationships.
+    Touch the projects on the other side of changed employee-project memberships.
+    
+    The membership rows are shared by both sides, so the projects only need
+    their timestamps bumped, which is done with a single UPDATE.
     
     Args:
         employee_id: ID of the employee
-        projects_to_remove: Set of project IDs to remove employee from
-        projects_to_add: Set of project IDs to add employee to
+        projects_to_remove: Set of project IDs the employee was removed from
+        projects_to_add: Set of project IDs the employee was added to
         
     Returns:
         Set of all affected project IDs
     """
-    affected_projects = set()
-    
     if not projects_to_remove and not projects_to_add:
-        return affected_projects
+        return set()
     
     all_project_ids = projects_to_remove | projects_to_add
-    projects = Project.query.filter(Project.id.in_(all_project_ids)).all()
-    
-    for project in projects:
-        if project.id in projects_to_remove:
-            # Remove employee from project
-            if project.employees and employee_id in project.employees:
-                project.employees = [emp_id for emp_id in project.employees if emp_id != employee_id]
-                project.update_timestamp()
-                db.session.add(project)
-                affected_projects.add(project.id)
-                
-        elif project.id in projects_to_add:
-            # Add employee to project
-            if not project.employees:
-                project.employees = []
-            if employee_id not in project.employees:
-                project.employees = project.employees + [employee_id]
-                project.update_timestamp()
-                db.session.add(project)
-                affected_projects.add(project.id)
+    affected_projects = {
+        project_id for (project_id,) in
+        db.session.query(Project.id).filter(Project.id.in_(all_project_ids))
+    }
+    if affected_projects:
+        Project.query.filter(Project.id.in_(affected_projects)).update(
+            {Project.updated_at: int(time.time() * 1000)}, synchronize_session='evaluate'
+        )
     
     return affected_projects
 
 
-def _sync_tasks_with_projects(project_ids):
-    """
-    Synchronize task employee lists with their corresponding project employee lists.
-    
-    Args:
-        project_ids: Set of project IDs whose tasks need to be synced
-    """
-    if not project_ids:
-        return
-    
-    from app.models.task import Task
-    
-    # Get all tasks for the affected projects
-    tasks = Task.query.filter(Task.project_id.in_(project_ids)).all()
-    
-    # Create a lookup for projects to avoid repeated queries
-    projects = Project.query.filter(Project.id.in_(project_ids)).all()
-    project_lookup = {project.id: project for project in projects}
-    
-    for task in tasks:
-        project = project_lookup.get(task.project_id)
-        if project:
-            task.employees = project.employees or []
-            task.update_timestamp()
-            db.session.add(task)
-
-
 def _handle_employee_project_updates(employee, new_projects):
     """
-    Handle updates to an employee's project relationships and sync dependent tasks.
+    Handle updates to an employee's project relationships.
+    
+    Task assignees are resolved from the owning project when read, so tasks
+    are not touched.
     
     Args:
         employee: Employee object to update
@@ -102,25 +76,46 @@ def _handle_employee_project_updates(employee, new_projects):
     Returns:
         Set of project IDs that were affected by the changes
     """
-    old_projects = set(employee.projects or [])
-    new_projects_set = set(new_projects)
+    old_projects = set(employee.projects)
+    new_projects_set = set(new_projects or [])
     
     projects_to_remove = old_projects - new_projects_set
     projects_to_add = new_projects_set - old_projects
     
-    # Update bidirectional relationships
+    # Update employee's project memberships (shared with the projects)
+    employee.projects = new_projects or []
+    
+    # Update the other side of the relationship
     affected_projects = _update_project_employee_relationships(
         employee.id, projects_to_remove, projects_to_add
     )
     
-    # Update employee's project list
-    employee.projects = list(new_projects_set)
+    return affected_projects
+
+
+def _build_employee_list_query(query_data):
+    """
+    Build the filtered employee list query for validated list parameters.
     
-    # Sync tasks for affected projects
-    if affected_projects:
-        _sync_tasks_with_projects(affected_projects)
+    Args:
+        query_data: Loaded EmployeeListSchema fields
+        
+    Returns:
+        Tuple of (query, search rank column or None), not yet ordered or paginated
+    """
+    # Build query
+    query = Employee.query
     
-    return affected_projects
+    # Filter by active status
+    if query_data.get('active_only'):
+        query = query.filter(Employee.deactivated.is_(None))
+    
+    # Search functionality (ranked full-text search where available)
+    rank = None
+    if query_data.get('search'):
+        query, rank = apply_search(query, Employee, query_data['search'])
+    
+    return query, rank
 
 
 @employees_bp.route('/', methods=['GET'])
@@ -133,35 +128,30 @@ def get_employees():
     except ValidationError as err:
         return jsonify({'error': 'Invalid query parameters', 'messages': err.messages}), 400
     
-    # Build query
-    query = Employee.query
-    
-    # Filter by active status
-    if query_data.get('active_only'):
-        query = query.filter(Employee.deactivated.is_(None))
+    query, rank = _build_employee_list_query(query_data)
     
-    # Search functionality
-    if query_data.get('search'):
-        search_term = f"%{query_data['search']}%"
-        query = query.filter(
-            or_(
-                Employee.name.ilike(search_term),
-                Employee.email.ilike(search_term)
-            )
-        )
+    # Sync jobs can pull the full result set as a stream instead
+    if wants_ndjson(query_data):
+        return stream_ndjson(query, Employee, employee_response_schema, rank)
     
-    # Order by creation date (newest first)
-    query = query.order_by(Employee.created_at.desc())
+    # Newest first, one page at a time
+    employees, pagination = paginate(query, Employee, query_data, rank)
     
-    # Get all employees (no pagination)
-    employees = query.all()
+    # Polling clients whose copy of the page is current get a 304 before it is serialized
+    etag = page_etag(employees, pagination, lambda employee: (employee.id, employee.updated_at, employee.projects))
+    if is_fresh(etag):
+        return not_modified(etag)
     
-    return jsonify({
-        'employees': employees_response_schema.dump(employees)
-    }), 200
+    response = jsonify({
+        'employees': employees_response_schema.dump(employees),
+        'pagination': pagination
+    })
+    response.set_etag(etag)
+    return response, 200
 
 @employees_bp.route('/', methods=['POST'])
 @jwt_required()
+@serialized_write
 def create_employee():
     """Create a new employee."""
     try:
@@ -183,6 +173,10 @@ def create_employee():
     
     try:
         db.session.add(employee)
+        db.session.flush()  # Get the ID without committing
+        
+        # The projects' employee lists changed too
+        _update_project_employee_relationships(employee.id, set(), set(employee.projects))
         db.session.commit()
         
         return jsonify({
@@ -194,21 +188,99 @@ def create_employee():
         db.session.rollback()
         return jsonify({'error': 'Failed to create employee'}), 500
 
+@employees_bp.route('/bulk', methods=['POST'])
+@jwt_required()
+@serialized_write
+def bulk_create_employees():
+    """Create many employees in one transaction, reporting errors per item."""
+    try:
+        items, errors = load_bulk(employee_create_schema, request.get_json())
+    except ValidationError as err:
+        return jsonify({'error': 'Validation failed', 'messages': err.messages}), 400
+    
+    # Check every email against the database in one query, and against earlier items
+    emails = {data['email'] for _, data in items}
+    taken = {
+        email for (email,) in
+        db.session.query(Employee.email).filter(Employee.email.in_(emails))
+    } if emails else set()
+    
+    now = int(time.time() * 1000)
+    employee_rows = []
+    link_rows = []
+    created = []
+    for index, data in items:
+        if data['email'] in taken:
+            errors[index] = {'email': ['Email already exists']}
+            continue
+        taken.add(data['email'])
+        
+        row = {
+            'id': str(uuid.uuid4()),
+            'name': data['name'],
+            'email': data['email'],
+            'invited': data.get('invited'),
+            'deactivated': None,
+            'created_at': now,
+            'updated_at': now
+        }
+        project_ids = data.get('projects') or []
+        employee_rows.append(row)
+        link_rows.extend(
+            {'employee_id': row['id'], 'project_id': project_id, 'created_at': now}
+            for project_id in project_ids
+        )
+        created.append({**row, 'projects': project_ids})
+    
+    if created:
+        try:
+            db.session.execute(insert(Employee), employee_rows)
+            if link_rows:
+                db.session.execute(insert(EmployeeProject), link_rows)
+                # The projects' employee lists changed too
+                project_ids = {link['project_id'] for link in link_rows}
+                Project.query.filter(Project.id.in_(project_ids)).update(
+                    {Project.updated_at: now}, synchronize_session='evaluate'
+                )
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            return jsonify({'error': 'Failed to create employees'}), 500
+    
+    return bulk_response('employees', created, errors, employees_response_schema)
+
 @employees_bp.route('/<string:employee_id>', methods=['GET'])
 @jwt_required()
 def get_employee(employee_id):
     """Get a specific employee by ID."""
-    employee = Employee.query.filter_by(id=employee_id).first()
+    def load():
+        employee = Employee.query.filter_by(id=employee_id).first()
+        if not employee:
+            return None
+        return make_etag(employee.id, employee.updated_at), employee_response_schema.dump(employee)
     
-    if not employee:
+    def version():
+        updated_at = db.session.query(Employee.updated_at).filter_by(id=employee_id).scalar()
+        return make_etag(employee_id, updated_at) if updated_at is not None else None
+    
+    entity = get_entity(Employee, employee_id, load, version)
+    
+    if not entity:
         return jsonify({'error': 'Employee not found'}), 404
     
-    return jsonify({
-        'employee': employee_response_schema.dump(employee)
-    }), 200
+    etag, employee = entity
+    if employee is None:
+        return not_modified(etag)
+    
+    response = jsonify({
+        'employee': employee
+    })
+    response.set_etag(etag)
+    return response, 200
 
 @employees_bp.route('/<string:employee_id>', methods=['PUT'])
 @jwt_required()
+@serialized_write
 def update_employee(employee_id):
     """Update employee information."""
     employee = Employee.query.filter_by(id=employee_id).first()
@@ -258,6 +330,7 @@ def update_employee(employee_id):
 
 @employees_bp.route('/deactivate/<string:employee_id>', methods=['POST'])
 @jwt_required()
+@serialized_write
 def deactivate_employee(employee_id):
     """Deactivate an employee."""
     employee = Employee.query.filter_by(id=employee_id).first()
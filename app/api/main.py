@@ -1,5 +1,8 @@
 from flask import Blueprint, jsonify
 from datetime import datetime
+from app.utils.cache import entity_cache
+from app.utils.tokens import token_cache
+from app.utils.write_queue import write_queue
 
 main_bp = Blueprint('main', __name__)
 
@@ -42,8 +45,14 @@ def api_info():
 @main_bp.route('/status', methods=['GET'])
 def status():
     """API status endpoint."""
+    cache = entity_cache()
+    tokens = token_cache()
+    writer = write_queue()
     return jsonify({
         'status': 'online',
         'timestamp': datetime.utcnow().isoformat(),
-        'message': 'API is running normally'
+        'message': 'API is running normally',
+        'entity_cache': cache.stats() if cache else None,
+        'token_cache': tokens.stats() if tokens else None,
+        'write_queue': writer.stats() if writer else None
     }), 200 
\ No newline at end of file
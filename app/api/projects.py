@@ -1,87 +1,73 @@
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from marshmallow import ValidationError
-from sqlalchemy import or_
+from sqlalchemy import insert
+from sqlalchemy.orm import selectinload
 from app.schemas.project import (
     ProjectCreateSchema, ProjectUpdateSchema, ProjectResponseSchema, 
     ProjectListSchema
 )
+from app.schemas.compiled import compile_loader, compile_schema
 from app.models.project import Project
 from app.models.employee import Employee
+from app.models.employee_project import EmployeeProject
+from app.utils.bulk import bulk_response, load_bulk
+from app.utils.etag import get_entity, is_fresh, make_etag, not_modified, page_etag
+from app.utils.pagination import paginate
+from app.utils.search import apply_search
+from app.utils.streaming import stream_ndjson, wants_ndjson
+from app.utils.write_queue import serialized_write
 from app import db
 import time
+import uuid
 
 projects_bp = Blueprint('projects', __name__)
 
-# Schema instances
-project_create_schema = ProjectCreateSchema()
-project_update_schema = ProjectUpdateSchema()
-project_response_schema = ProjectResponseSchema()
-projects_response_schema = ProjectResponseSchema(many=True)
+# Schema instances (write and response schemas are compiled once, see app.schemas.compiled)
+project_create_schema = compile_loader(ProjectCreateSchema())
+project_update_schema = compile_loader(ProjectUpdateSchema())
+project_response_schema = compile_schema(ProjectResponseSchema())
+projects_response_schema = compile_schema(ProjectResponseSchema(many=True))
 project_list_schema = ProjectListSchema()
 
 
 def _update_employee_project_relationships(project_id, employees_to_remove, employees_to_add):
     """
-    Update bidirectional employee-project relationships from project side.
+    Touch the employees on the other side of changed employee-project memberships.
+    
+    The membership rows are shared by both sides, so the employees only need
+    their timestamps bumped, which is done with a single UPDATE.
     
     Args:
         project_id: ID of the project
-        employees_to_remove: Set of employee IDs to remove project from
-        employees_to_add: Set of employee IDs to add project to
+        employees_to_remove: Set of employee IDs removed from the project
+        employees_to_add: Set of employee IDs added to the project
         
     Returns:
         Set of all affected employee IDs
     """
-    affected_employees = set()
-    
     if not employees_to_remove and not employees_to_add:
-        return affected_employees
+        return set()
     
     all_employee_ids = employees_to_remove | employees_to_add
-    employees = Employee.query.filter(Employee.id.in_(all_employee_ids)).all()
-    
-    for employee in employees:
-        if employee.id in employees_to_remove:
-            # Remove project from employee
-            if employee.projects and project_id in employee.projects:
-                employee.projects = [pid for pid in employee.projects if pid != project_id]
-                employee.update_timestamp()
-                db.session.add(employee)
-                affected_employees.add(employee.id)
-        elif employee.id in employees_to_add:
-            # Add project to employee
-            if not employee.projects:
-                employee.projects = []
-            if project_id not in employee.projects:
-                employee.projects = employee.projects + [project_id]
-                employee.update_timestamp()
-                db.session.add(employee)
-                affected_employees.add(employee.id)
+    affected_employees = {
+        employee_id for (employee_id,) in
+        db.session.query(Employee.id).filter(Employee.id.in_(all_employee_ids))
+    }
+    if affected_employees:
+        Employee.query.filter(Employee.id.in_(affected_employees)).update(
+            {Employee.updated_at: int(time.time() * 1000)}, synchronize_session='evaluate'
+        )
     
     return affected_employees
 
 
-def _sync_project_tasks(project_id, employee_ids):
-    """
-    Sync all tasks for a specific project with the given employee list.
-    
-    Args:
-        project_id: ID of the project whose tasks need syncing
-        employee_ids: List of employee IDs to sync to all tasks
-    """
-    from app.models.task import Task
-    
-    tasks = Task.query.filter_by(project_id=project_id).all()
-    for task in tasks:
-        task.employees = employee_ids or []
-        task.update_timestamp()
-        db.session.add(task)
-
-
 def _handle_project_employee_updates(project, new_employee_ids, update=True):
     """
-    Handle updates to a project's employee relationships and sync dependent tasks.
+    Handle updates to a project's employee relationships.
+    
+    Task assignees are resolved from the project when read, so changing the
+    roster does not write to the project's tasks.
     
     Args:
         project: Project object to update
@@ -89,15 +75,10 @@ def _handle_project_employee_updates(project, new_employee_ids, update=True):
         
     Returns:
         Set of employee IDs that were affected by the changes
+        
+    Raises:
+        ValueError: If any of the employee IDs to add does not exist
     """
-    # Validate employee IDs exist
-    if new_employee_ids:
-        existing_employees = Employee.query.filter(Employee.id.in_(new_employee_ids)).all()
-        existing_ids = [emp.id for emp in existing_employees]
-        invalid_ids = [emp_id for emp_id in new_employee_ids if emp_id not in existing_ids]
-        if invalid_ids:
-            raise ValueError(f'Invalid employee IDs: {invalid_ids}')
-    
     # when creating a project, we need to ensure that all the employees' projects fields are
     # updated, hence 
     old_employee_ids = set((update and project.employees) or [])
@@ -105,25 +86,48 @@ def _handle_project_employee_updates(project, new_employee_ids, update=True):
     
     employees_to_remove = old_employee_ids - new_employee_ids_set
     employees_to_add = new_employee_ids_set - old_employee_ids
-
-    print(f"Employees to remove: {employees_to_remove}")
-    print(f"Employees to add: {employees_to_add}")
-    print(f"new employee ids: {new_employee_ids}")
-    print(f"old employee ids: {project}")
     
-    # Update bidirectional relationships
+    # Update project's employee memberships (shared with the employees), rejecting unknown IDs
+    project.employees = new_employee_ids
+    db.session.flush()
+    
+    # Update the other side of the relationship
     affected_employees = _update_employee_project_relationships(
         project.id, employees_to_remove, employees_to_add
     )
-    # Update project's employee list
-    project.employees = new_employee_ids
-    
-    # Sync tasks for this project
-    _sync_project_tasks(project.id, new_employee_ids)
     
     return affected_employees
 
 
+def _build_project_list_query(query_data):
+    """
+    Build the filtered project list query for validated list parameters.
+    
+    Args:
+        query_data: Loaded ProjectListSchema fields
+        
+    Returns:
+        Tuple of (query, search rank column or None), not yet ordered or paginated
+    """
+    # Build query (memberships for the whole page are loaded in one extra query)
+    query = Project.query.options(selectinload(Project.employee_links))
+    
+    # Filter by active status
+    if query_data.get('active_only'):
+        query = query.filter(Project.archived == False)
+    
+    # Filter by billable status
+    if query_data.get('billable_only'):
+        query = query.filter(Project.billable == True)
+    
+    # Search functionality (ranked full-text search where available)
+    rank = None
+    if query_data.get('search'):
+        query, rank = apply_search(query, Project, query_data['search'])
+    
+    return query, rank
+
+
 @projects_bp.route('/', methods=['GET'])
 @jwt_required()
 def get_projects():
@@ -134,39 +138,30 @@ def get_projects():
     except ValidationError as err:
         return jsonify({'error': 'Invalid query parameters', 'messages': err.messages}), 400
     
-    # Build query
-    query = Project.query
-    
-    # Filter by active status
-    if query_data.get('active_only'):
-        query = query.filter(Project.archived.is_(None))
-    
-    # Filter by billable status
-    if query_data.get('billable_only'):
-        query = query.filter(Project.billable == True)
+    query, rank = _build_project_list_query(query_data)
     
-    # Search functionality
-    if query_data.get('search'):
-        search_term = f"%{query_data['search']}%"
-        query = query.filter(
-            or_(
-                Project.name.ilike(search_term),
-                Project.description.ilike(search_term)
-            )
-        )
+    # Sync jobs can pull the full result set as a stream instead
+    if wants_ndjson(query_data):
+        return stream_ndjson(query, Project, project_response_schema, rank)
     
-    # Order by creation date (newest first)
-    query = query.order_by(Project.created_at.desc())
+    # Newest first, one page at a time
+    projects, pagination = paginate(query, Project, query_data, rank)
     
-    # Get all projects (no pagination)
-    projects = query.all()
+    # Polling clients whose copy of the page is current get a 304 before it is serialized
+    etag = page_etag(projects, pagination, lambda project: (project.id, project.updated_at, project.employees))
+    if is_fresh(etag):
+        return not_modified(etag)
     
-    return jsonify({
-        'projects': projects_response_schema.dump(projects)
-    }), 200
+    response = jsonify({
+        'projects': projects_response_schema.dump(projects),
+        'pagination': pagination
+    })
+    response.set_etag(etag)
+    return response, 200
 
 @projects_bp.route('/', methods=['POST'])
 @jwt_required()
+@serialized_write
 def create_project():
     """Create a new project."""
     try:
@@ -178,18 +173,16 @@ def create_project():
     if Project.query.filter_by(name=data['name']).first():
         return jsonify({'error': 'Project name already exists'}), 409
     
-    # Create new project
+    # Create new project (employees are linked once it has been flushed)
     project = Project(
         name=data['name'],
         description=data.get('description'),
-        employees=data.get('employees', []),
         billable=data.get('billable', False),
         deadline=data.get('deadline')
     )
 
     employee_ids = data.get('employees', [])
 
-    print(f"Employee IDs: {employee_ids}")
     try:
         # First add the project and flush to get an ID
         db.session.add(project)   
@@ -206,25 +199,116 @@ def create_project():
             'project': project_response_schema.dump(project)
         }), 201
         
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         db.session.rollback()
         return jsonify({'error': 'Failed to create project'}), 500
 
+@projects_bp.route('/bulk', methods=['POST'])
+@jwt_required()
+@serialized_write
+def bulk_create_projects():
+    """Create many projects in one transaction, reporting errors per item."""
+    try:
+        items, errors = load_bulk(project_create_schema, request.get_json())
+    except ValidationError as err:
+        return jsonify({'error': 'Validation failed', 'messages': err.messages}), 400
+    
+    # Check names and employee IDs against the database with one query each
+    names = {data['name'] for _, data in items}
+    taken = {
+        name for (name,) in
+        db.session.query(Project.name).filter(Project.name.in_(names))
+    } if names else set()
+    requested_employees = {emp_id for _, data in items for emp_id in data.get('employees') or []}
+    existing_employees = {
+        emp_id for (emp_id,) in
+        db.session.query(Employee.id).filter(Employee.id.in_(requested_employees))
+    } if requested_employees else set()
+    
+    now = int(time.time() * 1000)
+    project_rows = []
+    link_rows = []
+    created = []
+    for index, data in items:
+        employee_ids = data.get('employees') or []
+        if data['name'] in taken:
+            errors[index] = {'name': ['Project name already exists']}
+            continue
+        invalid_ids = [emp_id for emp_id in employee_ids if emp_id not in existing_employees]
+        if invalid_ids:
+            errors[index] = {'employees': [f'Invalid employee IDs: {invalid_ids}']}
+            continue
+        taken.add(data['name'])
+        
+        row = {
+            'id': str(uuid.uuid4()),
+            'name': data['name'],
+            'description': data.get('description'),
+            'archived': data.get('archived', False),
+            'billable': data.get('billable', False),
+            'deadline': data.get('deadline'),
+            'created_at': now,
+            'updated_at': now
+        }
+        project_rows.append(row)
+        link_rows.extend(
+            {'employee_id': emp_id, 'project_id': row['id'], 'created_at': now}
+            for emp_id in employee_ids
+        )
+        created.append({**row, 'employees': employee_ids})
+    
+    if created:
+        try:
+            db.session.execute(insert(Project), project_rows)
+            if link_rows:
+                db.session.execute(insert(EmployeeProject), link_rows)
+                # The new members are touched with a single UPDATE
+                member_ids = {link['employee_id'] for link in link_rows}
+                Employee.query.filter(Employee.id.in_(member_ids)).update(
+                    {Employee.updated_at: now}, synchronize_session='evaluate'
+                )
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            return jsonify({'error': 'Failed to create projects'}), 500
+    
+    return bulk_response('projects', created, errors, projects_response_schema)
+
 @projects_bp.route('/<string:project_id>', methods=['GET'])
 @jwt_required()
 def get_project(project_id):
     """Get a specific project by ID."""
-    project = Project.query.filter_by(id=project_id).first()
+    def load():
+        project = Project.query.filter_by(id=project_id).first()
+        if not project:
+            return None
+        return make_etag(project.id, project.updated_at), project_response_schema.dump(project)
     
-    if not project:
+    def version():
+        updated_at = db.session.query(Project.updated_at).filter_by(id=project_id).scalar()
+        return make_etag(project_id, updated_at) if updated_at is not None else None
+    
+    entity = get_entity(Project, project_id, load, version)
+    
+    if not entity:
         return jsonify({'error': 'Project not found'}), 404
     
-    return jsonify({
-        'project': project_response_schema.dump(project)
-    }), 200
+    etag, project = entity
+    if project is None:
+        return not_modified(etag)
+    
+    response = jsonify({
+        'project': project
+    })
+    response.set_etag(etag)
+    return response, 200
 
 @projects_bp.route('/<string:project_id>', methods=['PUT'])
 @jwt_required()
+@serialized_write
 def update_project(project_id):
     """Update project information."""
     project = Project.query.filter_by(id=project_id).first()
@@ -255,7 +339,7 @@ def update_project(project_id):
     if 'deadline' in data:
         project.deadline = data['deadline']
     
-    # Handle employee relationships with bidirectional sync and task updates
+    # Handle employee relationships with bidirectional sync
     if 'employees' in data:
         try:
             _handle_project_employee_updates(project, data['employees'])
@@ -278,6 +362,7 @@ def update_project(project_id):
 
 @projects_bp.route('/<string:project_id>', methods=['DELETE'])
 @jwt_required()
+@serialized_write
 def delete_project(project_id):
     """Delete a project."""
     project = Project.query.filter_by(id=project_id).first()
@@ -286,11 +371,12 @@ def delete_project(project_id):
         return jsonify({'error': 'Project not found'}), 404
     
     try:
-        # Remove project from all associated employees
-        for employee_id in project.employees or []:
-            employee = Employee.query.filter_by(id=employee_id).first()
-            if employee:
-                employee.remove_project(project.id)
+        # Remove project from all associated employees in two set-based statements
+        member_ids = db.session.query(EmployeeProject.employee_id).filter_by(project_id=project.id)
+        Employee.query.filter(Employee.id.in_(member_ids.scalar_subquery())).update(
+            {Employee.updated_at: int(time.time() * 1000)}, synchronize_session='fetch'
+        )
+        EmployeeProject.query.filter_by(project_id=project.id).delete(synchronize_session='fetch')
         
         db.session.delete(project)
         db.session.commit()
@@ -301,6 +387,7 @@ def delete_project(project_id):
 
 @projects_bp.route('/<string:project_id>/employees', methods=['POST'])
 @jwt_required()
+@serialized_write
 def add_employee_to_project(project_id):
     """Add an employee to a project."""
     project = Project.query.filter_by(id=project_id).first()
@@ -316,8 +403,6 @@ def add_employee_to_project(project_id):
         return jsonify({'error': 'Invalid JSON'}), 400
     
     employee_id = data['employee_id']
-
-    print(f"Employee ID: {employee_id}")
     
     # Check if employee exists
     employee = Employee.query.filter_by(id=employee_id).first()
@@ -342,6 +427,7 @@ def add_employee_to_project(project_id):
 
 @projects_bp.route('/<string:project_id>/employees/<string:employee_id>', methods=['DELETE'])
 @jwt_required()
+@serialized_write
 def remove_employee_from_project(project_id, employee_id):
     """Remove an employee from a project."""
     project = Project.query.filter_by(id=project_id).first()
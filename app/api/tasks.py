@@ -1,38 +1,53 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, current_app, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from marshmallow import ValidationError
-from sqlalchemy import or_, and_
+from sqlalchemy import and_, insert
+from sqlalchemy.orm import selectinload
 from app.schemas.task import (
     TaskCreateSchema, TaskUpdateSchema, TaskResponseSchema,
-    TaskListSchema
+    TaskListSchema, TaskBulkUpdateSchema, TaskBulkDeleteSchema
 )
+from app.schemas.compiled import compile_loader, compile_schema
 from app.models.task import Task
 from app.models.project import Project
 from app.models.employee import Employee
+from app.models.employee_project import EmployeeProject
+from app.utils.bulk import bulk_response, load_bulk
+from app.utils.cache import cache_key
+from app.utils.etag import get_entity, is_fresh, make_etag, not_modified, page_etag
+from app.utils.pagination import paginate
+from app.utils.search import apply_search
+from app.utils.streaming import stream_ndjson, wants_ndjson
+from app.utils.write_queue import serialized_write
 from app import db
 import time
+import uuid
 
 tasks_bp = Blueprint('tasks', __name__)
 
-# Schema instances
-task_create_schema = TaskCreateSchema()
-task_update_schema = TaskUpdateSchema()
-task_response_schema = TaskResponseSchema()
-tasks_response_schema = TaskResponseSchema(many=True)
+# Schema instances (write and response schemas are compiled once, see app.schemas.compiled)
+task_create_schema = compile_loader(TaskCreateSchema())
+task_update_schema = compile_loader(TaskUpdateSchema())
+task_response_schema = compile_schema(TaskResponseSchema())
+tasks_response_schema = compile_schema(TaskResponseSchema(many=True))
 task_list_schema = TaskListSchema()
+task_bulk_update_schema = TaskBulkUpdateSchema()
+task_bulk_delete_schema = TaskBulkDeleteSchema()
 
-@tasks_bp.route('/', methods=['GET'])
-@jwt_required()
-def get_tasks():
-    """Get all tasks with optional filtering."""
-    try:
-        # Validate query parameters
-        query_data = task_list_schema.load(request.args)
-    except ValidationError as err:
-        return jsonify({'error': 'Invalid query parameters', 'messages': err.messages}), 400
+def _build_task_list_query(query_data):
+    """
+    Build the filtered task list query for validated list parameters.
     
-    # Build query
-    query = Task.query
+    Args:
+        query_data: Loaded TaskListSchema fields
+        
+    Returns:
+        Tuple of (query, search rank column or None), not yet ordered or paginated
+    """
+    # Build query (assignees for the whole page are resolved in two extra queries)
+    query = Task.query.options(
+        selectinload(Task.project).selectinload(Project.employee_links)
+    )
     
     # Filter by project
     if query_data.get('project_id'):
@@ -52,33 +67,74 @@ def get_tasks():
     
     # Filter by employee assignment
     if query_data.get('employee_id'):
-        # Tasks that have this employee in their employees list
-        query = query.filter(Task.employees.contains([query_data['employee_id']]))
+        # Tasks whose project has this employee as a member
+        member_projects = db.session.query(EmployeeProject.project_id).filter(
+            EmployeeProject.employee_id == query_data['employee_id']
+        )
+        query = query.filter(Task.project_id.in_(member_projects.scalar_subquery()))
     
-    # Search functionality
+    # Search functionality (ranked full-text search where available)
+    rank = None
     if query_data.get('search'):
-        search_term = f"%{query_data['search']}%"
-        query = query.filter(
-            or_(
-                Task.name.ilike(search_term),
-                Task.description.ilike(search_term),
-                Task.labels.ilike(search_term)
-            )
-        )
+        query, rank = apply_search(query, Task, query_data['search'])
+    
+    return query, rank
+
+
+def _select_bulk_tasks(data):
+    """
+    Build the condition selecting the tasks of a bulk update or delete.
+    
+    Args:
+        data: Loaded TaskBulkDeleteSchema fields, with either ``ids`` or ``filter``
+        
+    Returns:
+        SQL condition on Task, usable in a single UPDATE or DELETE
+    """
+    if 'ids' in data:
+        return Task.id.in_(data['ids'])
+    
+    # Same filters as the list endpoint, applied through a subquery of matching IDs
+    query, _ = _build_task_list_query(data['filter'])
+    return Task.id.in_(query.with_entities(Task.id).scalar_subquery())
+
+
+@tasks_bp.route('/', methods=['GET'])
+@jwt_required()
+def get_tasks():
+    """Get all tasks with optional filtering."""
+    try:
+        # Validate query parameters
+        query_data = task_list_schema.load(request.args)
+    except ValidationError as err:
+        return jsonify({'error': 'Invalid query parameters', 'messages': err.messages}), 400
     
-    # Order by creation date (newest first)
-    query = query.order_by(Task.created_at.desc())
+    query, rank = _build_task_list_query(query_data)
     
-    # Get all tasks (no pagination)
-    tasks = query.all()
+    # Sync jobs can pull the full result set as a stream instead
+    if wants_ndjson(query_data):
+        return stream_ndjson(query, Task, task_response_schema, rank)
     
-    return jsonify({
-        'tasks': tasks_response_schema.dump(tasks)
-    }), 200
+    # Newest first, one page at a time
+    tasks, pagination = paginate(query, Task, query_data, rank)
+    
+    # Polling clients whose copy of the page is current get a 304 before it is serialized.
+    # Assignees come from the project's memberships, so they are part of each version.
+    etag = page_etag(tasks, pagination, lambda task: (task.id, task.updated_at, task.employees))
+    if is_fresh(etag):
+        return not_modified(etag)
+    
+    response = jsonify({
+        'tasks': tasks_response_schema.dump(tasks),
+        'pagination': pagination
+    })
+    response.set_etag(etag)
+    return response, 200
 
 
 @tasks_bp.route('/', methods=['POST'])
 @jwt_required()
+@serialized_write
 def create_task():
     """Create a new task."""
     try:
@@ -91,7 +147,7 @@ def create_task():
     if not project:
         return jsonify({'error': 'Project not found'}), 404
     
-    # Create new task with project's employees
+    # Create new task (its employees are the project's employees)
     task = Task(
         name=data['name'],
         project_id=data['project_id'],
@@ -100,8 +156,7 @@ def create_task():
         priority=data.get('priority', 'medium'),
         labels=data.get('labels'),
         billable=data.get('billable', False),
-        deadline=data.get('deadline'),
-        employees=project.employees or []  # Sync with project employees
+        deadline=data.get('deadline')
     )
     
     try:
@@ -117,22 +172,163 @@ def create_task():
         return jsonify({'error': 'Failed to create task'}), 500
 
 
+@tasks_bp.route('/bulk', methods=['POST'])
+@jwt_required()
+@serialized_write
+def bulk_create_tasks():
+    """Create many tasks in one transaction, reporting errors per item."""
+    try:
+        items, errors = load_bulk(task_create_schema, request.get_json())
+    except ValidationError as err:
+        return jsonify({'error': 'Validation failed', 'messages': err.messages}), 400
+    
+    # Check that the projects exist and collect their employees, one query each
+    project_ids = {data['project_id'] for _, data in items}
+    existing_projects = {
+        project_id for (project_id,) in
+        db.session.query(Project.id).filter(Project.id.in_(project_ids))
+    } if project_ids else set()
+    project_employees = {}
+    if existing_projects:
+        links = db.session.query(EmployeeProject.project_id, EmployeeProject.employee_id).filter(
+            EmployeeProject.project_id.in_(existing_projects)
+        ).order_by(EmployeeProject.id)
+        for project_id, employee_id in links:
+            project_employees.setdefault(project_id, []).append(employee_id)
+    
+    now = int(time.time() * 1000)
+    task_rows = []
+    created = []
+    for index, data in items:
+        if data['project_id'] not in existing_projects:
+            errors[index] = {'project_id': ['Project not found']}
+            continue
+        
+        row = {
+            'id': str(uuid.uuid4()),
+            'name': data['name'],
+            'project_id': data['project_id'],
+            'description': data.get('description'),
+            'status': data.get('status', 'pending'),
+            'priority': data.get('priority', 'medium'),
+            'labels': data.get('labels'),
+            'billable': data.get('billable', False),
+            'deadline': data.get('deadline'),
+            'created_at': now,
+            'updated_at': now
+        }
+        task_rows.append(row)
+        created.append({**row, 'employees': project_employees.get(data['project_id'], [])})
+    
+    if created:
+        try:
+            db.session.execute(insert(Task), task_rows)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            return jsonify({'error': 'Failed to create tasks'}), 500
+    
+    return bulk_response('tasks', created, errors, tasks_response_schema)
+
+
+@tasks_bp.route('/bulk', methods=['PATCH'])
+@jwt_required()
+@serialized_write
+def bulk_update_tasks():
+    """Apply one update to every selected task with a single UPDATE."""
+    try:
+        data = task_bulk_update_schema.load(request.get_json())
+    except ValidationError as err:
+        return jsonify({'error': 'Validation failed', 'messages': err.messages}), 400
+    
+    max_items = current_app.config['BULK_MAX_ITEMS']
+    if len(data.get('ids', [])) > max_items:
+        return jsonify({'error': f'At most {max_items} ids can be updated per request'}), 400
+    
+    values = {getattr(Task, field): value for field, value in data['changes'].items()}
+    values[Task.updated_at] = int(time.time() * 1000)
+    
+    try:
+        # Nothing is loaded in this session, so there is nothing to synchronize
+        updated = Task.query.filter(_select_bulk_tasks(data)).update(values, synchronize_session=False)
+        db.session.commit()
+        return jsonify({
+            'message': f'Updated {updated} tasks',
+            'updated': updated
+        }), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': 'Failed to update tasks'}), 500
+
+
+@tasks_bp.route('/bulk', methods=['DELETE'])
+@jwt_required()
+@serialized_write
+def bulk_delete_tasks():
+    """Delete every selected task with a single DELETE."""
+    try:
+        data = task_bulk_delete_schema.load(request.get_json())
+    except ValidationError as err:
+        return jsonify({'error': 'Validation failed', 'messages': err.messages}), 400
+    
+    max_items = current_app.config['BULK_MAX_ITEMS']
+    if len(data.get('ids', [])) > max_items:
+        return jsonify({'error': f'At most {max_items} ids can be deleted per request'}), 400
+    
+    try:
+        deleted = Task.query.filter(_select_bulk_tasks(data)).delete(synchronize_session=False)
+        db.session.commit()
+        return jsonify({
+            'message': f'Deleted {deleted} tasks',
+            'deleted': deleted
+        }), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': 'Failed to delete tasks'}), 500
+
+
 @tasks_bp.route('/<string:task_id>', methods=['GET'])
 @jwt_required()
 def get_task(task_id):
     """Get a specific task by ID."""
-    task = Task.query.filter_by(id=task_id).first()
+    # The task's employees come from its project, so the project's version is part of its ETag
+    def load():
+        task = Task.query.filter_by(id=task_id).first()
+        if not task:
+            return None
+        project_updated_at = task.project.updated_at if task.project else None
+        etag = make_etag(task.id, task.updated_at, project_updated_at)
+        return etag, task_response_schema.dump(task)
     
-    if not task:
+    def version():
+        row = db.session.query(Task.updated_at, Project.updated_at).outerjoin(
+            Project, Task.project_id == Project.id
+        ).filter(Task.id == task_id).first()
+        return make_etag(task_id, *row) if row else None
+    
+    # ... and a cached task is dropped along with its project
+    entity = get_entity(
+        Task, task_id, load, version,
+        depends_on=lambda data: [cache_key(Project, data['project_id'])]
+    )
+    
+    if not entity:
         return jsonify({'error': 'Task not found'}), 404
     
-    return jsonify({
-        'task': task_response_schema.dump(task)
-    }), 200
+    etag, task = entity
+    if task is None:
+        return not_modified(etag)
+    
+    response = jsonify({
+        'task': task
+    })
+    response.set_etag(etag)
+    return response, 200
 
 
 @tasks_bp.route('/<string:task_id>', methods=['PUT'])
 @jwt_required()
+@serialized_write
 def update_task(task_id):
     """Update an existing task."""
     task = Task.query.filter_by(id=task_id).first()
@@ -161,9 +357,6 @@ def update_task(task_id):
     if 'deadline' in data:
         task.deadline = data['deadline']
     
-    # Always sync employees with project when updating
-    task.sync_employees_with_project()
-    
     # Update timestamp
     task.update_timestamp()
     
@@ -180,6 +373,7 @@ def update_task(task_id):
 
 @tasks_bp.route('/<string:task_id>', methods=['DELETE'])
 @jwt_required()
+@serialized_write
 def delete_task(task_id):
     """Delete a task."""
     task = Task.query.filter_by(id=task_id).first()
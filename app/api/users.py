@@ -1,8 +1,9 @@
 from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required
 from marshmallow import ValidationError
 from app.schemas.user import UserSchema, UserUpdateSchema
 from app.models.user import User
+from app.utils.auth import current_user, current_user_id
 from app import db
 
 users_bp = Blueprint('users', __name__)
@@ -22,26 +23,26 @@ def get_users():
 @jwt_required()
 def get_user(user_id):
     """Get a specific user by ID."""
-    current_user_id = int(get_jwt_identity())
-    
     # Users can only view their own profile (simplified)
-    if current_user_id != user_id:
+    if current_user_id() != user_id:
         return jsonify({'error': 'Access denied'}), 403
     
-    user = User.query.get_or_404(user_id)
+    user = current_user()
+    if not user:
+        return jsonify({'error': 'User not found'}), 404
     return jsonify({'user': user_schema.dump(user)}), 200
 
 @users_bp.route('/<int:user_id>', methods=['PUT'])
 @jwt_required()
 def update_user(user_id):
     """Update user information."""
-    current_user_id = int(get_jwt_identity())
-    
     # Users can only update their own profile
-    if current_user_id != user_id:
+    if current_user_id() != user_id:
         return jsonify({'error': 'Access denied'}), 403
     
-    user = User.query.get_or_404(user_id)
+    user = current_user()
+    if not user:
+        return jsonify({'error': 'User not found'}), 404
     
     try:
         data = user_update_schema.load(request.get_json())
@@ -72,13 +73,13 @@ def update_user(user_id):
 @jwt_required()
 def delete_user(user_id):
     """Delete user account."""
-    current_user_id = int(get_jwt_identity())
-    
     # Users can only delete their own account
-    if current_user_id != user_id:
+    if current_user_id() != user_id:
         return jsonify({'error': 'Access denied'}), 403
     
-    user = User.query.get_or_404(user_id)
+    user = current_user()
+    if not user:
+        return jsonify({'error': 'User not found'}), 404
     
     try:
         db.session.delete(user)
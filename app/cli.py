@@ -0,0 +1,121 @@
+import time
+import click
+from flask.cli import AppGroup, with_appcontext
+from app import db
+
+search_cli = AppGroup('search', help='Manage the full-text search indexes.')
+replica_cli = AppGroup('replica', help='Manage the local read replica.')
+profile_cli = AppGroup('profile', help='Profile individual requests.')
+
+
+@click.command('seed')
+@click.option('--employees', type=int, default=10000, show_default=True)
+@click.option('--projects', type=int, default=1000, show_default=True)
+@click.option('--tasks', type=int, default=100000, show_default=True)
+@click.option('--seed', 'seed', type=int, default=0, show_default=True, help='Same seed and sizes, same data.')
+@click.option('--workers', type=int, default=None, help='Generating processes  [default: CPU count]')
+@click.option('--batch-size', type=int, default=20000, show_default=True, help='Rows per insert batch.')
+@click.option('--reset', is_flag=True, help='Delete existing employees, projects and tasks first.')
+@with_appcontext
+def seed_command(employees, projects, tasks, seed, workers, batch_size, reset):
+    """Fill the database with generated employees, projects, memberships and tasks."""
+    from sqlalchemy import func, select
+    from app.utils.seed import GENERATORS, Sizes, seed_database
+    
+    db.create_all(bind_key=None)
+    tables = [db.metadata.tables[name] for name in GENERATORS]
+    with db.engine.begin() as connection:
+        if reset:
+            # Children first, for the foreign keys
+            for table in reversed(tables):
+                connection.execute(table.delete())
+        elif any(connection.scalar(select(func.count()).select_from(table)) for table in tables):
+            raise click.ClickException('The database already has data, run with --reset to replace it.')
+    
+    def progress(name, rows, seconds):
+        if rows is None:
+            click.echo(f'{name:<18} {"":>9} {seconds:>7.1f}s  (search index)')
+        else:
+            click.echo(f'{name:<18} {rows:>9} {seconds:>7.1f}s {rows / max(seconds, 1e-9):>10,.0f} rows/s')
+    
+    started = time.perf_counter()
+    results = seed_database(db.engine, Sizes(employees, projects, tasks, seed), workers=workers,
+                            batch_size=batch_size, progress=progress)
+    elapsed = time.perf_counter() - started
+    total = sum(rows for rows, _ in results.values() if rows is not None)
+    click.echo(f'Seeded {total} rows in {elapsed:.1f}s ({total / max(elapsed, 1e-9):,.0f} rows/s)')
+
+
+@search_cli.command('rebuild')
+def rebuild_search_index():
+    """Create the FTS5 search tables if needed and re-index all rows."""
+    from app.models.fulltext import SEARCH_COLUMNS, fts_table_name, rebuild_fts
+    
+    with db.engine.begin() as connection:
+        for model in SEARCH_COLUMNS:
+            if not rebuild_fts(connection, model):
+                click.echo('Full-text search needs SQLite with FTS5, searches will use ILIKE.')
+                return
+            click.echo(f'Rebuilt {fts_table_name(model)}')
+
+
+@search_cli.command('check')
+def check_search_index():
+    """Check the FTS5 search tables still match their tables (fails if not)."""
+    from sqlalchemy import inspect
+    from app.models.fulltext import SEARCH_COLUMNS, fts_in_sync, fts_table_name
+    
+    stale = []
+    with db.engine.connect() as connection:
+        for model in SEARCH_COLUMNS:
+            fts = fts_table_name(model)
+            if not inspect(connection).has_table(fts):
+                continue
+            if fts_in_sync(connection, model):
+                click.echo(f'{fts} is in sync')
+            else:
+                click.echo(f'{fts} is out of sync')
+                stale.append(fts)
+    if stale:
+        raise click.ClickException('Run `flask search rebuild` to re-index.')
+
+
+@replica_cli.command('sync')
+@click.option('--interval', type=float, default=None, help='Keep syncing every INTERVAL seconds.')
+def sync_replica(interval):
+    """Copy the primary SQLite database onto the replica bind (stands in for replication)."""
+    from app.utils.replica import REPLICA_BIND, sync_sqlite
+    
+    replica = db.engines.get(REPLICA_BIND)
+    if replica is None:
+        raise click.ClickException('No replica bind configured, set READ_REPLICA_URL.')
+    if db.engine.dialect.name != 'sqlite' or replica.dialect.name != 'sqlite':
+        raise click.ClickException('Syncing is only supported between SQLite files.')
+    
+    while True:
+        sync_sqlite(db.engine.url.database, replica.url.database)
+        click.echo(f'Synced {db.engine.url.database} to {replica.url.database}')
+        if interval is None:
+            return
+        time.sleep(interval)
+
+
+@profile_cli.command('token')
+def profile_token():
+    """Print a signed token; requests sending it in the X-Profile header are profiled."""
+    from flask import current_app
+    from app.utils.profiler import make_profile_token
+    
+    if not current_app.config['PROFILE_ENABLED']:
+        click.echo('Profiling is disabled, set PROFILE_ENABLED=true on the server.', err=True)
+    max_age = current_app.config['PROFILE_TOKEN_MAX_AGE']
+    click.echo(make_profile_token(current_app._get_current_object()))
+    click.echo(f'Valid for {max_age} seconds', err=True)
+
+
+def register_commands(app):
+    """Register the application's CLI commands."""
+    app.cli.add_command(search_cli)
+    app.cli.add_command(replica_cli)
+    app.cli.add_command(profile_cli)
+    app.cli.add_command(seed_command)
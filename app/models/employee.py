@@ -1,39 +1,39 @@
-from datetime import datetime
 import time
 import uuid
-import json
 from app import db
-from sqlalchemy import Text, TypeDecorator
-
-class JSONField(TypeDecorator):
-    """Custom JSON field that works with SQLite."""
-    impl = Text
-    cache_ok = True
-
-    def process_bind_param(self, value, dialect):
-        if value is not None:
-            return json.dumps(value)
-        return value
-
-    def process_result_value(self, value, dialect):
-        if value is not None:
-            return json.loads(value)
-        return value
+from app.models.employee_project import EmployeeProject
 
 class Employee(db.Model):
     """Employee model for storing employee information."""
     
     __tablename__ = 'employees'
+    __table_args__ = (
+        # List endpoint: newest first, optionally only active employees
+        db.Index('ix_employees_created_at', 'created_at', 'id'),
+        db.Index(
+            'ix_employees_active_created_at', 'created_at', 'id',
+            sqlite_where=db.text('deactivated IS NULL'),
+            postgresql_where=db.text('deactivated IS NULL')
+        ),
+    )
     
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     name = db.Column(db.String(100), nullable=False)
     email = db.Column(db.String(255), unique=True, nullable=False, index=True)
-    projects = db.Column(JSONField, nullable=False, default=lambda: [])  # Array of project IDs
     deactivated = db.Column(db.BigInteger, nullable=True)  # Timestamp in milliseconds
     invited = db.Column(db.BigInteger, nullable=True)  # Timestamp in milliseconds
     created_at = db.Column(db.BigInteger, nullable=False, default=lambda: int(time.time() * 1000))
     updated_at = db.Column(db.BigInteger, nullable=False, default=lambda: int(time.time() * 1000))
     
+    # Project memberships, stored as rows in employee_project
+    project_links = db.relationship(
+        'EmployeeProject',
+        back_populates='employee',
+        order_by='EmployeeProject.id',
+        cascade='all, delete-orphan',
+        lazy='selectin'
+    )
+    
     def __repr__(self):
         return f'<Employee {self.name} ({self.email})>'
     
@@ -51,34 +51,46 @@ class Employee(db.Model):
         self.deactivated = None
         self.update_timestamp()
     
+    @property
+    def projects(self):
+        """Project IDs the employee is a member of, in the order they were added."""
+        return [link.project_id for link in self.project_links]
+    
+    @projects.setter
+    def projects(self, project_ids):
+        """Replace the employee's projects, inserting and deleting only the changed memberships."""
+        wanted = list(dict.fromkeys(project_ids or []))  # Remove duplicates, keep order
+        keep = set(wanted)
+        for link in [link for link in self.project_links if link.project_id not in keep]:
+            self.project_links.remove(link)  # delete-orphan removes the row
+        
+        current = {link.project_id for link in self.project_links}
+        for project_id in wanted:
+            if project_id not in current:
+                self.project_links.append(EmployeeProject(project_id=project_id))
+    
     def add_project(self, project_id):
         """Add a project ID to the employee's projects list."""
-        if self.projects is None:
-            self.projects = []
         if project_id not in self.projects:
-            self.projects = self.projects + [project_id]  # Create new list for SQLAlchemy to detect change
+            self.projects = self.projects + [project_id]
             self.update_timestamp()
             
-            # Update the project's employees list (bidirectional relationship)
+            # The membership row is shared with the project, only its timestamp needs updating
             from app.models.project import Project
-            project = Project.query.filter_by(id=project_id).first()
-            if project and (not project.employees or self.id not in project.employees):
-                if project.employees is None:
-                    project.employees = []
-                project.employees = project.employees + [self.id]
+            project = db.session.get(Project, project_id)
+            if project:
                 project.update_timestamp()
     
     def remove_project(self, project_id):
         """Remove a project ID from the employee's projects list."""
-        if self.projects and project_id in self.projects:
+        if project_id in self.projects:
             self.projects = [pid for pid in self.projects if pid != project_id]
             self.update_timestamp()
             
-            # Update the project's employees list (bidirectional relationship)
+            # The membership row is shared with the project, only its timestamp needs updating
             from app.models.project import Project
-            project = Project.query.filter_by(id=project_id).first()
-            if project and project.employees and self.id in project.employees:
-                project.employees = [emp_id for emp_id in project.employees if emp_id != self.id]
+            project = db.session.get(Project, project_id)
+            if project:
                 project.update_timestamp()
     
     def to_dict(self):
@@ -87,7 +99,7 @@ class Employee(db.Model):
             'id': self.id,
             'name': self.name,
             'email': self.email,
-            'projects': self.projects or [],
+            'projects': self.projects,
             'deactivated': self.deactivated,
             'invited': self.invited,
             'created_at': self.created_at,
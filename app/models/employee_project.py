@@ -0,0 +1,55 @@
+import time
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.util import identity_key
+from app import db
+
+
+class EmployeeProject(db.Model):
+    """Association between an employee and a project they are a member of."""
+
+    __tablename__ = 'employee_project'
+    __table_args__ = (
+        # Covers "which projects is X on" and membership checks for one employee
+        db.UniqueConstraint('employee_id', 'project_id', name='uq_employee_project_employee_project'),
+        # Covers "who is on project Y"
+        db.Index('ix_employee_project_project_employee', 'project_id', 'employee_id'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)  # Preserves insertion order
+    employee_id = db.Column(db.String(36), db.ForeignKey('employees.id', ondelete='CASCADE'), nullable=False)
+    # No foreign key: employees may reference project IDs before the project exists,
+    # exactly as the previous JSON array allowed
+    project_id = db.Column(db.String(36), nullable=False)
+    created_at = db.Column(db.BigInteger, default=lambda: int(time.time() * 1000), nullable=False)
+
+    employee = db.relationship('Employee', back_populates='project_links')
+
+    def __repr__(self):
+        return f'<EmployeeProject {self.employee_id} -> {self.project_id}>'
+
+
+@event.listens_for(Session, 'after_flush')
+def _collect_changed_memberships(session, flush_context):
+    """Remember which projects gained or lost members during this flush."""
+    project_ids = {
+        obj.project_id for obj in list(session.new) + list(session.deleted)
+        if isinstance(obj, EmployeeProject)
+    }
+    if project_ids:
+        session.info.setdefault('changed_project_memberships', set()).update(project_ids)
+
+
+@event.listens_for(Session, 'after_flush_postexec')
+def _expire_project_employee_links(session, flush_context):
+    """Expire Project.employee_links for projects whose memberships changed.
+    
+    The project side of the association is read-only, so loaded collections
+    would otherwise keep showing the membership from before the flush.
+    """
+    from app.models.project import Project
+    
+    for project_id in session.info.pop('changed_project_memberships', ()):
+        project = session.identity_map.get(identity_key(Project, project_id))
+        if project is not None:
+            session.expire(project, ['employee_links'])
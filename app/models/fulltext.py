@@ -0,0 +1,147 @@
+"""SQLite FTS5 indexes backing search on the list endpoints.
+
+Each searchable table gets an external-content FTS5 table named
+``<table>_fts`` that indexes the searched columns by rowid. Triggers keep it
+in sync with inserts, updates and deletes, so ORM writes, bulk statements and
+raw SQL are all covered. On other dialects, or when SQLite was built without
+FTS5, nothing is created and search falls back to ILIKE.
+
+FTS5 keys rows on an integer, and the tables have string primary keys, so
+the index refers to the implicit rowid. That rowid is not stable: VACUUM
+may renumber it, and rebuilding a table (as Alembic batch migrations do on
+SQLite) renumbers it and drops the triggers. The index then points at the
+wrong rows. Migrations rebuild the indexes after they run (see
+migrations/env.py); after a VACUUM or a hand-made table rebuild, run
+``flask search rebuild``. ``flask search check`` reports indexes that are
+out of sync.
+"""
+from sqlalchemy import event, inspect, text
+from sqlalchemy.exc import DatabaseError
+from app.models.employee import Employee
+from app.models.project import Project
+from app.models.task import Task
+
+# Searched columns for each model, in the order they are indexed
+SEARCH_COLUMNS = {
+    Employee: ('name', 'email'),
+    Project: ('name', 'description'),
+    Task: ('name', 'description', 'labels'),
+}
+
+
+def fts_table_name(model):
+    """Return the name of the FTS5 table indexing a model's table."""
+    return f'{model.__tablename__}_fts'
+
+
+def fts5_supported(connection):
+    """Return True when the connection is SQLite with the FTS5 extension compiled in."""
+    if connection.dialect.name != 'sqlite':
+        return False
+    options = {row[0] for row in connection.execute(text('PRAGMA compile_options'))}
+    return 'ENABLE_FTS5' in options
+
+
+def _ddl(model):
+    """Build the CREATE statements for a model's FTS table and sync triggers."""
+    table = model.__tablename__
+    fts = fts_table_name(model)
+    columns = SEARCH_COLUMNS[model]
+    column_list = ', '.join(columns)
+    new_values = ', '.join(f'new.{column}' for column in columns)
+    old_values = ', '.join(f'old.{column}' for column in columns)
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{column_list}, content='{table}', content_rowid='rowid', prefix='2 3')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(rowid, {column_list}) VALUES (new.rowid, {new_values}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.rowid, {old_values}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {column_list} ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.rowid, {old_values}); "
+        f"INSERT INTO {fts}(rowid, {column_list}) VALUES (new.rowid, {new_values}); END",
+    ]
+
+
+def create_fts(connection, model):
+    """Create a model's FTS table and triggers if the database supports FTS5."""
+    if not fts5_supported(connection):
+        return False
+    for statement in _ddl(model):
+        connection.execute(text(statement))
+    return True
+
+
+def drop_fts(connection, model):
+    """Drop a model's FTS table and triggers."""
+    if connection.dialect.name != 'sqlite':
+        return
+    fts = fts_table_name(model)
+    for suffix in ('ai', 'ad', 'au'):
+        connection.execute(text(f'DROP TRIGGER IF EXISTS {fts}_{suffix}'))
+    connection.execute(text(f'DROP TABLE IF EXISTS {fts}'))
+
+
+def rebuild_fts(connection, model):
+    """Create a model's FTS table if needed and re-index every row of its table.
+
+    Returns False when the database does not support FTS5.
+    """
+    if not create_fts(connection, model):
+        return False
+    fts = fts_table_name(model)
+    connection.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+    return True
+
+
+def rebuild_search_indexes(connection):
+    """Re-index every searchable table whose FTS table exists, restoring missing triggers.
+
+    Returns:
+        Names of the rebuilt FTS tables
+    """
+    if connection.dialect.name != 'sqlite':
+        return []
+    rebuilt = []
+    for model in SEARCH_COLUMNS:
+        if inspect(connection).has_table(fts_table_name(model)):
+            rebuild_fts(connection, model)
+            rebuilt.append(fts_table_name(model))
+    return rebuilt
+
+
+def fts_in_sync(connection, model):
+    """Return True when a model's FTS index and triggers match its table.
+
+    Runs the FTS5 integrity check against the table's current rows, which
+    reads the whole table and index.
+    """
+    fts = fts_table_name(model)
+    triggers = {
+        row[0] for row in connection.execute(
+            text("SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = :table"),
+            {'table': model.__tablename__}
+        )
+    }
+    if not {f'{fts}_ai', f'{fts}_ad', f'{fts}_au'} <= triggers:
+        return False
+    try:
+        connection.execute(text(f"INSERT INTO {fts}({fts}, rank) VALUES ('integrity-check', 1)"))
+    except DatabaseError:
+        # SQLite reports a mismatch as a corrupt virtual table
+        return False
+    return True
+
+
+def _register(model):
+    @event.listens_for(model.__table__, 'after_create')
+    def _after_create(target, connection, **kwargs):
+        create_fts(connection, model)
+
+    @event.listens_for(model.__table__, 'before_drop')
+    def _before_drop(target, connection, **kwargs):
+        drop_fts(connection, model)
+
+
+for _model in SEARCH_COLUMNS:
+    _register(_model)
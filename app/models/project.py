@@ -1,13 +1,22 @@
 import uuid
 import time
+from sqlalchemy import inspect
 from app import db
 from app.models.employee import Employee
+from app.models.employee_project import EmployeeProject
 
 
 class Project(db.Model):
     """Project model for storing project information."""
     
     __tablename__ = 'projects'
+    __table_args__ = (
+        # List endpoint: newest first, filtered on archived and/or billable
+        db.Index('ix_projects_created_at', 'created_at', 'id'),
+        db.Index('ix_projects_archived_created_at', 'archived', 'created_at', 'id'),
+        db.Index('ix_projects_archived_billable_created_at', 'archived', 'billable', 'created_at', 'id'),
+        db.Index('ix_projects_billable_created_at', 'billable', 'created_at', 'id'),
+    )
     
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     name = db.Column(db.String(255), nullable=False)
@@ -15,10 +24,17 @@ class Project(db.Model):
     archived = db.Column(db.Boolean, default=False, nullable=False)
     billable = db.Column(db.Boolean, default=False, nullable=False)
     deadline = db.Column(db.BigInteger, nullable=True)  # milliseconds timestamp
-    employees = db.Column(db.JSON, default=list, nullable=False)  # list of employee IDs
     created_at = db.Column(db.BigInteger, default=lambda: int(time.time() * 1000), nullable=False)
     updated_at = db.Column(db.BigInteger, default=lambda: int(time.time() * 1000), nullable=False)
     
+    # Read-only view of the memberships owned by Employee.project_links
+    employee_links = db.relationship(
+        'EmployeeProject',
+        primaryjoin='Project.id == foreign(EmployeeProject.project_id)',
+        order_by='EmployeeProject.id',
+        viewonly=True
+    )
+    
     def __repr__(self):
         return f'<Project {self.name}>'
     
@@ -26,45 +42,67 @@ class Project(db.Model):
         """Update the updated_at timestamp."""
         self.updated_at = int(time.time() * 1000)
     
+    @property
+    def employees(self):
+        """Employee IDs assigned to the project, in the order they were added."""
+        return [link.employee_id for link in self.employee_links]
+    
+    @employees.setter
+    def employees(self, employee_ids):
+        """Replace the project's employees, inserting and deleting only the changed memberships.
+        
+        Raises:
+            ValueError: If any of the employee IDs to add does not exist
+        """
+        wanted = list(dict.fromkeys(employee_ids or []))  # Remove duplicates, keep order
+        current = self.employees
+        to_remove = set(current) - set(wanted)
+        to_add = [emp_id for emp_id in wanted if emp_id not in current]
+        if not to_remove and not to_add:
+            return
+        
+        employees = Employee.query.filter(Employee.id.in_(to_remove | set(to_add))).all()
+        lookup = {employee.id: employee for employee in employees}
+        missing = [emp_id for emp_id in to_add if emp_id not in lookup]
+        if missing:
+            raise ValueError(f'Invalid employee IDs: {missing}')
+        
+        if self.id is None:
+            self.id = str(uuid.uuid4())
+        for employee_id in to_remove:
+            if employee_id in lookup:
+                employee = lookup[employee_id]
+                employee.projects = [pid for pid in employee.projects if pid != self.id]
+        for employee_id in to_add:
+            employee = lookup[employee_id]
+            employee.projects = employee.projects + [self.id]
+        
+        # The read-only employee_links reload, after an autoflush, the next time they are read
+        state = inspect(self)
+        if state.persistent:
+            state.session.expire(self, ['employee_links'])
+    
     def add_employee(self, employee_id):
         """Add an employee to the project."""
-        if self.employees is None:
-            self.employees = []
         if employee_id not in self.employees:
             self.employees = self.employees + [employee_id]
             self.update_timestamp()
             
-            # Update the employee's projects list
-            employee = Employee.query.filter_by(id=employee_id).first()
+            # The membership row is shared with the employee, only its timestamp needs updating
+            employee = db.session.get(Employee, employee_id)
             if employee:
-                employee.add_project(self.id)
-            
-            # Sync all tasks in this project using the helper function
-            self._sync_project_tasks()
+                employee.update_timestamp()
     
     def remove_employee(self, employee_id):
         """Remove an employee from the project."""
-        if self.employees and employee_id in self.employees:
+        if employee_id in self.employees:
             self.employees = [emp_id for emp_id in self.employees if emp_id != employee_id]
             self.update_timestamp()
             
-            # Update the employee's projects list
-            employee = Employee.query.filter_by(id=employee_id).first()
+            # The membership row is shared with the employee, only its timestamp needs updating
+            employee = db.session.get(Employee, employee_id)
             if employee:
-                employee.remove_project(self.id)
-            
-            # Sync all tasks in this project using the helper function
-            self._sync_project_tasks()
-    
-    def _sync_project_tasks(self):
-        """Sync all tasks for this specific project with the current employee list."""
-        from app.models.task import Task
-        
-        tasks = Task.query.filter_by(project_id=self.id).all()
-        for task in tasks:
-            task.employees = self.employees or []
-            task.update_timestamp()
-            db.session.add(task)
+                employee.update_timestamp()
     
     def archive(self):
         """Archive the project."""
@@ -87,7 +125,7 @@ class Project(db.Model):
             'archived': self.archived,
             'billable': self.billable,
             'deadline': self.deadline,
-            'employees': self.employees or [],
+            'employees': self.employees,
             'created_at': self.created_at,
             'updated_at': self.updated_at
         } 
\ No newline at end of file
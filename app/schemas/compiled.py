@@ -0,0 +1,285 @@
+"""Schemas compiled into plain Python functions for the hot request paths.
+
+marshmallow resolves every field through its generic serialize() and
+deserialize() machinery, which dominates the cost of dumping long lists
+and of validating small, frequent writes.
+
+compile_schema() generates one function per response schema that reads
+each attribute once and converts it inline, producing the same
+dictionaries as ``schema.dump()``. Fields it has no inline form for still go
+through their own ``serialize()``, so any response schema can be compiled
+safely.
+
+compile_loader() does the same for request schemas. The generated checks
+only accept input they can vouch for (exact types, passing validators, no
+unknown keys); anything else is handed to ``schema.load()``, so errors and
+their messages are always marshmallow's own.
+"""
+from marshmallow import EXCLUDE, RAISE, ValidationError, fields
+from marshmallow.decorators import (
+    POST_DUMP, POST_LOAD, PRE_DUMP, PRE_LOAD, VALIDATES, VALIDATES_SCHEMA
+)
+from marshmallow.utils import ensure_text_type, missing
+from sqlalchemy import inspect
+from app.utils.metrics import phase
+
+# Inline conversions matching each field type's _serialize(), for a value in ``v``
+_STRING = "v if v.__class__ is str else (None if v is None else ensure_text_type(v))"
+_INTEGER = "v if v.__class__ is int else (None if v is None else int(v))"
+_BOOLEAN = "v if v is True or v is False else {field}._serialize(v, None, None)"
+
+
+def _inline(field, name):
+    """Return the expression converting ``v`` for a field, or None if it has no inline form."""
+    field_class = type(field)
+    if field_class in (fields.String, fields.Str):
+        return _STRING
+    if field_class in (fields.Integer, fields.Int) and not field.as_string:
+        return _INTEGER
+    if field_class in (fields.Boolean, fields.Bool):
+        return _BOOLEAN.format(field=name)
+    return None
+
+
+def _column_attributes(cls):
+    """Return the names of the column attributes SQLAlchemy maps on a class."""
+    mapper = inspect(cls, raiseerr=False)
+    if mapper is None or not hasattr(mapper, 'column_attrs'):
+        return set()
+    return {prop.key for prop in mapper.column_attrs}
+
+
+def _compile(schema, cls):
+    """Generate the function dumping one instance of ``cls`` with the schema's fields."""
+    namespace = {}
+    lines = ['def dump(obj):', '    data = {}']
+    # Loaded column values are read from the instance dict, skipping the attribute
+    # instrumentation; unloaded ones fall back to normal attribute access
+    columns = _column_attributes(cls)
+    if columns:
+        lines.append('    state = obj.__dict__')
+    for index, (field_name, field) in enumerate(schema.dump_fields.items()):
+        name = f'field_{index}'
+        namespace[name] = field
+        attribute = field.attribute or field_name
+        key = field.data_key if field.data_key is not None else field_name
+
+        # Scalars are converted from ``v``, list items from each ``v`` in ``value``
+        if isinstance(field, fields.List):
+            inner = _inline(field.inner, f'{name}.inner')
+            variable = 'value'
+            expression = inner and f'None if value is None else [{inner} for v in value]'
+        else:
+            variable = 'v'
+            expression = _inline(field, name)
+
+        if expression is None or not attribute.isidentifier():
+            # Anything without an inline form is serialized by the field itself
+            lines.append(f'    value = {name}.serialize({field_name!r}, obj, getter)')
+            lines.append('    if value is not missing:')
+            lines.append(f'        data[{key!r}] = value')
+        elif attribute in columns:
+            lines.append(f'    {variable} = state.get({attribute!r}, missing)')
+            lines.append(f'    if {variable} is missing:')
+            lines.append(f'        {variable} = obj.{attribute}')
+            lines.append(f'    data[{key!r}] = {expression}')
+        else:
+            lines.append(f'    {variable} = obj.{attribute}')
+            lines.append(f'    data[{key!r}] = {expression}')
+    lines.append('    return data')
+
+    namespace.update(getter=schema.get_attribute, missing=missing, ensure_text_type=ensure_text_type)
+    filename = f'<compiled {type(schema).__name__} for {cls.__name__}>'
+    exec(compile('\n'.join(lines), filename, 'exec'), namespace)
+    return namespace['dump']
+
+
+class CompiledSchema:
+    """Drop-in replacement for a response schema's dump() backed by a generated function."""
+
+    def __init__(self, schema):
+        self.schema = schema
+        self.many = schema.many
+        hooks = any(
+            schema._hooks.get((tag, pass_many))
+            for tag in (PRE_DUMP, POST_DUMP) for pass_many in (False, True)
+        )
+        # Dump hooks and dictionaries (where absent keys are left out) use marshmallow
+        self._enabled = not hooks
+        self._functions = {dict: self._dump_with_schema}  # class -> compiled dump function
+
+    def dump(self, obj, *, many=None):
+        """Serialize an object, or a list of objects when ``many``, like Schema.dump()."""
+        with phase('serialization'):
+            return self._dump(obj, many)
+
+    def _dump(self, obj, many):
+        many = self.many if many is None else many
+        if not self._enabled:
+            return self.schema.dump(obj, many=many)
+        if not many:
+            return self._function(obj.__class__)(obj)
+        
+        functions = self._functions
+        result = []
+        for item in obj:
+            dump_one = functions.get(item.__class__) or self._function(item.__class__)
+            result.append(dump_one(item))
+        return result
+
+    def _function(self, cls):
+        function = self._functions.get(cls)
+        if function is None:
+            function = self._functions[cls] = _compile(self.schema, cls)
+        return function
+
+    def _dump_with_schema(self, obj):
+        return self.schema.dump(obj, many=False)
+
+
+def compile_schema(schema):
+    """Compile a response schema instance, keeping its ``many`` setting."""
+    return CompiledSchema(schema)
+
+
+# Types accepted as-is by the inline load checks, for fields of exactly these classes
+_LOAD_TYPES = {
+    fields.String: 'str',
+    fields.Email: 'str',
+    fields.Integer: 'int',
+    fields.Boolean: 'bool',
+}
+
+
+class _Fallback(Exception):
+    """Raised by a compiled loader when marshmallow has to handle the input."""
+
+
+def _compile_loader(schema):
+    """Generate the function loading one input dict with the schema's fields."""
+    namespace = {'missing': missing, 'Fallback': _Fallback, 'ValidationError': ValidationError}
+    known = set()
+    lines = [
+        'def load(data):',
+        '    if data.__class__ is not dict:',
+        '        raise Fallback',
+        '    result = {}',
+        '    try:',
+    ]
+    for index, (field_name, field) in enumerate(schema.load_fields.items()):
+        name = f'field_{index}'
+        namespace[name] = field
+        key = field.data_key if field.data_key is not None else field_name
+        attribute = field.attribute or field_name
+        known.add(key)
+        
+        lines.append(f'        value = data.get({key!r}, missing)')
+        checks = _load_checks(field, name, namespace)
+        if checks is None:
+            # Everything else is deserialized by the field itself
+            lines.append(f'        value = {name}.deserialize(value, {key!r}, data)')
+            lines.append('        if value is not missing:')
+            lines.append(f'            result[{attribute!r}] = value')
+            continue
+        
+        lines.append('        if value is missing:')
+        if field.required:
+            lines.append('            raise Fallback')
+        elif field.load_default is missing:
+            lines.append('            pass')
+        else:
+            lines.append(f'            result[{attribute!r}] = {name}.load_default() '
+                         f'if callable({name}.load_default) else {name}.load_default')
+        lines.append('        elif value is None:')
+        if field.allow_none:
+            lines.append(f'            result[{attribute!r}] = None')
+        else:
+            lines.append('            raise Fallback')
+        lines.append('        else:')
+        lines.extend(f'            {check}' for check in checks)
+        lines.append(f'            result[{attribute!r}] = value')
+    lines.extend([
+        '    except ValidationError:',
+        '        raise Fallback',
+    ])
+    if schema.unknown == RAISE:
+        namespace['known'] = frozenset(known)
+        lines.extend([
+            '    for key in data:',
+            '        if key not in known:',
+            '            raise Fallback',
+        ])
+    lines.append('    return result')
+    
+    exec(compile('\n'.join(lines), f'<compiled loader {type(schema).__name__}>', 'exec'), namespace)
+    return namespace['load']
+
+
+def _load_checks(field, name, namespace):
+    """Return the inline statements checking a present, non-None ``value``, or None."""
+    value_type = _LOAD_TYPES.get(type(field))
+    if value_type is not None:
+        checks = [f'if value.__class__ is not {value_type}:', '    raise Fallback']
+    elif type(field) is fields.List and type(field.inner) in _LOAD_TYPES and not field.inner.validators:
+        inner_type = _LOAD_TYPES[type(field.inner)]
+        checks = [
+            'if value.__class__ is not list:',
+            '    raise Fallback',
+            'for item in value:',
+            f'    if item.__class__ is not {inner_type}:',
+            '        raise Fallback',
+            'value = list(value)',
+        ]
+    else:
+        return None
+    
+    for index, validator in enumerate(field.validators):
+        validator_name = f'{name}_validator_{index}'
+        namespace[validator_name] = validator
+        checks.append(f'{validator_name}(value)')
+    return checks
+
+
+class CompiledLoader:
+    """Drop-in replacement for a request schema's load() backed by a generated function."""
+    
+    def __init__(self, schema):
+        self.schema = schema
+        self.many = schema.many
+        self._post_load = [getattr(schema, name) for name in schema._hooks.get((POST_LOAD, False), ())]
+        # Only simple post_load hooks are replayed; other hooks use marshmallow throughout
+        unsupported = schema.unknown not in (RAISE, EXCLUDE) or bool(schema._hooks.get((POST_LOAD, True))) or any(
+            schema._hooks.get((tag, pass_many))
+            for tag in (PRE_LOAD, VALIDATES, VALIDATES_SCHEMA) for pass_many in (False, True)
+        ) or any(
+            hook.__marshmallow_hook__[(POST_LOAD, False)].get('pass_original') for hook in self._post_load
+        )
+        self._load_one = None if unsupported else _compile_loader(schema)
+    
+    def load(self, data, *, many=None):
+        """Validate and deserialize input, raising marshmallow's ValidationError, like Schema.load()."""
+        with phase('validation'):
+            return self._load(data, many)
+    
+    def _load(self, data, many):
+        many = self.many if many is None else many
+        if self._load_one is not None:
+            try:
+                if many:
+                    if data.__class__ is not list:
+                        raise _Fallback
+                    return [self._finish(self._load_one(item), many) for item in data]
+                return self._finish(self._load_one(data), many)
+            except _Fallback:
+                pass
+        return self.schema.load(data, many=many)
+    
+    def _finish(self, result, many):
+        for hook in self._post_load:
+            result = hook(result, many=many, partial=None)
+        return result
+
+
+def compile_loader(schema):
+    """Compile a request schema instance, keeping its ``many`` setting."""
+    return CompiledLoader(schema)
@@ -1,4 +1,5 @@
 from marshmallow import Schema, fields, validate, ValidationError, post_load
+from app.schemas.pagination import PaginationSchema
 import time
 
 class EmployeeCreateSchema(Schema):
@@ -29,7 +30,7 @@ class EmployeeCreateSchema(Schema):
     def process_projects(self, data, **kwargs):
         """Ensure projects is a list and remove duplicates."""
         if 'projects' in data and data['projects'] is not None:
-            data['projects'] = list(set(data['projects']))  # Remove duplicates
+            data['projects'] = list(dict.fromkeys(data['projects']))  # Remove duplicates, keep order
         return data
 
 class EmployeeUpdateSchema(Schema):
@@ -62,7 +63,7 @@ class EmployeeUpdateSchema(Schema):
     def process_projects(self, data, **kwargs):
         """Ensure projects is a list and remove duplicates."""
         if 'projects' in data and data['projects'] is not None:
-            data['projects'] = list(set(data['projects']))  # Remove duplicates
+            data['projects'] = list(dict.fromkeys(data['projects']))  # Remove duplicates, keep order
         return data
 
 class EmployeeResponseSchema(Schema):
@@ -76,7 +77,7 @@ class EmployeeResponseSchema(Schema):
     created_at = fields.Integer(dump_only=True)
     updated_at = fields.Integer(dump_only=True)
 
-class EmployeeListSchema(Schema):
+class EmployeeListSchema(PaginationSchema):
     """Schema for employee list queries."""
     active_only = fields.Boolean(load_default=False)
     search = fields.String(validate=validate.Length(max=100))
@@ -0,0 +1,46 @@
+import base64
+import json
+from marshmallow import Schema, fields, validate
+
+# Hard upper bound accepted from clients; PAGINATION_MAX_PER_PAGE can lower it further
+MAX_PER_PAGE = 100
+
+
+def encode_cursor(created_at, row_id, rank=None):
+    """Encode the (created_at, id) sort key of a row, plus its search rank, as an opaque cursor."""
+    key = [created_at, row_id] if rank is None else [created_at, row_id, rank]
+    raw = json.dumps(key, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).rstrip(b'=').decode('ascii')
+
+
+class Cursor(fields.Field):
+    """Opaque keyset cursor, deserialized to a (created_at, id) or (created_at, id, rank) tuple."""
+    
+    default_error_messages = {'invalid': 'Invalid cursor'}
+    
+    def _deserialize(self, value, attr, data, **kwargs):
+        try:
+            padded = value + '=' * (-len(value) % 4)
+            key = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        except (TypeError, ValueError, UnicodeError):
+            raise self.make_error('invalid')
+        if not isinstance(key, list) or len(key) not in (2, 3):
+            raise self.make_error('invalid')
+        if not isinstance(key[0], int) or not isinstance(key[1], str):
+            raise self.make_error('invalid')
+        if len(key) == 3 and not isinstance(key[2], (int, float)):
+            raise self.make_error('invalid')
+        return tuple(key)
+
+
+class PaginationSchema(Schema):
+    """Pagination query parameters shared by the list endpoints.
+    
+    Clients page with ``cursor`` (the ``next_cursor`` of the previous page).
+    ``page`` is kept for offset-based clients and is ignored when a cursor is given.
+    ``stream`` returns every matching row as NDJSON instead of a page.
+    """
+    page = fields.Integer(load_default=1, validate=validate.Range(min=1))
+    per_page = fields.Integer(load_default=10, validate=validate.Range(min=1, max=MAX_PER_PAGE))
+    cursor = Cursor()
+    stream = fields.Boolean(load_default=False)
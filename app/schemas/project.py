@@ -1,4 +1,5 @@
 from marshmallow import Schema, fields, validate, post_load
+from app.schemas.pagination import PaginationSchema
 
 class ProjectCreateSchema(Schema):
     """Schema for project creation validation."""
@@ -29,7 +30,7 @@ class ProjectCreateSchema(Schema):
     def process_employees(self, data, **kwargs):
         """Ensure employees is a list and remove duplicates."""
         if 'employees' in data and data['employees'] is not None:
-            data['employees'] = list(set(data['employees']))  # Remove duplicates
+            data['employees'] = list(dict.fromkeys(data['employees']))  # Remove duplicates, keep order
         return data
 
 class ProjectUpdateSchema(Schema):
@@ -59,7 +60,7 @@ class ProjectUpdateSchema(Schema):
     def process_employees(self, data, **kwargs):
         """Ensure employees is a list and remove duplicates."""
         if 'employees' in data and data['employees'] is not None:
-            data['employees'] = list(set(data['employees']))  # Remove duplicates
+            data['employees'] = list(dict.fromkeys(data['employees']))  # Remove duplicates, keep order
         return data
 
 class ProjectResponseSchema(Schema):
@@ -74,7 +75,7 @@ class ProjectResponseSchema(Schema):
     created_at = fields.Integer(dump_only=True)
     updated_at = fields.Integer(dump_only=True)
 
-class ProjectListSchema(Schema):
+class ProjectListSchema(PaginationSchema):
     """Schema for project list queries."""
     archived_only = fields.Boolean(load_default=False)
     active_only = fields.Boolean(load_default=False)  # Not archived
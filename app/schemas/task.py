@@ -1,5 +1,6 @@
 from marshmallow import Schema, fields, validate, validates_schema, ValidationError
 from marshmallow.validate import Length, OneOf
+from app.schemas.pagination import PaginationSchema
 
 
 class TaskCreateSchema(Schema):
@@ -42,11 +43,40 @@ class TaskResponseSchema(Schema):
     updated_at = fields.Int()
 
 
-class TaskListSchema(Schema):
-    """Schema for task list query parameters."""
+class TaskFilterSchema(Schema):
+    """Schema for the task filters shared by listing and bulk operations."""
     project_id = fields.Str()
     status = fields.Str(validate=OneOf(['pending', 'in_progress', 'completed', 'cancelled']))
     priority = fields.Str(validate=OneOf(['low', 'medium', 'high', 'urgent']))
     billable = fields.Bool()
     search = fields.Str()
-    employee_id = fields.Str()  # filter by employee assignment 
\ No newline at end of file
+    employee_id = fields.Str()  # filter by employee assignment
+
+
+class TaskListSchema(PaginationSchema, TaskFilterSchema):
+    """Schema for task list query parameters."""
+
+
+class TaskBulkDeleteSchema(Schema):
+    """Schema selecting the tasks of a bulk operation, by ID or by filter."""
+    ids = fields.List(fields.Str(validate=Length(min=1)), validate=Length(min=1))
+    filter = fields.Nested(TaskFilterSchema)
+
+    @validates_schema
+    def validate_selection(self, data, **kwargs):
+        """Require exactly one non-empty selection, so a missing filter never means every task."""
+        if ('ids' in data) == ('filter' in data):
+            raise ValidationError('Provide either ids or filter')
+        if 'filter' in data and not data['filter']:
+            raise ValidationError('Filter must set at least one field', 'filter')
+
+
+class TaskBulkUpdateSchema(TaskBulkDeleteSchema):
+    """Schema for applying one patch to many tasks."""
+    changes = fields.Nested(TaskUpdateSchema, required=True)
+
+    @validates_schema
+    def validate_changes(self, data, **kwargs):
+        """Reject an empty patch."""
+        if not data.get('changes'):
+            raise ValidationError('Changes must set at least one field', 'changes') 
\ No newline at end of file
@@ -0,0 +1,51 @@
+from flask import g
+from flask_jwt_extended import get_jwt_identity
+from app import db
+from app.models.user import User
+from app.utils.cache import get_or_load
+
+
+def current_user_id():
+    """Return the id of the user the request's JWT was issued to."""
+    return int(get_jwt_identity())
+
+
+def current_user():
+    """
+    Return the authenticated User, loaded on first use and memoized for the rest of the request.
+
+    Returns:
+        User instance, or None if the account no longer exists
+    """
+    if '_current_user' not in g:
+        g._current_user = db.session.get(User, current_user_id())
+    return g._current_user
+
+
+def forget_current_user(exc=None):
+    """Drop the memoized user at the end of a request (app contexts can outlive one request)."""
+    g.pop('_current_user', None)
+
+
+def current_user_profile():
+    """
+    Return the authenticated user's profile, served from the entity cache when possible.
+
+    Cached profiles are dropped when a change to the user commits, and
+    otherwise live for ENTITY_CACHE_TTL.
+
+    Returns:
+        Profile dictionary, or None if the account no longer exists
+    """
+    def load():
+        user = current_user()
+        if not user:
+            return None
+        return {
+            'id': user.id,
+            'email': user.email,
+            'name': user.name,
+            'created_at': user.created_at.isoformat()
+        }
+
+    return get_or_load(User, current_user_id(), load)
@@ -0,0 +1,70 @@
+from flask import current_app, jsonify
+from marshmallow import ValidationError
+
+
+def load_bulk(schema, payload):
+    """
+    Validate a bulk create payload against a single-object schema.
+
+    The whole list is loaded with ``many=True`` first. When some items are
+    invalid, only the items without errors are loaded again one by one, so
+    their post_load processing still runs.
+
+    Args:
+        schema: Single-object create schema
+        payload: Decoded JSON request body, expected to be a list of objects
+
+    Returns:
+        Tuple of (list of (index, data) for valid items, dict of index -> error messages)
+
+    Raises:
+        ValidationError: If the payload is not a non-empty list or has too many items
+    """
+    if not isinstance(payload, list) or not payload:
+        raise ValidationError('Expected a non-empty list of objects')
+
+    max_items = current_app.config['BULK_MAX_ITEMS']
+    if len(payload) > max_items:
+        raise ValidationError(f'At most {max_items} items can be created per request')
+
+    try:
+        return list(enumerate(schema.load(payload, many=True))), {}
+    except ValidationError as err:
+        errors = dict(err.messages)
+
+    valid = [
+        (index, schema.load(item))
+        for index, item in enumerate(payload)
+        if index not in errors
+    ]
+    return valid, errors
+
+
+def bulk_response(key, created, errors, response_schema):
+    """
+    Build the response for a bulk create request.
+
+    Returns 201 when every item was created, 207 when only some were and
+    400 when none were. Errors are listed by the index of the failed item.
+
+    Args:
+        key: Name of the list of created objects in the response
+        created: Created objects or row dictionaries, in request order
+        errors: Dict of index -> error messages
+        response_schema: Response schema instance with ``many=True``
+
+    Returns:
+        Tuple of (JSON response, status code)
+    """
+    if not created:
+        status = 400
+    elif errors:
+        status = 207
+    else:
+        status = 201
+
+    return jsonify({
+        'message': f'Created {len(created)} of {len(created) + len(errors)} items',
+        key: response_schema.dump(created),
+        'errors': [{'index': index, 'messages': errors[index]} for index in sorted(errors)]
+    }), status
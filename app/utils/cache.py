@@ -0,0 +1,311 @@
+"""In-process cache of serialized entities for the GET-by-id endpoints.
+
+Entries are keyed by ``(table name, id)`` and hold the dumped response
+dictionary, so a hit skips both the database and marshmallow. Writes made
+through the session are collected in ``after_flush`` and bulk statements in
+``do_orm_execute``; the affected keys are dropped in ``after_commit`` and
+forgotten on rollback. Sessions committing into a larger transaction (see
+app.utils.write_queue) hand their keys to it instead. Entries can depend
+on other keys (a task's assignees come from its project), and dropping a
+key drops its dependents too.
+
+Each process has its own entries, but invalidations are also counted in
+shared memory: every key hashes to one of SHARED_SLOTS version counters,
+which invalidate() bumps and get() compares against the versions stamped
+on the entry. The counters are created at import, so processes forked
+after it (the serve.py workers) and every app in one process see each
+other's writes. Processes that import the app separately do not share
+them and should run with ENTITY_CACHE_ENABLED off.
+"""
+import ctypes
+import multiprocessing
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from flask import current_app, has_app_context
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import BinaryExpression, BindParameter
+from app.models.employee import Employee
+from app.models.employee_project import EmployeeProject
+from app.models.project import Project
+from app.models.task import Task
+from app.models.user import User
+from app.utils.replica import reads_own_writes
+
+CACHED_MODELS = (Employee, Project, Task, User)
+
+SHARED_SLOTS = 4096
+
+# Slot 0 counts every invalidation, the rest count those of the keys hashing to them
+_versions = multiprocessing.RawArray(ctypes.c_uint64, SHARED_SLOTS + 1)
+_versions_lock = multiprocessing.Lock()
+
+
+def _slot(key):
+    return 1 + zlib.crc32(f'{key[0]}:{key[1]}'.encode()) % SHARED_SLOTS
+
+
+def _slots(keys):
+    """Return the version slots of keys and of their whole tables."""
+    return {_slot(key) for key in keys} | {_slot((key[0], None)) for key in keys}
+
+
+def _bump(keys):
+    with _versions_lock:
+        # The total first, so a set() seeing a bumped slot also sees the new total
+        _versions[0] += 1
+        for slot in _slots(keys):
+            _versions[slot] += 1
+
+
+def _current(stamps):
+    return all(_versions[slot] == version for slot, version in stamps)
+
+
+class EntityCache:
+    """Bounded, thread-safe LRU cache with a per-entry time to live."""
+
+    def __init__(self, max_size=1024, ttl=10):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # key -> (expires_at, value, depends_on, stamps)
+        self._dependents = {}  # key -> set of keys cached from it
+        self._lock = threading.Lock()
+
+    def token(self):
+        """Return a token to take before reading the database, see set()."""
+        return _versions[0]
+
+    def __contains__(self, key):
+        """Return True when a key is cached and still valid, without counting a hit or miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry[0] >= time.monotonic() and _current(entry[3])
+
+    def get(self, key):
+        """Return the cached value for a key, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic() or not _current(entry[3]):
+                if entry is not None:
+                    self._discard(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value, token, depends_on=()):
+        """
+        Cache a value read from the database.
+
+        The value is dropped when anything, in any process, was invalidated
+        after ``token`` was taken, since it may have been read before that
+        write committed.
+
+        Args:
+            key: ``(table name, id)`` of the entity
+            value: Serialized entity
+            token: Result of token() taken before the read
+            depends_on: Keys whose invalidation must also drop this entry
+        """
+        depends_on = tuple(depends_on)
+        stamps = tuple((slot, _versions[slot]) for slot in _slots((key,) + depends_on))
+        if token != _versions[0]:
+            return
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = (time.monotonic() + self.ttl, value, depends_on, stamps)
+            for parent in depends_on:
+                self._dependents.setdefault(parent, set()).add(key)
+            while len(self._entries) > self.max_size:
+                self._discard(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, keys):
+        """Drop entries and their dependents in every process. A key with id None drops its whole table."""
+        _bump(keys)
+        with self._lock:
+            tables = {table for table, entity_id in keys if entity_id is None}
+            if tables:
+                keys = set(keys) | {key for key in self._entries if key[0] in tables}
+            pending = list(keys)
+            while pending:
+                key = pending.pop()
+                pending.extend(self._dependents.pop(key, ()))
+                self._discard(key)
+
+    def clear(self):
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._dependents.clear()
+
+    def stats(self):
+        """Return the hit/miss counters and current size."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._entries)
+        }
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for parent in entry[2]:
+            dependents = self._dependents.get(parent)
+            if dependents is not None:
+                dependents.discard(key)
+                if not dependents:
+                    del self._dependents[parent]
+
+
+def init_entity_cache(app):
+    """Attach an EntityCache to the app when ENTITY_CACHE_ENABLED is set."""
+    if app.config['ENTITY_CACHE_ENABLED']:
+        app.extensions['entity_cache'] = EntityCache(
+            max_size=app.config['ENTITY_CACHE_SIZE'],
+            ttl=app.config['ENTITY_CACHE_TTL']
+        )
+
+
+def entity_cache():
+    """Return the current app's EntityCache, or None when caching is disabled."""
+    if not has_app_context():
+        return None
+    return current_app.extensions.get('entity_cache')
+
+
+def cache_key(model, entity_id):
+    """Return the cache key of an entity."""
+    return (model.__tablename__, entity_id)
+
+
+def _pending(session):
+    return session.info.setdefault('entity_cache_pending', set())
+
+
+@event.listens_for(Session, 'after_flush')
+def _collect_flushed_entities(session, flush_context):
+    """Remember the cached entities written by this flush."""
+    if entity_cache() is None:
+        return
+    keys = set()
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, CACHED_MODELS):
+            keys.add(cache_key(type(obj), obj.id))
+        elif isinstance(obj, EmployeeProject):
+            # Memberships are serialized on both sides
+            keys.add(cache_key(Employee, obj.employee_id))
+            keys.add(cache_key(Project, obj.project_id))
+    if keys:
+        _pending(session).update(keys)
+
+
+def _matched_ids(statement, mapper):
+    """Return the primary keys a bulk statement is limited to, or None if it is not."""
+    where = statement.whereclause
+    if not isinstance(where, BinaryExpression) or not isinstance(where.right, BindParameter):
+        return None
+    if not where.left.compare(mapper.primary_key[0]):
+        return None
+    if where.operator is operators.eq:
+        return [where.right.value]
+    if where.operator is operators.in_op:
+        return list(where.right.value)
+    return None
+
+
+def _bulk_keys(state):
+    """Return the cache keys a bulk INSERT, UPDATE or DELETE may change."""
+    mapper = state.bind_mapper
+    if mapper is None:
+        return set()
+    
+    if mapper.class_ is EmployeeProject:
+        if state.is_insert and state.parameters:
+            rows = state.parameters if isinstance(state.parameters, list) else [state.parameters]
+            keys = set()
+            for row in rows:
+                keys.add(cache_key(Employee, row['employee_id']))
+                keys.add(cache_key(Project, row['project_id']))
+            return keys
+        return {cache_key(Employee, None), cache_key(Project, None)}
+    
+    # New rows cannot have been cached yet
+    if state.is_insert or not issubclass(mapper.class_, CACHED_MODELS):
+        return set()
+    
+    ids = _matched_ids(state.statement, mapper)
+    if ids is None:
+        return {cache_key(mapper.class_, None)}
+    return {cache_key(mapper.class_, entity_id) for entity_id in ids}
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _collect_bulk_statements(orm_execute_state):
+    """Remember the entities touched by bulk INSERT, UPDATE and DELETE statements."""
+    state = orm_execute_state
+    if not (state.is_insert or state.is_update or state.is_delete) or entity_cache() is None:
+        return
+    keys = _bulk_keys(state)
+    if keys:
+        _pending(state.session).update(keys)
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_committed_entities(session):
+    """Drop the entities written by the transaction that just committed."""
+    keys = session.info.pop('entity_cache_pending', None)
+    deferred = session.info.get('entity_cache_deferred')
+    if keys and deferred is not None:
+        # Committed into an outer transaction, which invalidates them itself
+        deferred.update(keys)
+        return
+    cache = entity_cache()
+    if keys and cache is not None:
+        cache.invalidate(keys)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _forget_rolled_back_entities(session):
+    """Nothing written by a rolled back transaction needs invalidating."""
+    session.info.pop('entity_cache_pending', None)
+
+
+def get_or_load(model, entity_id, load, depends_on=None):
+    """
+    Return a serialized entity from the cache, loading and caching it on a miss.
+    
+    Args:
+        model: Model class of the entity
+        entity_id: Primary key of the entity
+        load: Callable returning the serialized entity, or None if it does not exist
+        depends_on: Optional callable returning the keys the serialized entity depends on
+        
+    Returns:
+        Serialized entity, or None if it does not exist
+    """
+    cache = entity_cache()
+    if cache is None:
+        return load()
+    
+    key = cache_key(model, entity_id)
+    # Entries may have been read from a lagging replica, clients reading their own writes reload
+    data = None if reads_own_writes() else cache.get(key)
+    if data is not None:
+        return data
+    
+    token = cache.token()
+    data = load()
+    if data is not None:
+        cache.set(key, data, token, depends_on(data) if depends_on else ())
+    return data
@@ -0,0 +1,44 @@
+from sqlalchemy import event
+from app import db
+
+
+def _apply_pragmas(pragmas):
+    def on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f'PRAGMA {name}={value}')
+        finally:
+            cursor.close()
+    return on_connect
+
+
+def init_engine(app):
+    """
+    Apply SQLITE_PRAGMAS to every new connection of each engine and log the effective engine settings.
+
+    Must run before the engines open its first connection.
+    """
+    with app.app_context():
+        engines = db.engines
+    for bind_key, engine in engines.items():
+        pragmas = app.config.get('SQLITE_PRAGMAS') or {}
+        if pragmas and engine.dialect.name == 'sqlite':
+            event.listen(engine, 'connect', _apply_pragmas(pragmas))
+        else:
+            pragmas = {}
+
+        pool = engine.pool
+        options = app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {})
+        app.logger.info(
+            'Database %s%s: pool=%s size=%s overflow=%s timeout=%s pre_ping=%s query_cache=%s pragmas=%s',
+            engine.url.render_as_string(hide_password=True),
+            f' ({bind_key})' if bind_key else '',
+            type(pool).__name__,
+            pool.size() if hasattr(pool, 'size') else None,
+            options.get('max_overflow'),
+            pool.timeout() if hasattr(pool, 'timeout') else None,
+            options.get('pool_pre_ping', False),
+            options.get('query_cache_size'),
+            pragmas
+        )
@@ -0,0 +1,85 @@
+import hashlib
+from flask import Response, request
+from app.utils.cache import cache_key, entity_cache, get_or_load
+
+
+def make_etag(*parts):
+    """Return a strong ETag value hashed from the given parts."""
+    return hashlib.sha1('|'.join(map(str, parts)).encode('utf-8')).hexdigest()
+
+
+def is_fresh(etag):
+    """Return True when the request's If-None-Match already names this ETag."""
+    return request.if_none_match.contains(etag)
+
+
+def not_modified(etag):
+    """Build an empty 304 response carrying the ETag."""
+    response = Response(status=304)
+    response.set_etag(etag)
+    return response
+
+
+def get_entity(model, entity_id, load, version, depends_on=None):
+    """
+    Return a serialized entity and its ETag, skipping the load for conditional requests.
+
+    A cached entity answers directly. Otherwise a request with If-None-Match
+    first runs ``version``, which only reads the columns the ETag is built
+    from, and the entity is loaded and serialized only if the client's copy
+    is out of date.
+
+    Args:
+        model: Model class of the entity
+        entity_id: Primary key of the entity
+        load: Callable returning (etag, serialized entity), or None if it does not exist
+        version: Callable returning the entity's ETag, or None if it does not exist
+        depends_on: Optional callable returning the cache keys the entity depends on
+
+    Returns:
+        None if the entity does not exist, otherwise (etag, serialized entity)
+        with the entity set to None when the client's copy is current
+    """
+    if request.if_none_match:
+        cache = entity_cache()
+        if cache is None or cache_key(model, entity_id) not in cache:
+            etag = version()
+            if etag is None:
+                return None
+            if is_fresh(etag):
+                return etag, None
+
+    entity = get_or_load(
+        model, entity_id, load,
+        depends_on=(lambda entity: depends_on(entity[1])) if depends_on else None
+    )
+    if entity is None:
+        return None
+    if is_fresh(entity[0]):
+        return entity[0], None
+    return entity
+
+
+def page_etag(rows, pagination, version):
+    """
+    Compute the ETag of one page of a list response from the rows it serves.
+
+    The ETag covers the request's path and query parameters, the pagination
+    block (total and next cursor) and the version of every row on the page,
+    so it changes whenever the response body would. A row's version is as
+    fine-grained as the entity ETags: two writes to the same row within one
+    millisecond of ``updated_at`` look alike to both.
+
+    Args:
+        rows: Rows on the page, as returned by paginate
+        pagination: Pagination dict returned by paginate
+        version: Callable returning a tuple of what a row's serialized form depends on
+
+    Returns:
+        ETag of the page
+    """
+    params = sorted(request.args.items(multi=True))
+    return make_etag(
+        request.path, params, sorted(pagination.items()),
+        [version(row) for row in rows]
+    )
@@ -0,0 +1,119 @@
+"""Per-request memory allocation tracking with tracemalloc.
+
+With MEMORY_TRACKING_ENABLED, tracemalloc is started when a request begins
+and stopped once its response is built, after a snapshot of what is still
+allocated. Only the request's own allocations are traced, so the snapshot
+is small and requests pay nothing while no request is traced. The
+request's peak is the most memory its allocations held at any one time.
+Its top allocation sites are the source lines holding the most memory in
+the snapshot: the loaded rows, ORM objects and serialized body. Each
+allocation is charged to the innermost line of the project's own code that
+led to it (within MEMORY_TRACE_FRAMES frames).
+
+Both go to /metrics (``http_request_memory_peak_bytes`` and
+``http_request_allocated_bytes_total`` by allocation site) and, in debug
+mode, to the ``X-Memory-Peak`` and ``X-Memory-Top`` response headers.
+
+tracemalloc is process-wide, so one request per process is traced at a
+time; requests starting meanwhile are served untraced. Tracing slows
+allocations down, in other threads too, so this is meant for development,
+staging and benchmark runs rather than busy production workers.
+"""
+import os
+import threading
+import tracemalloc
+from collections import Counter
+from flask import current_app, g
+from app.utils.metrics import endpoint_labels, metrics
+
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>'),
+)
+_tracing = threading.Lock()  # held by the request being traced
+
+
+class RequestMemory:
+    """Peak and top allocation sites of one request."""
+
+    __slots__ = ('peak', 'sites')
+
+    def __init__(self, peak, sites):
+        self.peak = peak  # bytes
+        self.sites = sites  # [(site, bytes)], largest first
+
+
+def _site(traceback, root):
+    # The most recent frame in our own code, so that allocations made inside
+    # SQLAlchemy or marshmallow are charged to the line that called them
+    for frame in reversed(traceback):
+        filename = frame.filename
+        if filename.startswith(root + os.sep) and 'site-packages' not in filename:
+            return f'{os.path.relpath(filename, root)}:{frame.lineno}'
+    frame = traceback[-1]
+    return f'{frame.filename}:{frame.lineno}'
+
+
+def top_sites(snapshot, limit, root):
+    """Return the ``limit`` lines under ``root`` holding the most memory in ``snapshot``."""
+    sizes = Counter()
+    for stat in snapshot.filter_traces(_IGNORED).statistics('traceback'):
+        sizes[_site(stat.traceback, root)] += stat.size
+    return sizes.most_common(limit)
+
+
+def _start_request():
+    if tracemalloc.is_tracing() or not _tracing.acquire(blocking=False):
+        return
+    tracemalloc.start(current_app.config['MEMORY_TRACE_FRAMES'])
+    g._memory_thread = threading.get_ident()
+
+
+def _stop_tracing():
+    # A copy of the request context torn down on another thread (see
+    # app.utils.write_queue) leaves the tracing to the request's own thread
+    if g.get('_memory_thread') == threading.get_ident():
+        del g._memory_thread
+        tracemalloc.stop()
+        _tracing.release()
+
+
+def _finish_request(response):
+    if g.get('_memory_thread') != threading.get_ident():
+        return response
+    try:
+        peak = tracemalloc.get_traced_memory()[1]
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        _stop_tracing()
+
+    root = os.path.dirname(current_app.root_path)
+    usage = RequestMemory(peak, top_sites(snapshot, current_app.config['MEMORY_TOP_SITES'], root))
+
+    registry = metrics()
+    if registry is not None:
+        labels = endpoint_labels()
+        registry.observe('http_request_memory_peak_bytes', labels, usage.peak)
+        for site, size in usage.sites:
+            registry.inc('http_request_allocated_bytes_total', labels + (('site', site),), size)
+
+    if current_app.debug:
+        response.headers['X-Memory-Peak'] = str(usage.peak)
+        response.headers['X-Memory-Top'] = ', '.join(f'{site}={size}' for site, size in usage.sites)
+    return response
+
+
+def _forget_request(exc=None):
+    _stop_tracing()
+
+
+def init_memory_tracking(app):
+    """Trace the allocations of requests and report them when MEMORY_TRACKING_ENABLED is set."""
+    if not app.config['MEMORY_TRACKING_ENABLED']:
+        return
+    app.before_request(_start_request)
+    app.after_request(_finish_request)
+    app.teardown_request(_forget_request)
@@ -0,0 +1,293 @@
+"""Request metrics in the Prometheus text format.
+
+Every request records its latency, status and response size under its
+blueprint and endpoint, plus the time it spent in the database, in request
+validation and in response serialization. ``/metrics`` exposes them.
+
+Recording takes no locks: each thread adds to its own shard, and shards are
+only summed when metrics are collected. The shards of finished threads are
+folded into one retired shard when a thread adds its shard or metrics are
+collected, so their number follows the live threads. With METRICS_DIR set, each worker
+process also writes its totals to a file in that directory about once per
+METRICS_FLUSH_INTERVAL, and ``/metrics`` merges every worker's file, so a
+scrape of any worker covers the whole server.
+"""
+import bisect
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from flask import Response, current_app, g, has_app_context, request
+from flask.json.provider import DefaultJSONProvider
+from app.utils.queries import request_queries
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (128, 512, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+MEMORY_BUCKETS = (16384, 65536, 262144, 1048576, 4194304, 16777216, 67108864, 268435456)
+PHASES = ('db', 'validation', 'serialization')
+
+# name -> (type, help, buckets for histograms)
+METRICS = {
+    'http_requests_total': ('counter', 'Requests handled, by endpoint, method and status.', None),
+    'http_request_duration_seconds': ('histogram', 'Time to handle a request.', LATENCY_BUCKETS),
+    'http_response_size_bytes': ('histogram', 'Size of response bodies with a known length.', SIZE_BUCKETS),
+    'http_request_phase_seconds': (
+        'histogram', 'Time a request spent in the database, validation and serialization.', LATENCY_BUCKETS
+    ),
+    # Only recorded with MEMORY_TRACKING_ENABLED, see app.utils.memory
+    'http_request_memory_peak_bytes': (
+        'histogram', 'Peak memory allocated while handling a request.', MEMORY_BUCKETS
+    ),
+    'http_request_allocated_bytes_total': (
+        'counter', 'Memory still allocated when responses were ready, by allocation site.', None
+    ),
+}
+
+
+class _Shard:
+    __slots__ = ('counters', 'histograms')
+
+    def __init__(self):
+        self.counters = {}  # (name, labels) -> value
+        self.histograms = {}  # (name, labels) -> [count per bucket..., +Inf count, sum]
+
+    def add(self, other):
+        """Add another shard's totals to this one."""
+        for key, value in other.counters.copy().items():
+            self.counters[key] = self.counters.get(key, 0) + value
+        for key, counts in other.histograms.copy().items():
+            total = self.histograms.get(key)
+            self.histograms[key] = list(counts) if total is None else [a + b for a, b in zip(total, counts)]
+
+
+class Metrics:
+    """Counters and histograms aggregated per thread and, optionally, across processes."""
+
+    def __init__(self, directory=None, flush_interval=1.0):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self._shards = {}  # thread -> shard
+        self._retired = _Shard()  # Totals of finished threads
+        self._local = threading.local()
+        self._lock = threading.Lock()  # Never taken to record
+        self._pid = None
+
+    def _shard(self):
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = self._local.shard = _Shard()
+            with self._lock:
+                self._retire_finished_threads()
+                self._shards[threading.current_thread()] = shard
+            if self.directory and self._pid != os.getpid():
+                self._start_flusher()
+        return shard
+
+    def _retire_finished_threads(self):
+        # Called with the lock held. A finished thread no longer writes to its shard.
+        alive = set(threading.enumerate())
+        for thread in [thread for thread in self._shards if thread not in alive]:
+            self._retired.add(self._shards.pop(thread))
+
+    def inc(self, name, labels, value=1):
+        """Add to a counter."""
+        counters = self._shard().counters
+        key = (name, labels)
+        counters[key] = counters.get(key, 0) + value
+
+    def observe(self, name, labels, value):
+        """Record a value in a histogram."""
+        histograms = self._shard().histograms
+        key = (name, labels)
+        buckets = METRICS[name][2]
+        counts = histograms.get(key)
+        if counts is None:
+            counts = histograms[key] = [0] * (len(buckets) + 1) + [0.0]
+        counts[bisect.bisect_left(buckets, value)] += 1
+        counts[-1] += value
+
+    def snapshot(self):
+        """Return this process's totals as (counters, histograms)."""
+        total = _Shard()
+        with self._lock:
+            self._retire_finished_threads()
+            total.add(self._retired)
+            for shard in self._shards.values():
+                total.add(shard)
+        return total.counters, total.histograms
+
+    def collect(self):
+        """Return the totals of every worker when METRICS_DIR is set, otherwise of this process."""
+        if not self.directory:
+            return self.snapshot()
+        self.flush()
+        counters, histograms = {}, {}
+        for filename in os.listdir(self.directory):
+            if not filename.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(self.directory, filename)) as file:
+                    data = json.load(file)
+            except (OSError, ValueError):
+                continue  # Removed or replaced while listing
+            for name, labels, value in data['counters']:
+                key = (name, tuple(map(tuple, labels)))
+                counters[key] = counters.get(key, 0) + value
+            for name, labels, counts in data['histograms']:
+                key = (name, tuple(map(tuple, labels)))
+                total = histograms.get(key)
+                histograms[key] = counts if total is None else [a + b for a, b in zip(total, counts)]
+        return counters, histograms
+
+    def flush(self):
+        """Write this process's totals to METRICS_DIR."""
+        if not self.directory:
+            return
+        counters, histograms = self.snapshot()
+        data = {
+            'counters': [[name, labels, value] for (name, labels), value in counters.items()],
+            'histograms': [[name, labels, counts] for (name, labels), counts in histograms.items()],
+        }
+        path = os.path.join(self.directory, f'{os.getpid()}.json')
+        with open(f'{path}.tmp', 'w') as file:
+            json.dump(data, file)
+        os.replace(f'{path}.tmp', path)
+
+    def _start_flusher(self):
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+        threading.Thread(target=self._flush_periodically, name='metrics-flush', daemon=True).start()
+
+    def _flush_periodically(self):
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except OSError:
+                pass
+
+
+def render(counters, histograms):
+    """Format collected metrics in the Prometheus text exposition format."""
+    lines = []
+    for name, (kind, help_text, buckets) in METRICS.items():
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} {kind}')
+        if kind == 'counter':
+            for (metric, labels), value in sorted(counters.items()):
+                if metric == name:
+                    lines.append(f'{name}{_labels(labels)} {_number(value)}')
+            continue
+        for (metric, labels), counts in sorted(histograms.items()):
+            if metric != name:
+                continue
+            cumulative = 0
+            for bound, count in zip(buckets + ('+Inf',), counts):
+                cumulative += count
+                lines.append(f'{name}_bucket{_labels(labels, le=bound)} {cumulative}')
+            lines.append(f'{name}_sum{_labels(labels)} {_number(counts[-1])}')
+            lines.append(f'{name}_count{_labels(labels)} {cumulative}')
+    return '\n'.join(lines) + '\n'
+
+
+def _labels(pairs, le=None):
+    pairs = list(pairs)
+    if le is not None:
+        pairs.append(('le', le if isinstance(le, str) else repr(float(le))))
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in pairs) + '}'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def metrics():
+    """Return the current app's Metrics, or None when metrics are disabled."""
+    if not has_app_context():
+        return None
+    return current_app.extensions.get('metrics')
+
+
+def endpoint_labels():
+    """Return the blueprint and endpoint labels of the current request."""
+    return (('blueprint', request.blueprint or ''), ('endpoint', request.endpoint or 'unmatched'))
+
+
+def _phases():
+    if not has_app_context():
+        return None
+    return g.get('_metrics_phases')
+
+
+@contextmanager
+def phase(name):
+    """Add the time spent in the block to one of the current request's PHASES."""
+    phases = _phases()
+    if phases is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        phases[name] += time.perf_counter() - started
+
+
+class TimedJSONProvider(DefaultJSONProvider):
+    """JSON provider counting response encoding as serialization time."""
+
+    def dumps(self, obj, **kwargs):
+        with phase('serialization'):
+            return super().dumps(obj, **kwargs)
+
+
+def _start_request():
+    g._metrics_started = time.perf_counter()
+    g._metrics_phases = dict.fromkeys(PHASES, 0.0)  # db comes from app.utils.queries
+
+
+def _record_request(response):
+    started = g.pop('_metrics_started', None)
+    phases = g.pop('_metrics_phases', None)
+    registry = metrics()
+    if started is None or registry is None:
+        return response
+
+    endpoint = endpoint_labels()
+    method = (('method', request.method),)
+    registry.inc('http_requests_total', endpoint + method + (('status', str(response.status_code)),))
+    registry.observe('http_request_duration_seconds', endpoint + method, time.perf_counter() - started)
+    if response.content_length is not None:
+        registry.observe('http_response_size_bytes', endpoint, response.content_length)
+    queries = request_queries()
+    if queries is not None:
+        phases['db'] = queries.duration
+    for name, seconds in phases.items():
+        registry.observe('http_request_phase_seconds', endpoint + (('phase', name),), seconds)
+    return response
+
+
+def _metrics_view():
+    counters, histograms = metrics().collect()
+    return Response(render(counters, histograms), mimetype='text/plain; version=0.0.4')
+
+
+def init_metrics(app):
+    """Record request metrics and serve them at /metrics when METRICS_ENABLED is set."""
+    if not app.config['METRICS_ENABLED']:
+        return
+    directory = app.config['METRICS_DIR']
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    app.extensions['metrics'] = Metrics(directory, app.config['METRICS_FLUSH_INTERVAL'])
+    app.json = TimedJSONProvider(app)
+    app.before_request(_start_request)
+    app.after_request(_record_request)
+    app.add_url_rule('/metrics', 'metrics', _metrics_view)
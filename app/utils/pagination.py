@@ -0,0 +1,71 @@
+import math
+from flask import current_app
+from sqlalchemy import and_, or_
+from app.schemas.pagination import encode_cursor
+
+
+def paginate(query, model, params, rank=None):
+    """
+    Order a list query newest first and return one page of it.
+    
+    Rows are ordered on (created_at, id) descending, after the search rank
+    when one is given. With a cursor the page starts right after the cursor
+    row, so the cost does not grow with the page number and no count is run.
+    Without one the ``page`` offset is used and the total is reported for
+    compatibility with offset-based clients.
+    
+    Args:
+        query: Filtered query over ``model``
+        model: Model class with ``created_at`` and ``id`` columns
+        params: Loaded PaginationSchema fields
+        rank: Optional search rank column (lower is better), see apply_search
+        
+    Returns:
+        Tuple of (rows on the page, pagination dict for the response)
+    """
+    per_page = min(params['per_page'], current_app.config['PAGINATION_MAX_PER_PAGE'])
+    pagination = {'per_page': per_page}
+    
+    query = query.order_by(*sort_order(model, rank))
+    cursor = params.get('cursor')
+    if cursor is not None:
+        created_at, last_id = cursor[:2]
+        after = or_(
+            model.created_at < created_at,
+            and_(model.created_at == created_at, model.id < last_id)
+        )
+        if rank is not None and len(cursor) == 3:
+            after = or_(rank > cursor[2], and_(rank == cursor[2], after))
+        query = query.filter(after)
+    else:
+        page = params['page']
+        total = query.order_by(None).count()
+        pagination.update(page=page, total=total, pages=math.ceil(total / per_page))
+        query = query.offset((page - 1) * per_page)
+    
+    if rank is not None:
+        query = query.add_columns(rank)
+    
+    # Fetch one extra row to find out whether another page follows
+    results = query.limit(per_page + 1).all()
+    has_next = len(results) > per_page
+    results = results[:per_page]
+    rows = [result[0] for result in results] if rank is not None else results
+    
+    next_cursor = None
+    if has_next:
+        last = rows[-1]
+        last_rank = results[-1][1] if rank is not None else None
+        next_cursor = encode_cursor(last.created_at, last.id, last_rank)
+    
+    pagination['has_next'] = has_next
+    pagination['next_cursor'] = next_cursor
+    return rows, pagination
+
+
+def sort_order(model, rank=None):
+    """Return the ORDER BY clauses shared by paginated and streamed lists."""
+    order = [model.created_at.desc(), model.id.desc()]
+    if rank is not None:
+        order.insert(0, rank.asc())
+    return order
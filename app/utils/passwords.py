@@ -0,0 +1,102 @@
+"""Password hashing on a bounded worker pool.
+
+bcrypt is deliberately slow, so hashing inline lets a burst of logins take
+every worker thread and CPU away from the other endpoints. Hashes run on a
+small thread pool instead (bcrypt releases the GIL while hashing), with a
+cap on how many can be queued; once that is reached new requests are
+refused with HasherBusy rather than piling up.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import bcrypt
+from flask import current_app
+
+
+class HasherBusy(Exception):
+    """Raised when the password hashing queue is full."""
+
+
+class PasswordHasher:
+    """Runs bcrypt hashes and checks on a bounded thread pool."""
+
+    def __init__(self, rounds, workers=2, max_pending=16):
+        self.rounds = rounds
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='bcrypt')
+        # Running plus queued hashes
+        self._slots = threading.BoundedSemaphore(max_pending)
+
+    def _run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            raise HasherBusy()
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future.result()
+
+    def hash(self, password):
+        """Hash a password with the configured cost."""
+        return self._run(_hash, password.encode('utf-8'), self.rounds)
+
+    def check(self, password, password_hash):
+        """Return True when the password matches the stored hash."""
+        return self._run(bcrypt.checkpw, password.encode('utf-8'), password_hash)
+
+    def needs_rehash(self, password_hash):
+        """Return True when a stored hash was made with a different cost."""
+        return hash_rounds(password_hash) != self.rounds
+
+
+def _hash(password, rounds):
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds))
+
+
+def hash_rounds(password_hash):
+    """Return the cost factor of a bcrypt hash such as ``$2b$12$...``."""
+    return int(password_hash.split(b'$')[2])
+
+
+def calibrate_rounds(target_ms, min_rounds=10, max_rounds=16):
+    """
+    Pick the highest bcrypt cost whose hash time stays within a target.
+
+    One hash is timed at ``min_rounds``; every extra round doubles the work.
+
+    Args:
+        target_ms: Wanted time per hash in milliseconds
+        min_rounds: Lowest cost to accept, whatever the timing
+        max_rounds: Highest cost to consider
+
+    Returns:
+        Cost factor between min_rounds and max_rounds
+    """
+    started = time.perf_counter()
+    _hash(b'calibration', min_rounds)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    rounds = min_rounds
+    while rounds < max_rounds and elapsed_ms * 2 <= target_ms:
+        rounds += 1
+        elapsed_ms *= 2
+    return rounds
+
+
+def init_password_hasher(app):
+    """Attach a PasswordHasher to the app, calibrating its cost unless BCRYPT_ROUNDS is set."""
+    rounds = app.config['BCRYPT_ROUNDS']
+    if rounds is None:
+        rounds = calibrate_rounds(app.config['BCRYPT_TARGET_MS'], app.config['BCRYPT_MIN_ROUNDS'])
+        app.logger.info('Calibrated bcrypt to %d rounds', rounds)
+    app.extensions['password_hasher'] = PasswordHasher(
+        rounds,
+        workers=app.config['BCRYPT_WORKERS'],
+        max_pending=app.config['BCRYPT_MAX_PENDING']
+    )
+
+
+def password_hasher():
+    """Return the current app's PasswordHasher."""
+    return current_app.extensions['password_hasher']
@@ -0,0 +1,285 @@
+"""Sampling profiler for individual requests.
+
+With PROFILE_ENABLED, a request is profiled when it carries a valid signed
+``X-Profile`` token (see ``flask profile token``) or is picked at
+PROFILE_SAMPLE_RATE. While it runs, a background thread records the
+request thread's stack every PROFILE_INTERVAL_MS, so the request itself
+pays almost nothing. The samples are written to PROFILE_DIR as collapsed
+stacks (``.folded``, for flamegraph.pl and similar) and as a speedscope
+file (``.speedscope.json``, for https://www.speedscope.app), and listed by
+``GET /api/admin/profiles``.
+
+When PROFILE_ENABLED is off no hooks are registered at all.
+"""
+import fcntl
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from flask import current_app, g, request
+from itsdangerous import BadSignature, URLSafeTimedSerializer
+
+PROFILE_HEADER = 'X-Profile'
+INDEX_FILE = 'index.jsonl'
+
+
+class Profile:
+    """Stack samples of one thread."""
+
+    def __init__(self, thread_id):
+        self.thread_id = thread_id
+        self.samples = Counter()  # stack (root first) -> number of samples
+        self.started = time.perf_counter()
+        self.duration = None
+
+
+class Sampler:
+    """Background thread sampling the stacks of the threads being profiled."""
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._profiles = {}  # thread id -> Profile
+        self._wake = threading.Event()
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def start(self, thread_id):
+        """Start sampling a thread and return its Profile."""
+        profile = Profile(thread_id)
+        with self._lock:
+            if self._pid != os.getpid():
+                self._thread = threading.Thread(target=self._run, name='profiler', daemon=True)
+                self._thread.start()
+                self._pid = os.getpid()
+            self._profiles[thread_id] = profile
+        self._wake.set()
+        return profile
+
+    def stop(self, profile):
+        """Stop sampling a profile's thread; its samples do not change afterwards."""
+        with self._lock:
+            if self._profiles.get(profile.thread_id) is profile:
+                del self._profiles[profile.thread_id]
+            # The sampler may still hold the old Counter from its last sweep
+            profile.samples = Counter(profile.samples)
+        profile.duration = time.perf_counter() - profile.started
+        return profile
+
+    def _run(self):
+        while True:
+            with self._lock:
+                profiles = list(self._profiles.items())
+                if not profiles:
+                    self._wake.clear()
+            if not profiles:
+                self._wake.wait()
+                continue
+            frames = sys._current_frames()
+            stacks = [
+                (thread_id, profile, _stack(frames[thread_id]))
+                for thread_id, profile in profiles if thread_id in frames
+            ]
+            del frames
+            # Stacks are walked outside the lock, but only counted while still sampled
+            with self._lock:
+                for thread_id, profile, stack in stacks:
+                    if self._profiles.get(thread_id) is profile:
+                        profile.samples[stack] += 1
+            time.sleep(self.interval)
+
+
+def _stack(frame):
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append((code.co_qualname, code.co_filename, code.co_firstlineno))
+        frame = frame.f_back
+    stack.reverse()
+    return tuple(stack)
+
+
+def _frame_name(entry):
+    name, filename, line = entry
+    return f'{name} ({os.path.basename(filename)}:{line})'
+
+
+def collapsed(profile):
+    """Return the samples in the collapsed stack format, one ``frame;frame;... count`` per line."""
+    return ''.join(
+        ';'.join(_frame_name(entry) for entry in stack) + f' {count}\n'
+        for stack, count in profile.samples.most_common()
+    )
+
+
+def speedscope(profile, name, interval):
+    """Return the samples as a speedscope sampled profile."""
+    frames, index = [], {}
+    samples, weights = [], []
+    for stack, count in profile.samples.items():
+        sample = []
+        for entry in stack:
+            if entry not in index:
+                index[entry] = len(frames)
+                frames.append({'name': entry[0], 'file': entry[1], 'line': entry[2]})
+            sample.append(index[entry])
+        samples.append(sample)
+        weights.append(count * interval * 1000)
+    return {
+        '$schema': 'https://www.speedscope.app/file-format-schema.json',
+        'name': name,
+        'exporter': 'app.utils.profiler',
+        'shared': {'frames': frames},
+        'profiles': [{
+            'type': 'sampled',
+            'name': name,
+            'unit': 'milliseconds',
+            'startValue': 0,
+            'endValue': profile.duration * 1000,
+            'samples': samples,
+            'weights': weights,
+        }],
+    }
+
+
+def _serializer(app):
+    return URLSafeTimedSerializer(app.config['SECRET_KEY'], salt='profile')
+
+
+def make_profile_token(app):
+    """Return a signed token that turns on profiling for requests sending it in X-Profile."""
+    return _serializer(app).dumps('profile')
+
+
+def _wants_profile():
+    token = request.headers.get(PROFILE_HEADER)
+    if token:
+        try:
+            _serializer(current_app).loads(token, max_age=current_app.config['PROFILE_TOKEN_MAX_AGE'])
+            return True
+        except BadSignature:
+            return False
+    rate = current_app.config['PROFILE_SAMPLE_RATE']
+    return rate > 0 and random.random() < rate
+
+
+def _start_profile():
+    if _wants_profile():
+        g._profile = current_app.extensions['profiler'].start(threading.get_ident())
+
+
+def _finish_profile(response):
+    profile = g.pop('_profile', None)
+    if profile is None:
+        return response
+    current_app.extensions['profiler'].stop(profile)
+    if profile.samples:
+        save_profile(profile, request.method, request.endpoint or 'unmatched', response.status_code)
+    return response
+
+
+def _forget_profile(exc=None):
+    # Requests that failed before after_request must not stay sampled. A
+    # copy of the request context torn down on another thread (see
+    # app.utils.write_queue) leaves the request's profile running.
+    profile = g.pop('_profile', None)
+    if profile is not None and profile.thread_id == threading.get_ident():
+        current_app.extensions['profiler'].stop(profile)
+
+
+def save_profile(profile, method, endpoint, status):
+    """Write a finished profile to PROFILE_DIR and record it in the index."""
+    config = current_app.config
+    directory = config['PROFILE_DIR']
+    os.makedirs(directory, exist_ok=True)
+    duration_ms = round(profile.duration * 1000, 3)
+    name = f'{time.time_ns() // 1000}-{os.getpid()}-{endpoint}'
+    title = f'{method} {request.path} ({duration_ms} ms)'
+
+    with open(os.path.join(directory, f'{name}.folded'), 'w') as file:
+        file.write(collapsed(profile))
+    with open(os.path.join(directory, f'{name}.speedscope.json'), 'w') as file:
+        json.dump(speedscope(profile, title, config['PROFILE_INTERVAL_MS'] / 1000), file)
+
+    entry = {
+        'name': name,
+        'method': method,
+        'path': request.path,
+        'endpoint': endpoint,
+        'status': status,
+        'duration_ms': duration_ms,
+        'samples': sum(profile.samples.values()),
+        'created_at': int(time.time() * 1000),
+    }
+    # Workers share the index, so it is locked for appends as well as rewrites
+    with open(os.path.join(directory, INDEX_FILE), 'a') as file:
+        fcntl.flock(file, fcntl.LOCK_EX)
+        file.write(json.dumps(entry) + '\n')
+    _prune(directory, config['PROFILE_KEEP'])
+
+
+def _prune(directory, keep):
+    names = sorted(
+        filename[:-len('.folded')] for filename in os.listdir(directory) if filename.endswith('.folded')
+    )
+    removed = names[:-keep]
+    if not removed:
+        return
+    for name in removed:
+        for suffix in ('.folded', '.speedscope.json'):
+            try:
+                os.remove(os.path.join(directory, name + suffix))
+            except FileNotFoundError:
+                pass
+
+    # Drop index entries whose files are gone, so the index stays as small as the directory
+    with open(os.path.join(directory, INDEX_FILE), 'r+') as file:
+        fcntl.flock(file, fcntl.LOCK_EX)
+        lines = [line for line in file if _entry_exists(directory, line)]
+        file.seek(0)
+        file.writelines(lines)
+        file.truncate()
+
+
+def _entry_exists(directory, line):
+    try:
+        name = json.loads(line)['name']
+    except (ValueError, KeyError, TypeError):
+        return False
+    return os.path.exists(os.path.join(directory, f'{name}.folded'))
+
+
+def recent_profiles(limit=None):
+    """Return the index entries of the profiles still on disk, newest first."""
+    directory = current_app.config['PROFILE_DIR']
+    try:
+        with open(os.path.join(directory, INDEX_FILE)) as file:
+            fcntl.flock(file, fcntl.LOCK_SH)
+            lines = file.readlines()
+    except FileNotFoundError:
+        return []
+
+    profiles = []
+    for line in reversed(lines):
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue
+        if os.path.exists(os.path.join(directory, f"{entry['name']}.folded")):
+            profiles.append(entry)
+            if limit is not None and len(profiles) >= limit:
+                break
+    return profiles
+
+
+def init_profiler(app):
+    """Profile selected requests when PROFILE_ENABLED is set."""
+    if not app.config['PROFILE_ENABLED']:
+        return
+    app.extensions['profiler'] = Sampler(app.config['PROFILE_INTERVAL_MS'] / 1000)
+    app.before_request(_start_profile)
+    app.after_request(_finish_profile)
+    app.teardown_request(_forget_profile)
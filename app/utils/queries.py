@@ -0,0 +1,123 @@
+"""SQL query tracking per request.
+
+Every statement run while handling a request is counted and timed, under
+a "shape" that ignores how many values an IN list has. Statements slower
+than SLOW_QUERY_MS are logged as they finish. When a request ends, shapes
+that ran N_PLUS_ONE_THRESHOLD times or more are logged as N+1 suspects:
+the same query issued once per row, where one set-based query would do.
+In debug mode, responses carry a ``Server-Timing`` header with the query
+count and database time.
+
+count_queries() captures the statements run inside a block, for tests to
+hold endpoints to a query budget.
+"""
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from flask import current_app, g, has_app_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# A parenthesized list of bind parameters, in any DBAPI placeholder style
+_PARAMETER_LIST = re.compile(r'\(\s*(?:\?|%s|%\(\w+\)s|:\w+)(?:\s*,\s*(?:\?|%s|%\(\w+\)s|:\w+))*\s*\)')
+
+
+class RequestQueries:
+    """Count, time and shapes of the statements run by one request."""
+
+    __slots__ = ('count', 'duration', 'shapes', 'slow_ms')
+
+    def __init__(self, slow_ms):
+        self.count = 0
+        self.duration = 0.0
+        self.shapes = Counter()
+        self.slow_ms = slow_ms
+
+    def suspects(self, threshold):
+        """Return (shape, times) for the statements repeated at least ``threshold`` times."""
+        return [(shape, times) for shape, times in self.shapes.most_common() if times >= threshold]
+
+
+def statement_shape(statement):
+    """Return a statement with parameter lists collapsed, so IN lists of any length match."""
+    return _PARAMETER_LIST.sub('(?)', ' '.join(statement.split()))
+
+
+def request_queries():
+    """Return the current request's RequestQueries, or None outside a request."""
+    if not has_app_context():
+        return None
+    return g.get('_queries')
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _start_query(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context.query_started = time.perf_counter()
+
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def _end_query(conn, cursor, statement, parameters, context, executemany):
+    queries = request_queries()
+    if queries is None or context is None:
+        return
+    elapsed = time.perf_counter() - context.query_started
+    queries.count += 1
+    queries.duration += elapsed
+    queries.shapes[statement_shape(statement)] += 1
+    if elapsed * 1000 >= queries.slow_ms:
+        current_app.logger.warning('Slow query (%.1f ms): %s', elapsed * 1000, statement)
+
+
+def _start_request():
+    g._queries = RequestQueries(current_app.config['SLOW_QUERY_MS'])
+    g._queries_started = time.perf_counter()
+
+
+def _finish_request(response):
+    queries = request_queries()
+    if queries is None:
+        return response
+
+    for shape, times in queries.suspects(current_app.config['N_PLUS_ONE_THRESHOLD']):
+        current_app.logger.warning('Possible N+1 in %s: %d x %s', request.endpoint, times, shape)
+
+    if current_app.debug:
+        total_ms = (time.perf_counter() - g._queries_started) * 1000
+        response.headers['Server-Timing'] = (
+            f'db;dur={queries.duration * 1000:.2f};desc="{queries.count} queries", total;dur={total_ms:.2f}'
+        )
+    return response
+
+
+def _forget_request(exc=None):
+    g.pop('_queries', None)
+    g.pop('_queries_started', None)
+
+
+def init_query_tracking(app):
+    """Track the queries of every request."""
+    app.before_request(_start_request)
+    app.after_request(_finish_request)
+    app.teardown_request(_forget_request)
+
+
+@contextmanager
+def count_queries():
+    """
+    Capture the SQL statements executed inside the block, from any engine.
+
+    Yields:
+        List that receives each statement as it runs
+    """
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(Engine, 'after_cursor_execute', capture)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, 'after_cursor_execute', capture)
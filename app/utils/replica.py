@@ -0,0 +1,93 @@
+"""Read-replica routing for the GET endpoints.
+
+When SQLALCHEMY_BINDS has a ``replica`` bind, GET and HEAD requests to the
+blueprints in REPLICA_BLUEPRINTS read from it, and everything else (and any
+flush) uses the primary. A client that has just written gets a
+``read_primary_until`` cookie, or can send the same timestamp in the
+``X-Read-Primary-Until`` header, and reads from the primary until it passes,
+so it always sees its own writes despite replication lag.
+
+sync_sqlite() copies one SQLite file onto another and stands in for real
+replication when trying this locally (see ``flask replica sync``).
+"""
+import sqlite3
+import time
+from flask import g, has_app_context, request
+from flask_sqlalchemy.session import Session
+
+REPLICA_BIND = 'replica'
+REPLICA_BLUEPRINTS = frozenset({'employees', 'projects', 'tasks', 'users'})
+STICKY_COOKIE = 'read_primary_until'
+STICKY_HEADER = 'X-Read-Primary-Until'
+
+
+class RoutingSession(Session):
+    """Session reading from the replica bind when the current request allows it."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and reads_from_replica():
+            engine = self._db.engines.get(REPLICA_BIND)
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def reads_from_replica():
+    """Return True when the current request's reads go to the replica."""
+    return has_app_context() and g.get('read_replica', False)
+
+
+def reads_own_writes():
+    """Return True when the current request follows a recent write by the same client."""
+    return has_app_context() and g.get('read_primary', False)
+
+
+def _sticky_until():
+    value = request.headers.get(STICKY_HEADER) or request.cookies.get(STICKY_COOKIE)
+    try:
+        return float(value) if value else 0.0
+    except ValueError:
+        return 0.0
+
+
+def _route_request():
+    g.read_primary = _sticky_until() > time.time()
+    g.read_replica = (
+        request.method in ('GET', 'HEAD')
+        and request.blueprint in REPLICA_BLUEPRINTS
+        and not g.read_primary
+    )
+
+
+def _mark_writes(response, window):
+    if request.method not in ('GET', 'HEAD', 'OPTIONS') and response.status_code < 400:
+        until = f'{time.time() + window:.3f}'
+        response.set_cookie(STICKY_COOKIE, until, max_age=window, httponly=True, samesite='Lax')
+        response.headers[STICKY_HEADER] = until
+    return response
+
+
+def _forget_route(exc=None):
+    g.pop('read_replica', None)
+    g.pop('read_primary', None)
+
+
+def init_read_replica(app):
+    """Route reads to the replica bind, when SQLALCHEMY_BINDS configures one."""
+    if REPLICA_BIND not in (app.config.get('SQLALCHEMY_BINDS') or {}):
+        return
+    window = app.config['READ_REPLICA_STICKY_SECONDS']
+    app.before_request(_route_request)
+    app.after_request(lambda response: _mark_writes(response, window))
+    app.teardown_request(_forget_route)
+
+
+def sync_sqlite(primary_path, replica_path):
+    """Copy a SQLite database onto another file with the online backup API."""
+    source = sqlite3.connect(primary_path)
+    target = sqlite3.connect(replica_path)
+    try:
+        source.backup(target)
+    finally:
+        target.close()
+        source.close()
@@ -0,0 +1,60 @@
+import re
+from flask import current_app
+from sqlalchemy import inspect, literal_column, or_, select, text
+from app import db
+from app.models.fulltext import SEARCH_COLUMNS, fts_table_name
+
+
+def fulltext_enabled(model):
+    """Return True when the model's FTS5 table exists in the current database."""
+    engine = db.engine
+    if engine.dialect.name != 'sqlite':
+        return False
+    
+    # Only positive results are cached, so a later `flask search rebuild` is picked up
+    enabled = current_app.extensions.setdefault('fulltext', set())
+    name = fts_table_name(model)
+    if name not in enabled and inspect(engine).has_table(name):
+        enabled.add(name)
+    return name in enabled
+
+
+def match_expression(term):
+    """Turn free text into an FTS5 query that matches every word as a prefix."""
+    words = re.findall(r'\w+', term)
+    if not words:
+        return None
+    return ' '.join(f'"{word}"*' for word in words)
+
+
+def apply_search(query, model, term):
+    """
+    Restrict a list query to rows matching a search term.
+    
+    Uses the model's FTS5 index when it exists and falls back to ILIKE on
+    the searched columns otherwise.
+    
+    Args:
+        query: Query over ``model``
+        model: Searchable model class (see SEARCH_COLUMNS)
+        term: Search text from the client
+        
+    Returns:
+        Tuple of (filtered query, rank column to order by, or None for the fallback)
+    """
+    expression = match_expression(term)
+    if expression is None or not fulltext_enabled(model):
+        pattern = f'%{term}%'
+        return query.filter(
+            or_(*(getattr(model, column).ilike(pattern) for column in SEARCH_COLUMNS[model]))
+        ), None
+    
+    fts = fts_table_name(model)
+    hits = (
+        select(literal_column('rowid').label('rowid'), literal_column('rank').label('rank'))
+        .select_from(text(fts))
+        .where(text(f'{fts} MATCH :match').bindparams(match=expression))
+        .subquery()
+    )
+    query = query.join(hits, hits.c.rowid == literal_column(f'{model.__tablename__}.rowid'))
+    return query, hits.c.rank
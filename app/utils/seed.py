@@ -0,0 +1,260 @@
+"""Fast synthetic data for local testing at production scale.
+
+Rows are generated in chunks by a pool of worker processes and written by
+the parent with Core executemany inserts, one transaction per table. Each
+chunk draws from its own random generator, seeded from the seed, the table
+and the chunk number, and IDs are derived from the row number, so the data
+only depends on the seed and the sizes, not on the number of workers.
+
+Memberships are skewed the way real organisations are: a few large projects
+hold many employees and most of the tasks, while the long tail has a handful
+each. On SQLite the search triggers are dropped while seeding and the FTS
+indexes rebuilt in one pass at the end, which is much faster than indexing
+row by row.
+"""
+import hashlib
+import itertools
+import multiprocessing
+import os
+import random
+import time
+import uuid
+from sqlalchemy import inspect
+from app import db
+from app.models.employee import Employee
+from app.models.employee_project import EmployeeProject
+from app.models.fulltext import SEARCH_COLUMNS, drop_fts, fts_table_name, rebuild_fts
+from app.models.project import Project
+from app.models.task import Task
+
+# Bump when generated rows change, so cached datasets are rebuilt
+GENERATOR_VERSION = 1
+NOW_MS = 1767225600000  # fixed, so data does not depend on the day it is generated
+YEAR_MS = 365 * 24 * 3600 * 1000
+SQLITE_CACHE_KIB = 512 * 1024  # page cache while seeding, so index pages stay in memory
+
+FIRST_NAMES = ['Ann', 'Ben', 'Chloe', 'David', 'Elena', 'Farid', 'Grace', 'Hiro', 'Ines', 'Jonas',
+               'Kemi', 'Liam', 'Maya', 'Nils', 'Olga', 'Priya', 'Quinn', 'Rosa', 'Sven', 'Tara']
+LAST_NAMES = ['Adams', 'Baker', 'Chen', 'Diaz', 'Evans', 'Fischer', 'Garcia', 'Hansen', 'Ito', 'Jensen',
+              'Kowalski', 'Lee', 'Moreau', 'Novak', 'Okafor', 'Patel', 'Rossi', 'Silva', 'Tanaka', 'Weber']
+PROJECT_WORDS = ['Apollo', 'Borealis', 'Cobalt', 'Delta', 'Ember', 'Falcon', 'Granite', 'Harbor', 'Iris',
+                 'Juniper', 'Kestrel', 'Lumen', 'Meridian', 'Nimbus', 'Orion', 'Pioneer', 'Quartz', 'Redwood']
+PROJECT_KINDS = ['migration', 'redesign', 'rollout', 'audit', 'integration', 'platform', 'launch', 'research']
+TASK_VERBS = ['Write', 'Review', 'Fix', 'Plan', 'Test', 'Deploy', 'Document', 'Refactor', 'Measure', 'Design']
+TASK_OBJECTS = ['login flow', 'billing export', 'search index', 'release notes', 'onboarding email',
+                'API client', 'dashboard', 'data import', 'access review', 'load test', 'style guide']
+TASK_DESCRIPTIONS = [None, 'Details in the project tracker.', 'Agreed in the weekly sync.']
+TASK_LABELS = [None, 'backend', 'frontend', 'ops', 'backend,ops']
+STATUSES = ['pending', 'in_progress', 'completed', 'cancelled']
+STATUS_WEIGHTS = list(itertools.accumulate([30, 20, 45, 5]))
+PRIORITIES = ['low', 'medium', 'high', 'urgent']
+PRIORITY_WEIGHTS = list(itertools.accumulate([25, 45, 22, 8]))
+
+
+class Sizes:
+    """Number of rows to generate per entity."""
+
+    __slots__ = ('employees', 'projects', 'tasks', 'seed')
+
+    def __init__(self, employees, projects, tasks, seed=0):
+        self.employees = employees
+        self.projects = projects
+        self.tasks = tasks
+        self.seed = seed
+
+
+def zipf_weights(count, exponent=1.0):
+    """Cumulative weights making the item at rank r about r**exponent times less likely than the first."""
+    return list(itertools.accumulate(1 / (rank ** exponent) for rank in range(1, count + 1)))
+
+
+def row_id(seed, kind, index):
+    """Return the UUID of the index-th row of a kind, the same in every process."""
+    digest = hashlib.blake2b(f'{seed}:{kind}:{index}'.encode(), digest_size=16).digest()
+    return str(uuid.UUID(bytes=digest, version=4))
+
+
+def _timestamps(rng):
+    created_at = NOW_MS - rng.randrange(YEAR_MS)
+    return created_at, created_at + rng.randrange(NOW_MS - created_at + 1)
+
+
+def _employee_rows(sizes, start, stop, rng):
+    rows = []
+    for index in range(start, stop):
+        created_at, updated_at = _timestamps(rng)
+        rows.append({
+            'id': row_id(sizes.seed, 'employee', index),
+            'name': f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}',
+            'email': f'employee{index}@example.com',
+            'deactivated': updated_at if rng.random() < 0.1 else None,
+            'invited': created_at,
+            'created_at': created_at,
+            'updated_at': updated_at,
+        })
+    return rows
+
+
+def _project_rows(sizes, start, stop, rng):
+    rows = []
+    for index in range(start, stop):
+        created_at, updated_at = _timestamps(rng)
+        word, kind = rng.choice(PROJECT_WORDS), rng.choice(PROJECT_KINDS)
+        rows.append({
+            'id': row_id(sizes.seed, 'project', index),
+            'name': f'{word} {kind} {index}',
+            'description': f'{kind.capitalize()} work for the {word} programme.',
+            'archived': rng.random() < 0.2,
+            'billable': rng.random() < 0.5,
+            'deadline': created_at + rng.randrange(YEAR_MS),
+            'created_at': created_at,
+            'updated_at': updated_at,
+        })
+    return rows
+
+
+def _membership_rows(sizes, start, stop, rng):
+    if not sizes.projects:
+        return []
+    weights = _project_weights(sizes.projects)
+    rows = []
+    for index in range(start, stop):
+        employee_id = row_id(sizes.seed, 'employee', index)
+        # Most employees are on one to three projects, a few on many
+        count = min(int(rng.paretovariate(1.5)), 20, sizes.projects)
+        chosen = rng.choices(range(sizes.projects), cum_weights=weights, k=count)
+        for project in dict.fromkeys(chosen):
+            rows.append({
+                'employee_id': employee_id,
+                'project_id': row_id(sizes.seed, 'project', project),
+                'created_at': NOW_MS,
+            })
+    return rows
+
+
+def _task_rows(sizes, start, stop, rng):
+    if not sizes.projects:
+        return []
+    projects = rng.choices(range(sizes.projects), cum_weights=_project_weights(sizes.projects), k=stop - start)
+    rows = []
+    for index, project in zip(range(start, stop), projects):
+        created_at, updated_at = _timestamps(rng)
+        rows.append({
+            'id': row_id(sizes.seed, 'task', index),
+            'name': f'{rng.choice(TASK_VERBS)} {rng.choice(TASK_OBJECTS)}',
+            'project_id': row_id(sizes.seed, 'project', project),
+            'description': rng.choice(TASK_DESCRIPTIONS),
+            'status': rng.choices(STATUSES, cum_weights=STATUS_WEIGHTS)[0],
+            'priority': rng.choices(PRIORITIES, cum_weights=PRIORITY_WEIGHTS)[0],
+            'labels': rng.choice(TASK_LABELS),
+            'billable': rng.random() < 0.5,
+            'deadline': None if rng.random() < 0.5 else created_at + rng.randrange(YEAR_MS),
+            'created_at': created_at,
+            'updated_at': updated_at,
+        })
+    return rows
+
+
+_weights_cache = {}
+
+
+def _project_weights(count):
+    # Popular projects attract both members and tasks
+    if count not in _weights_cache:
+        _weights_cache[count] = zipf_weights(count)
+    return _weights_cache[count]
+
+
+# table -> (row generator, Sizes attribute with the number of generating rows)
+GENERATORS = {
+    Employee.__tablename__: (_employee_rows, 'employees'),
+    Project.__tablename__: (_project_rows, 'projects'),
+    EmployeeProject.__tablename__: (_membership_rows, 'employees'),  # one chunk of employees at a time
+    Task.__tablename__: (_task_rows, 'tasks'),
+}
+
+
+def _generate_chunk(job):
+    table_name, sizes, start, stop = job
+    generator, _ = GENERATORS[table_name]
+    rng = random.Random(f'{sizes.seed}:{table_name}:{start}')
+    return generator(sizes, start, stop, rng)
+
+
+def _chunks(table_name, sizes, batch_size):
+    total = getattr(sizes, GENERATORS[table_name][1])
+    return [(table_name, sizes, start, min(start + batch_size, total)) for start in range(0, total, batch_size)]
+
+
+def seed_database(engine, sizes, workers=None, batch_size=20000, progress=None):
+    """
+    Fill the employee, project, membership and task tables with generated rows.
+
+    Args:
+        engine: Engine of a database whose tables exist and are empty
+        sizes: Sizes to generate
+        workers: Generating processes, defaults to the CPU count (1 generates in this process)
+        batch_size: Rows per generated chunk and per executemany
+        progress: Optional callback(table name, rows, seconds) called after each table
+
+    Returns:
+        Dict of table name to (rows inserted, seconds)
+    """
+    workers = workers or os.cpu_count() or 1
+    results = {}
+    with engine.connect() as connection:
+        searched = [
+            model for model in SEARCH_COLUMNS
+            if inspect(connection).has_table(fts_table_name(model))
+        ]
+        if connection.dialect.name == 'sqlite':
+            # Nothing is lost on a crash that a new seed would not recreate
+            connection.exec_driver_sql('PRAGMA synchronous = OFF')
+            connection.exec_driver_sql(f'PRAGMA cache_size = -{SQLITE_CACHE_KIB}')
+        # Indexed in one pass at the end rather than row by row
+        for model in searched:
+            drop_fts(connection, model)
+        connection.commit()
+
+        pool = multiprocessing.get_context('fork').Pool(workers) if workers > 1 else None
+        try:
+            for table_name in GENERATORS:
+                started = time.perf_counter()
+                table = db.metadata.tables[table_name]
+                # Secondary indexes are built once from sorted data instead of row by row
+                for index in table.indexes:
+                    index.drop(connection)
+                jobs = _chunks(table_name, sizes, batch_size)
+                chunks = pool.imap(_generate_chunk, jobs) if pool else map(_generate_chunk, jobs)
+                count = 0
+                for rows in chunks:
+                    if rows:
+                        connection.execute(table.insert(), rows)
+                        count += len(rows)
+                for index in table.indexes:
+                    index.create(connection)
+                connection.commit()
+                results[table_name] = (count, time.perf_counter() - started)
+                if progress:
+                    progress(table_name, *results[table_name])
+        except BaseException:
+            # Index what was committed, rather than leave search on the slow fallback
+            connection.rollback()
+            for model in searched:
+                rebuild_fts(connection, model)
+            connection.commit()
+            raise
+        finally:
+            if pool:
+                pool.close()
+                pool.join()
+
+        for model in searched:
+            started = time.perf_counter()
+            rebuild_fts(connection, model)
+            connection.commit()
+            name = fts_table_name(model)
+            results[name] = (None, time.perf_counter() - started)
+            if progress:
+                progress(name, None, results[name][1])
+    return results
@@ -0,0 +1,45 @@
+from flask import Response, current_app, request, stream_with_context
+from app.utils.pagination import sort_order
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+
+def wants_ndjson(query_data):
+    """Return True when the client asked for the list to be streamed as NDJSON."""
+    if query_data.get('stream'):
+        return True
+    return request.accept_mimetypes.best_match(['application/json', NDJSON_MIMETYPE]) == NDJSON_MIMETYPE
+
+
+def stream_ndjson(query, model, schema, rank=None):
+    """
+    Stream every row of a list query as newline-delimited JSON.
+    
+    Rows are read with ``yield_per`` and written out one batch at a time, so
+    peak memory depends on STREAM_BATCH_SIZE rather than on the table size.
+    Rows use the same order as the paginated responses.
+    
+    Args:
+        query: Filtered query over ``model``
+        model: Model class with ``created_at`` and ``id`` columns
+        schema: Single-object response schema used to serialize each row
+        rank: Optional search rank column, see apply_search
+        
+    Returns:
+        Streaming Response with the application/x-ndjson mimetype
+    """
+    batch_size = current_app.config['STREAM_BATCH_SIZE']
+    query = query.order_by(*sort_order(model, rank)).yield_per(batch_size)
+    
+    def generate():
+        dumps = current_app.json.dumps
+        lines = []
+        for row in query:
+            lines.append(dumps(schema.dump(row)) + '\n')
+            if len(lines) >= batch_size:
+                yield ''.join(lines)
+                lines = []
+        if lines:
+            yield ''.join(lines)
+    
+    return Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
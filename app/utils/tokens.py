@@ -0,0 +1,87 @@
+"""Cache of verified JWT claims.
+
+Flask-JWT-Extended verifies the signature and parses the claims of the
+bearer token on every protected request, although clients send the same
+token over and over until it expires. CachingJWTManager remembers the
+claims of tokens it has verified, keyed by a digest of the token, and
+serves them until the token's ``exp``. Expired and unknown tokens, and
+tokens checked against a CSRF value, always go through full verification.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from flask import current_app
+from flask_jwt_extended import JWTManager
+
+
+class TokenCache:
+    """Bounded, thread-safe LRU map of token digest to verified claims."""
+
+    def __init__(self, max_size=1024):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # digest -> (expires_at, claims)
+        self._lock = threading.Lock()
+
+    def get(self, digest):
+        """Return the claims of an unexpired verified token, or None."""
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None or entry[0] <= time.time():
+                if entry is not None:
+                    del self._entries[digest]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(digest)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, digest, claims):
+        """Remember verified claims until the token's ``exp``; tokens without one are not cached."""
+        expires_at = claims.get('exp')
+        if expires_at is None or expires_at <= time.time():
+            return
+        with self._lock:
+            self._entries[digest] = (expires_at, claims)
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Return the hit/miss counters and current size."""
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries)}
+
+
+class CachingJWTManager(JWTManager):
+    """JWTManager that skips verification for tokens it has already verified."""
+
+    def init_app(self, app, add_context_processor=False):
+        super().init_app(app, add_context_processor=add_context_processor)
+        size = app.config['JWT_DECODE_CACHE_SIZE']
+        if size:
+            app.extensions['token_cache'] = TokenCache(max_size=size)
+
+    def _decode_jwt_from_config(self, encoded_token, csrf_value=None, allow_expired=False):
+        cache = current_app.extensions.get('token_cache')
+        if cache is None or csrf_value is not None:
+            return super()._decode_jwt_from_config(encoded_token, csrf_value, allow_expired)
+
+        digest = hashlib.sha256(encoded_token.encode('utf-8')).digest()
+        claims = cache.get(digest)
+        if claims is None:
+            claims = super()._decode_jwt_from_config(encoded_token, csrf_value, allow_expired)
+            cache.set(digest, claims)
+        # Callers get their own copy to modify
+        return dict(claims)
+
+
+def token_cache():
+    """Return the current app's TokenCache, or None when it is disabled."""
+    return current_app.extensions.get('token_cache')
@@ -0,0 +1,173 @@
+"""Single-writer queue with group commit, for SQLite deployments.
+
+SQLite allows one writer at a time, so concurrent write requests in the
+same process mostly wait on each other's locks. With WRITE_QUEUE_ENABLED,
+views decorated with ``serialized_write`` are handed to one writer thread
+instead. It takes every request waiting in the queue (up to
+WRITE_QUEUE_MAX_BATCH), runs them one after another inside a single
+``BEGIN IMMEDIATE`` transaction and commits once for the whole batch.
+
+Each view runs in a copy of its request context with its own session,
+joined to the batch transaction through a SAVEPOINT: the view's commit
+releases the savepoint and its rollback undoes only its own changes. The
+view's response is returned to the waiting request once the batch has
+committed. Reads are not queued and keep running concurrently under WAL.
+
+Each process has its own writer; across processes, writers still take
+turns on the database lock (see SQLITE_BUSY_TIMEOUT).
+"""
+import functools
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from flask import current_app, g
+from flask.globals import request_ctx
+from sqlalchemy.orm import Session
+from app import db
+
+
+class _Job:
+    __slots__ = ('view', 'args', 'kwargs', 'context', 'globals', 'future', 'queued_at')
+
+    def __init__(self, view, args, kwargs):
+        self.view = view
+        self.args = args
+        self.kwargs = kwargs
+        self.context = request_ctx.copy()
+        self.globals = dict(vars(g))  # e.g. the verified JWT
+        self.future = Future()
+        self.queued_at = time.perf_counter()
+
+
+class WriteQueue:
+    """Runs queued write views on one thread, committing them in batches."""
+
+    def __init__(self, app, max_batch=32):
+        self.app = app
+        self.max_batch = max_batch
+        self.jobs = 0
+        self.batches = 0
+        self.largest_batch = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _ensure_writer(self):
+        # Started on first use, and again in a forked worker, where threads do not survive
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._queue = queue.SimpleQueue()
+                    self._thread = threading.Thread(target=self._run, name='write-queue', daemon=True)
+                    self._thread.start()
+                    self._pid = os.getpid()
+
+    def submit(self, view, args, kwargs):
+        """Queue a view call from a request thread and return its response once committed."""
+        if threading.current_thread() is self._thread:
+            # A view queued from another queued view runs within the current batch
+            return view(*args, **kwargs)
+        self._ensure_writer()
+        job = _Job(view, args, kwargs)
+        self._queue.put(job)
+        return job.future.result()
+
+    def stats(self):
+        """Return the batch and queue wait counters."""
+        return {
+            'jobs': self.jobs,
+            'batches': self.batches,
+            'mean_batch_size': round(self.jobs / self.batches, 2) if self.batches else 0,
+            'max_batch_size': self.largest_batch,
+            'mean_wait_ms': round(self.wait_seconds_total / self.jobs * 1000, 3) if self.jobs else 0,
+            'max_wait_ms': round(self.wait_seconds_max * 1000, 3),
+            'queued': self._queue.qsize()
+        }
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._run_batch(batch)
+
+    def _run_batch(self, batch):
+        started = time.perf_counter()
+        self.batches += 1
+        self.jobs += len(batch)
+        self.largest_batch = max(self.largest_batch, len(batch))
+        for job in batch:
+            wait = started - job.queued_at
+            self.wait_seconds_total += wait
+            self.wait_seconds_max = max(self.wait_seconds_max, wait)
+
+        # Cache entries written by the batch are dropped after the real commit
+        written = set()
+        results = []
+        try:
+            with self.app.app_context():
+                engine = db.engine
+            with engine.connect() as connection:
+                if engine.dialect.name == 'sqlite':
+                    # Take the write lock up front rather than on the first write
+                    connection.exec_driver_sql('BEGIN IMMEDIATE')
+                for job in batch:
+                    results.append(self._run_job(job, connection, written))
+                connection.commit()
+        except Exception as err:
+            for job in batch:
+                job.future.set_exception(err)
+            return
+        finally:
+            if written:
+                cache = self.app.extensions.get('entity_cache')
+                if cache is not None:
+                    cache.invalidate(written)
+
+        for job, (response, error) in zip(batch, results):
+            if error is not None:
+                job.future.set_exception(error)
+            else:
+                job.future.set_result(response)
+
+    def _run_job(self, job, connection, written):
+        with job.context:
+            vars(g).update(job.globals)
+            session = Session(bind=connection, join_transaction_mode='create_savepoint')
+            session.info['entity_cache_deferred'] = written
+            db.session.registry.set(session)
+            try:
+                return job.view(*job.args, **job.kwargs), None
+            except Exception as err:
+                session.rollback()
+                return None, err
+
+
+def init_write_queue(app):
+    """Attach a WriteQueue to the app when WRITE_QUEUE_ENABLED is set; its thread starts on first use."""
+    if app.config['WRITE_QUEUE_ENABLED']:
+        app.extensions['write_queue'] = WriteQueue(app, max_batch=app.config['WRITE_QUEUE_MAX_BATCH'])
+
+
+def write_queue():
+    """Return the current app's WriteQueue, or None when writes are not queued."""
+    return current_app.extensions.get('write_queue')
+
+
+def serialized_write(view):
+    """Run a write view through the app's WriteQueue, when one is enabled."""
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        writer = write_queue()
+        if writer is None:
+            return view(*args, **kwargs)
+        return writer.submit(view, args, kwargs)
+    return wrapper
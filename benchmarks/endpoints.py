@@ -0,0 +1,395 @@
+"""Time every list, get, create, update and membership endpoint on a synthetic dataset.
+
+Requests go through the Flask test client against a SQLite file filled by
+app.utils.seed, the generator behind ``flask seed`` (cached in
+instance/benchmarks and copied for each run, so writes never leak into the
+next run). For each endpoint the run records
+latency percentiles, SQL statements per request and the peak memory
+allocated per request (measured in a separate tracemalloc pass, so tracing
+does not slow the timed requests).
+
+Run from the repository root:
+
+    python -m benchmarks.endpoints --scale realistic --output baseline.json
+    python -m benchmarks.endpoints --scale realistic --baseline baseline.json [--threshold 0.2]
+
+With --baseline, the run exits with status 1 when an endpoint's p50 or p95
+latency, query count or allocation peak got worse than the baseline's by
+more than the threshold. p99 is reported but not compared, it is too noisy
+at a few hundred requests.
+"""
+import argparse
+import datetime
+import fnmatch
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import sqlalchemy
+from flask_jwt_extended import create_access_token
+from app.utils.seed import FIRST_NAMES, GENERATOR_VERSION, PROJECT_WORDS, Sizes, seed_database
+from config import ProductionConfig, basedir, config, engine_options, sqlite_pragmas
+
+DATASET_DIR = os.path.join(basedir, 'instance', 'benchmarks')
+
+# employees, projects, tasks
+SCALES = {
+    'small': (1000, 100, 10000),
+    'medium': (5000, 500, 50000),
+    'realistic': (20000, 2000, 200000),
+}
+
+# Compared against the baseline; p99 and mean are informational
+GATED = ('p50_ms', 'p95_ms', 'queries', 'alloc_peak_bytes')
+MIN_LATENCY_DELTA_MS = 0.5  # smaller slowdowns are timer noise, whatever the ratio
+MIN_ALLOC_DELTA_BYTES = 16384
+
+
+class State:
+    """IDs of the dataset, and what earlier benchmark requests created."""
+
+    def __init__(self, connection, seed):
+        from app.models.employee import Employee
+        from app.models.employee_project import EmployeeProject
+        from app.models.project import Project
+        from app.models.task import Task
+
+        self.rng = random.Random(seed)
+        self.employee_ids = connection.execute(sqlalchemy.select(Employee.id)).scalars().all()
+        self.active_employee_ids = connection.execute(
+            sqlalchemy.select(Employee.id).where(Employee.deactivated.is_(None))
+        ).scalars().all()
+        self.project_ids = connection.execute(sqlalchemy.select(Project.id)).scalars().all()
+        self.task_ids = connection.execute(sqlalchemy.select(Task.id)).scalars().all()
+        self.memberships = set(connection.execute(
+            sqlalchemy.select(EmployeeProject.project_id, EmployeeProject.employee_id)
+        ).all())
+        self.largest_project_id = connection.execute(
+            sqlalchemy.select(EmployeeProject.project_id)
+            .group_by(EmployeeProject.project_id)
+            .order_by(sqlalchemy.func.count().desc())
+            .limit(1)
+        ).scalar()
+        self.rng.shuffle(self.active_employee_ids)
+        self.added = []  # memberships added by projects.add_employee, removed again by remove_employee
+        self.counter = 0
+
+    def unique(self):
+        self.counter += 1
+        return self.counter
+
+    def employee(self):
+        return self.rng.choice(self.employee_ids)
+
+    def project(self):
+        return self.rng.choice(self.project_ids)
+
+    def task(self):
+        return self.rng.choice(self.task_ids)
+
+    def new_membership(self):
+        while True:
+            pair = (self.project(), self.employee())
+            if pair not in self.memberships:
+                self.memberships.add(pair)
+                self.added.append(pair)
+                return pair
+
+    def existing_membership(self):
+        pair = self.added.pop() if self.added else self.memberships.pop()
+        self.memberships.discard(pair)
+        return pair
+
+
+class Case:
+    """One endpoint to time; ``request`` builds (method, path, json body) from the State."""
+
+    __slots__ = ('name', 'request', 'expect')
+
+    def __init__(self, name, request, expect=200):
+        self.name = name
+        self.request = request
+        self.expect = expect
+
+
+def _employee_body(state):
+    number = state.unique()
+    return {'name': f'Bench Employee {number}', 'email': f'bench{number}@example.com', 'invited': 1767225600000}
+
+
+def _project_body(state):
+    return {'name': f'Bench project {state.unique()}', 'description': 'Created by the benchmarks', 'billable': True}
+
+
+def _task_body(state):
+    return {'name': f'Bench task {state.unique()}', 'project_id': state.project(), 'priority': 'high'}
+
+
+def _add_employee(project_id, employee_id):
+    return 'POST', f'/api/v1/project/{project_id}/employees', {'employee_id': employee_id}
+
+
+def _remove_employee(project_id, employee_id):
+    return 'DELETE', f'/api/v1/project/{project_id}/employees/{employee_id}', None
+
+
+CASES = [
+    Case('employees.list', lambda s: ('GET', '/api/v1/employee/', None)),
+    Case('employees.list_active', lambda s: ('GET', '/api/v1/employee/?active_only=true&per_page=100', None)),
+    Case('employees.search', lambda s: ('GET', f'/api/v1/employee/?search={s.rng.choice(FIRST_NAMES)}', None)),
+    Case('employees.get', lambda s: ('GET', f'/api/v1/employee/{s.employee()}', None)),
+    Case('employees.create', lambda s: ('POST', '/api/v1/employee/', _employee_body(s)), expect=201),
+    Case('employees.update', lambda s: ('PUT', f'/api/v1/employee/{s.employee()}', {'name': f'Renamed {s.unique()}'})),
+    Case('employees.deactivate', lambda s: ('POST', f'/api/v1/employee/deactivate/{s.active_employee_ids.pop()}', None)),
+    Case('projects.list', lambda s: ('GET', '/api/v1/project/', None)),
+    Case('projects.list_billable', lambda s: ('GET', '/api/v1/project/?billable_only=true&active_only=true&per_page=100', None)),
+    Case('projects.search', lambda s: ('GET', f'/api/v1/project/?search={s.rng.choice(PROJECT_WORDS)}', None)),
+    Case('projects.get', lambda s: ('GET', f'/api/v1/project/{s.project()}', None)),
+    Case('projects.get_largest', lambda s: ('GET', f'/api/v1/project/{s.largest_project_id}', None)),
+    Case('projects.create', lambda s: ('POST', '/api/v1/project/', _project_body(s)), expect=201),
+    Case('projects.update', lambda s: ('PUT', f'/api/v1/project/{s.project()}', {'description': f'Revision {s.unique()}'})),
+    Case('tasks.list', lambda s: ('GET', '/api/v1/task/', None)),
+    Case('tasks.list_by_project', lambda s: ('GET', f'/api/v1/task/?project_id={s.project()}', None)),
+    Case('tasks.list_by_status', lambda s: ('GET', '/api/v1/task/?status=pending&per_page=100', None)),
+    Case('tasks.list_by_employee', lambda s: ('GET', f'/api/v1/task/?employee_id={s.employee()}', None)),
+    Case('tasks.search', lambda s: ('GET', '/api/v1/task/?search=login', None)),
+    Case('tasks.get', lambda s: ('GET', f'/api/v1/task/{s.task()}', None)),
+    Case('tasks.create', lambda s: ('POST', '/api/v1/task/', _task_body(s)), expect=201),
+    Case('tasks.update', lambda s: ('PUT', f'/api/v1/task/{s.task()}', {'status': s.rng.choice(['pending', 'completed'])})),
+    # Membership cases change who is on which project, so they run last
+    Case('projects.add_employee', lambda s: _add_employee(*s.new_membership())),
+    Case('projects.remove_employee', lambda s: _remove_employee(*s.existing_membership())),
+    Case('projects.update_employees', lambda s: (
+        'PUT', f'/api/v1/project/{s.project()}', {'employees': s.rng.sample(s.employee_ids, 5)}
+    )),
+    Case('employees.update_projects', lambda s: (
+        'PUT', f'/api/v1/employee/{s.employee()}', {'projects': s.rng.sample(s.project_ids, 3)}
+    )),
+]
+
+
+def dataset_path(employees, projects, tasks, seed):
+    """Return the cached dataset for these sizes, building it first if needed."""
+    path = os.path.join(DATASET_DIR, f'dataset-v{GENERATOR_VERSION}-{employees}-{projects}-{tasks}-{seed}.db')
+    if not os.path.exists(path):
+        os.makedirs(DATASET_DIR, exist_ok=True)
+        print(f'Building {path} ...', file=sys.stderr)
+        partial = f'{path}.partial'
+        if os.path.exists(partial):
+            os.remove(partial)
+        engine = sqlalchemy.create_engine(f'sqlite:///{partial}')
+        from app import db
+        db.metadata.create_all(engine)
+        seed_database(engine, Sizes(employees, projects, tasks, seed))
+        engine.dispose()
+        os.replace(partial, path)
+    return path
+
+
+def make_app(database_path):
+    """Create the app in its production configuration on the given SQLite file."""
+    from app import create_app
+
+    database_uri = f'sqlite:///{database_path}'
+
+    class BenchmarkConfig(ProductionConfig):
+        SQLALCHEMY_DATABASE_URI = database_uri
+        SQLALCHEMY_ENGINE_OPTIONS = engine_options(database_uri)
+        SQLITE_PRAGMAS = sqlite_pragmas(database_uri)
+        SQLALCHEMY_BINDS = {}
+        BCRYPT_ROUNDS = 4
+        METRICS_DIR = None
+        # The benchmarks measure allocations themselves
+        MEMORY_TRACKING_ENABLED = False
+        PROFILE_ENABLED = False
+
+    config['benchmark'] = BenchmarkConfig
+    return create_app('benchmark')
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of already sorted values."""
+    index = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def run_case(client, headers, case, state, requests, warmup, alloc_requests):
+    """Time one case and return its result dict."""
+    from app.utils.queries import count_queries
+
+    method = path = None
+    timings, queries, errors = [], [], 0
+    for index in range(warmup + requests):
+        method, path, body = case.request(state)
+        with count_queries() as statements:
+            started = time.perf_counter()
+            response = client.open(path, method=method, json=body, headers=headers)
+            elapsed = time.perf_counter() - started
+        if response.status_code != case.expect:
+            errors += 1
+        if index >= warmup:
+            timings.append(elapsed * 1000)
+            queries.append(len(statements))
+
+    peaks = []
+    for _ in range(alloc_requests):
+        method_, path_, body = case.request(state)
+        tracemalloc.start()
+        try:
+            client.open(path_, method=method_, json=body, headers=headers)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+
+    timings.sort()
+    return {
+        'method': method,
+        'example_path': path,
+        'requests': requests,
+        'errors': errors,
+        'p50_ms': round(percentile(timings, 0.50), 3),
+        'p95_ms': round(percentile(timings, 0.95), 3),
+        'p99_ms': round(percentile(timings, 0.99), 3),
+        'mean_ms': round(statistics.fmean(timings), 3),
+        'max_ms': round(timings[-1], 3),
+        'queries': round(statistics.fmean(queries), 2),
+        'alloc_peak_bytes': int(statistics.median(peaks)) if peaks else None,
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare results with a baseline run.
+
+    Returns:
+        List of human readable regressions, empty when none of the GATED metrics regressed
+    """
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        for metric in GATED:
+            current, before = result.get(metric), previous.get(metric)
+            if current is None or before is None:
+                continue
+            if metric == 'queries':
+                # Statement counts are deterministic: any extra query is a regression
+                worse = current > before + 0.5
+            else:
+                minimum = MIN_ALLOC_DELTA_BYTES if metric == 'alloc_peak_bytes' else MIN_LATENCY_DELTA_MS
+                worse = current > before * (1 + threshold) and current - before > minimum
+            if worse:
+                change = f'+{(current / before - 1) * 100:.0f}%' if before else 'new'
+                regressions.append(f'{name} {metric}: {before} -> {current} ({change})')
+    return regressions
+
+
+def print_results(results):
+    print(f"{'endpoint':<28} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'queries':>8} {'alloc KiB':>10} {'errors':>7}")
+    for name, result in results.items():
+        alloc = result['alloc_peak_bytes']
+        alloc = f'{alloc / 1024:.0f}' if alloc is not None else '-'
+        print(f"{name:<28} {result['p50_ms']:>8.2f} {result['p95_ms']:>8.2f} {result['p99_ms']:>8.2f} "
+              f"{result['queries']:>8.1f} {alloc:>10} {result['errors']:>7}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scale', choices=SCALES, default='small', help='preset dataset size')
+    parser.add_argument('--employees', type=int, help='override the number of employees')
+    parser.add_argument('--projects', type=int, help='override the number of projects')
+    parser.add_argument('--tasks', type=int, help='override the number of tasks')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--requests', type=int, default=200, help='timed requests per endpoint')
+    parser.add_argument('--warmup', type=int, default=20, help='untimed requests per endpoint first')
+    parser.add_argument('--alloc-requests', type=int, default=5, help='requests per endpoint traced for allocations')
+    parser.add_argument('--cases', default='*', help='only run endpoints matching this pattern, e.g. "tasks.*"')
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    parser.add_argument('--baseline', help='results JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2, help='allowed relative regression (0.2 = 20%%)')
+    args = parser.parse_args()
+
+    employees, projects, tasks = (
+        default if override is None else override
+        for default, override in zip(SCALES[args.scale], (args.employees, args.projects, args.tasks))
+    )
+    source = dataset_path(employees, projects, tasks, args.seed)
+    workdir = tempfile.mkdtemp(prefix='benchmarks-')
+    try:
+        database_path = os.path.join(workdir, 'bench.db')
+        shutil.copyfile(source, database_path)
+        app = make_app(database_path)
+        from app import db
+
+        with app.app_context():
+            headers = {'Authorization': f"Bearer {create_access_token(identity='1')}"}
+            with db.engine.connect() as connection:
+                state = State(connection, args.seed)
+            db.engine.dispose()
+
+        client = app.test_client()
+        results = {}
+        for case in CASES:
+            if not fnmatch.fnmatch(case.name, args.cases):
+                continue
+            results[case.name] = run_case(
+                client, headers, case, state, args.requests, args.warmup, args.alloc_requests
+            )
+            print(f'{case.name}: p50 {results[case.name]["p50_ms"]:.2f} ms', file=sys.stderr)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        'meta': {
+            'created_at': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+            'employees': employees,
+            'projects': projects,
+            'tasks': tasks,
+            'seed': args.seed,
+            'requests': args.requests,
+            'warmup': args.warmup,
+            'python': platform.python_version(),
+            'sqlalchemy': sqlalchemy.__version__,
+            'platform': platform.platform(),
+        },
+        'results': results,
+    }
+    print_results(results)
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+            file.write('\n')
+
+    failed = False
+    errors = [name for name, result in results.items() if result['errors']]
+    if errors:
+        print(f"\nUnexpected status codes from: {', '.join(errors)}")
+        failed = True
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        sizes_then = tuple(baseline['meta'].get(key) for key in ('employees', 'projects', 'tasks', 'seed'))
+        if sizes_then != (employees, projects, tasks, args.seed):
+            print(f'\nWarning: the baseline was measured on another dataset {sizes_then}')
+        regressions = compare(results, baseline['results'], args.threshold)
+        if regressions:
+            print(f'\nRegressions over {args.threshold:.0%} against {args.baseline}:')
+            for line in regressions:
+                print(f'  {line}')
+            failed = True
+        else:
+            print(f'\nNo regressions over {args.threshold:.0%} against {args.baseline}')
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,532 @@
+"""Load generator for a running server, with a consistency check afterwards.
+
+Replays a weighted mix of auth, employee, project and task operations at a
+target request rate. Requests are sent on a schedule, open loop: when the
+server falls behind, requests are not delayed to match it, and latency is
+measured from the time each request was due, so overload shows up in the
+percentiles instead of being hidden by a slower send rate.
+
+Each run registers its own user, creates a working set of employees,
+projects and tasks through the bulk endpoints, then sends the mix. Once the
+run ends, every project's employees are compared with the employees
+listing that project, and every task created by the run with its project,
+to catch broken bidirectional membership updates.
+
+Run from the repository root against a started server, or let it start
+serve.py on a temporary database:
+
+    python -m benchmarks.load --url http://127.0.0.1:5000 --rps 100 --duration 30
+    python -m benchmarks.load --serve --workers 4 --rps 200 --mix 'tasks.*=5,auth.login=1'
+"""
+import argparse
+import fnmatch
+import http.client
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from app.utils.seed import FIRST_NAMES, LAST_NAMES, PROJECT_KINDS, PROJECT_WORDS, TASK_OBJECTS, TASK_VERBS
+
+PASSWORD = 'load-test-password'
+
+
+class Session:
+    """JSON over HTTP to one server, one connection per request."""
+
+    def __init__(self, url, timeout):
+        parsed = urllib.parse.urlsplit(url)
+        self.host = parsed.hostname
+        self.port = parsed.port or 80
+        self.timeout = timeout
+        self.headers = {'Content-Type': 'application/json'}
+
+    def request(self, method, path, body=None, headers=None):
+        """Send a request and return (status, decoded JSON body or None); status 0 on connection errors."""
+        connection = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        try:
+            payload = None if body is None else json.dumps(body)
+            connection.request(method, path, payload, {**self.headers, **(headers or {})})
+            response = connection.getresponse()
+            data = response.read()
+        except (OSError, http.client.HTTPException):
+            return 0, None
+        finally:
+            connection.close()
+        try:
+            return response.status, json.loads(data) if data else None
+        except ValueError:
+            return response.status, None
+
+
+class Pool:
+    """IDs the operations pick from; grows as the run creates rows."""
+
+    def __init__(self):
+        self.employees = []
+        self.projects = []
+        self.tasks = []
+        self.memberships = set()  # (project, employee) pairs added by projects.add_employee
+        self.lock = threading.Lock()
+
+    def add_membership(self, pair):
+        with self.lock:
+            self.memberships.add(pair)
+
+    def take_membership(self):
+        with self.lock:
+            return self.memberships.pop() if self.memberships else None
+
+
+def _employee(rng):
+    return {
+        'name': f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}',
+        'email': f'load-{rng.getrandbits(64)}@example.com',
+        'invited': int(time.time() * 1000)
+    }
+
+
+def _project_name(rng):
+    return f'{rng.choice(PROJECT_WORDS)} {rng.choice(PROJECT_KINDS)} {rng.getrandbits(32)}'
+
+
+def _task_name(rng):
+    return f'{rng.choice(TASK_VERBS)} {rng.choice(TASK_OBJECTS)}'
+
+
+# Each operation returns the response status; `ok` lists the statuses that are not errors
+def login(session, pool, rng, email):
+    return session.request('POST', '/api/auth/login', {'email': email, 'password': PASSWORD})[0]
+
+
+def me(session, pool, rng, email):
+    return session.request('GET', '/api/auth/me')[0]
+
+
+def list_employees(session, pool, rng, email):
+    return session.request('GET', '/api/v1/employee/?per_page=50')[0]
+
+
+def get_employee(session, pool, rng, email):
+    return session.request('GET', f'/api/v1/employee/{rng.choice(pool.employees)}')[0]
+
+
+def create_employee(session, pool, rng, email):
+    status, body = session.request('POST', '/api/v1/employee/', _employee(rng))
+    if status == 201:
+        pool.employees.append(body['employee']['id'])
+    return status
+
+
+def update_employee(session, pool, rng, email):
+    return session.request('PUT', f'/api/v1/employee/{rng.choice(pool.employees)}', {'name': f'Renamed {rng.random()}'})[0]
+
+
+def update_employee_projects(session, pool, rng, email):
+    projects = rng.sample(pool.projects, min(3, len(pool.projects)))
+    return session.request('PUT', f'/api/v1/employee/{rng.choice(pool.employees)}', {'projects': projects})[0]
+
+
+def list_projects(session, pool, rng, email):
+    return session.request('GET', '/api/v1/project/?per_page=50')[0]
+
+
+def get_project(session, pool, rng, email):
+    return session.request('GET', f'/api/v1/project/{rng.choice(pool.projects)}')[0]
+
+
+def create_project(session, pool, rng, email):
+    employees = rng.sample(pool.employees, min(3, len(pool.employees)))
+    status, body = session.request('POST', '/api/v1/project/', {
+        'name': _project_name(rng), 'employees': employees
+    })
+    if status == 201:
+        pool.projects.append(body['project']['id'])
+    return status
+
+
+def add_project_employee(session, pool, rng, email):
+    pair = (rng.choice(pool.projects), rng.choice(pool.employees))
+    status = session.request('POST', f'/api/v1/project/{pair[0]}/employees', {'employee_id': pair[1]})[0]
+    if status == 200:
+        pool.add_membership(pair)
+    return status
+
+
+def remove_project_employee(session, pool, rng, email):
+    pair = pool.take_membership()
+    if pair is None:
+        return add_project_employee(session, pool, rng, email)
+    return session.request('DELETE', f'/api/v1/project/{pair[0]}/employees/{pair[1]}')[0]
+
+
+def update_project_employees(session, pool, rng, email):
+    employees = rng.sample(pool.employees, min(5, len(pool.employees)))
+    return session.request('PUT', f'/api/v1/project/{rng.choice(pool.projects)}', {'employees': employees})[0]
+
+
+def list_tasks(session, pool, rng, email):
+    return session.request('GET', f'/api/v1/task/?project_id={rng.choice(pool.projects)}')[0]
+
+
+def get_task(session, pool, rng, email):
+    return session.request('GET', f'/api/v1/task/{rng.choice(pool.tasks)}')[0]
+
+
+def create_task(session, pool, rng, email):
+    status, body = session.request('POST', '/api/v1/task/', {
+        'name': _task_name(rng), 'project_id': rng.choice(pool.projects)
+    })
+    if status == 201:
+        pool.tasks.append(body['task']['id'])
+    return status
+
+
+def update_task(session, pool, rng, email):
+    status = rng.choice(['pending', 'in_progress', 'completed'])
+    return session.request('PUT', f'/api/v1/task/{rng.choice(pool.tasks)}', {'status': status})[0]
+
+
+# name -> (function, default weight, statuses that are not errors)
+OPERATIONS = {
+    'auth.login': (login, 1, {200}),
+    'auth.me': (me, 2, {200}),
+    'employees.list': (list_employees, 8, {200}),
+    'employees.get': (get_employee, 10, {200}),
+    'employees.create': (create_employee, 2, {201}),
+    'employees.update': (update_employee, 2, {200}),
+    'employees.update_projects': (update_employee_projects, 1, {200}),
+    'projects.list': (list_projects, 6, {200}),
+    'projects.get': (get_project, 8, {200}),
+    'projects.create': (create_project, 1, {201}),
+    # Concurrent membership changes make conflicts and misses expected outcomes
+    'projects.add_employee': (add_project_employee, 2, {200, 409}),
+    'projects.remove_employee': (remove_project_employee, 2, {200, 404, 409}),
+    'projects.update_employees': (update_project_employees, 1, {200}),
+    'tasks.list': (list_tasks, 10, {200}),
+    'tasks.get': (get_task, 10, {200}),
+    'tasks.create': (create_task, 3, {201}),
+    'tasks.update': (update_task, 3, {200}),
+}
+
+
+def parse_mix(spec):
+    """
+    Parse a mix such as ``'tasks.*=5,auth.login=1'`` into operation weights.
+
+    Operations not matched by any pattern are left out; without a spec the
+    default weights are used.
+    """
+    if not spec:
+        return {name: weight for name, (_, weight, _) in OPERATIONS.items()}
+    weights = {}
+    for part in spec.split(','):
+        pattern, _, weight = part.partition('=')
+        matched = [name for name in OPERATIONS if fnmatch.fnmatch(name, pattern.strip())]
+        if not matched:
+            raise ValueError(f'No operation matches {pattern!r}')
+        for name in matched:
+            weights[name] = float(weight or 1)
+    return weights
+
+
+def setup(session, pool, args, rng):
+    """Register the run's user and create its working set; returns the user's email."""
+    email = f'load-{rng.getrandbits(64)}@example.com'
+    status, body = session.request('POST', '/api/auth/register', {
+        'name': 'Load Test', 'email': email, 'password': PASSWORD, 'confirm_password': PASSWORD
+    })
+    if status != 201:
+        raise SystemExit(f'Registering the load test user failed: {status} {body}')
+    session.headers['Authorization'] = f"Bearer {body['access_token']}"
+
+    def bulk(path, key, items):
+        for start in range(0, len(items), 500):
+            status, body = session.request('POST', path, items[start:start + 500])
+            if status != 201:
+                raise SystemExit(f'Creating the working set failed at {path}: {status} {body}')
+            yield from (item['id'] for item in body[key])
+
+    pool.employees.extend(bulk('/api/v1/employee/bulk', 'employees', [
+        _employee(rng) for _ in range(args.employees)
+    ]))
+    pool.projects.extend(bulk('/api/v1/project/bulk', 'projects', [
+        {'name': _project_name(rng), 'employees': rng.sample(pool.employees, min(5, len(pool.employees)))}
+        for _ in range(args.projects)
+    ]))
+    pool.tasks.extend(bulk('/api/v1/task/bulk', 'tasks', [
+        {'name': _task_name(rng), 'project_id': rng.choice(pool.projects)} for _ in range(args.tasks)
+    ]))
+    return email
+
+
+class Recorder:
+    """Latencies and outcomes of the requests sent, with periodic summaries."""
+
+    def __init__(self):
+        self.records = []  # (operation, due, finished, status, ok)
+        self.timeline = []  # one summary per report interval
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.elapsed = None
+
+    def record(self, operation, due, status, ok):
+        finished = time.perf_counter()
+        with self.lock:
+            self.records.append((operation, due, finished, status, ok))
+            self.in_flight -= 1
+
+
+def percentiles(latencies):
+    """Return p50, p95 and p99 in milliseconds, nearest rank."""
+    if not latencies:
+        return 0.0, 0.0, 0.0
+    ordered = sorted(latencies)
+    pick = lambda fraction: ordered[max(0, min(len(ordered) - 1, round(fraction * len(ordered)) - 1))] * 1000
+    return pick(0.50), pick(0.95), pick(0.99)
+
+
+def run_load(session, pool, email, weights, args):
+    """Send the mix at the target rate for the run's duration; returns the Recorder."""
+    recorder = Recorder()
+    names = list(weights)
+    cumulative = []
+    total = 0
+    for name in names:
+        total += weights[name]
+        cumulative.append(total)
+    chooser = random.Random(args.seed)
+
+    def send(name, due, seed):
+        function, _, ok = OPERATIONS[name]
+        try:
+            status = function(session, pool, random.Random(seed), email)
+        except Exception:
+            status = -1
+        recorder.record(name, due, status, status in ok)
+
+    print(f"{'time':>6} {'sent/s':>8} {'done/s':>8} {'errors':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'in flight':>10}")
+    executor = ThreadPoolExecutor(max_workers=args.concurrency, thread_name_prefix='load')
+    started = time.perf_counter()
+    interval = 1 / args.rps
+    sent = 0
+    reported, report_at = 0, started + args.report_interval
+    sent_at_report = 0
+    while True:
+        now = time.perf_counter()
+        if now - started >= args.duration:
+            break
+        due = started + sent * interval
+        time.sleep(max(0, min(due, report_at) - now))
+        now = time.perf_counter()
+        if now >= due and due - started < args.duration:
+            name = chooser.choices(names, cum_weights=cumulative)[0]
+            with recorder.lock:
+                recorder.in_flight += 1
+            executor.submit(send, name, due, chooser.getrandbits(32))
+            sent += 1
+        if now >= report_at:
+            with recorder.lock:
+                window = recorder.records[reported:]
+                reported = len(recorder.records)
+                in_flight = recorder.in_flight
+            latencies = [finished - due_at for _, due_at, finished, _, _ in window]
+            errors = sum(1 for record in window if not record[4])
+            p50, p95, p99 = percentiles(latencies)
+            recorder.timeline.append({
+                'second': round(now - started, 1),
+                'sent_rps': round((sent - sent_at_report) / args.report_interval, 1),
+                'done_rps': round(len(window) / args.report_interval, 1),
+                'errors': errors,
+                'p50_ms': round(p50, 2),
+                'p95_ms': round(p95, 2),
+                'p99_ms': round(p99, 2),
+            })
+            print(f'{now - started:>5.0f}s {(sent - sent_at_report) / args.report_interval:>8.1f} '
+                  f'{len(window) / args.report_interval:>8.1f} {errors:>7} {p50:>8.1f} {p95:>8.1f} {p99:>8.1f} '
+                  f'{in_flight:>10}', flush=True)
+            sent_at_report = sent
+            report_at += args.report_interval
+    executor.shutdown(wait=True)
+    recorder.elapsed = time.perf_counter() - started
+    return recorder
+
+
+def summarize(recorder):
+    """Return per-operation and total results as a dict."""
+    by_operation = defaultdict(list)
+    for record in recorder.records:
+        by_operation[record[0]].append(record)
+
+    def stats(records):
+        latencies = [finished - due for _, due, finished, _, _ in records]
+        errors = sum(1 for record in records if not record[4])
+        p50, p95, p99 = percentiles(latencies)
+        return {
+            'requests': len(records),
+            'errors': errors,
+            'error_rate': round(errors / len(records), 4) if records else 0,
+            'p50_ms': round(p50, 2),
+            'p95_ms': round(p95, 2),
+            'p99_ms': round(p99, 2),
+            'max_ms': round(max(latencies) * 1000, 2) if latencies else 0,
+            'statuses': dict(Counter(str(record[3]) for record in records)),
+        }
+
+    total = stats(recorder.records)
+    total['throughput_rps'] = round(len(recorder.records) / recorder.elapsed, 1)
+    return {
+        'total': total,
+        'operations': {name: stats(records) for name, records in sorted(by_operation.items())},
+        'timeline': recorder.timeline,
+    }
+
+
+def check_consistency(session, pool):
+    """
+    Check bidirectional memberships and task assignees; returns a list of problems.
+
+    Reads go to the primary database (see X-Read-Primary-Until) and use the
+    streamed list endpoints, which no cache sits in front of.
+    """
+    primary = {'X-Read-Primary-Until': f'{time.time() + 3600:.3f}', 'Accept': 'application/x-ndjson'}
+
+    def stream(path):
+        connection = http.client.HTTPConnection(session.host, session.port, timeout=300)
+        try:
+            connection.request('GET', path, headers={**session.headers, **primary})
+            response = connection.getresponse()
+            if response.status != 200:
+                raise SystemExit(f'Consistency check could not read {path}: {response.status}')
+            return [json.loads(line) for line in response.read().splitlines() if line.strip()]
+        finally:
+            connection.close()
+
+    problems = []
+    employees = stream('/api/v1/employee/?stream=true')
+    projects = {project['id']: project for project in stream('/api/v1/project/?stream=true')}
+
+    members = defaultdict(set)
+    for employee in employees:
+        for project_id in employee['projects']:
+            members[project_id].add(employee['id'])
+    for project_id, project in projects.items():
+        listed = set(project['employees'])
+        if listed != members[project_id]:
+            problems.append(
+                f'project {project_id}: employees {sorted(listed)} but employees listing it '
+                f'{sorted(members[project_id])}'
+            )
+
+    own_tasks = set(pool.tasks)
+    for project_id in pool.projects:
+        expected = projects.get(project_id, {}).get('employees', [])
+        for task in stream(f'/api/v1/task/?stream=true&project_id={project_id}'):
+            if task['id'] in own_tasks and sorted(task['employees']) != sorted(expected):
+                problems.append(f"task {task['id']}: employees {task['employees']} but project has {expected}")
+    return problems
+
+
+def start_server(args):
+    """Start serve.py on a temporary SQLite database; returns (process, base URL, temp dir)."""
+    workdir = tempfile.mkdtemp(prefix='load-')
+    env = dict(
+        os.environ,
+        FLASK_ENV='production',
+        DATABASE_URL=f"sqlite:///{os.path.join(workdir, 'load.db')}",
+        BCRYPT_ROUNDS=os.environ.get('BCRYPT_ROUNDS', '10'),
+    )
+    command = [sys.executable, 'serve.py', '--create-db', '--port', str(args.port), '--workers', str(args.workers)]
+    log_path = os.path.join(workdir, 'serve.log')
+    with open(log_path, 'w') as log:
+        process = subprocess.Popen(command, env=env, stdout=log, stderr=subprocess.STDOUT)
+    url = f'http://127.0.0.1:{args.port}'
+    session = Session(url, timeout=1)
+    deadline = time.monotonic() + 30
+    while session.request('GET', '/health')[0] != 200:
+        if process.poll() is not None or time.monotonic() > deadline:
+            process.kill()
+            with open(log_path) as log:
+                output = log.read()[-4000:]
+            shutil.rmtree(workdir, ignore_errors=True)
+            raise SystemExit(f'serve.py did not start:\n{output}')
+        time.sleep(0.2)
+    return process, url, workdir
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', default='http://127.0.0.1:5000', help='server to load')
+    parser.add_argument('--serve', action='store_true', help='start serve.py on a temporary database instead')
+    parser.add_argument('--port', type=int, default=5099, help='port for --serve')
+    parser.add_argument('--workers', type=int, default=2, help='serve.py workers for --serve')
+    parser.add_argument('--rps', type=float, default=50, help='target requests per second')
+    parser.add_argument('--duration', type=float, default=30, help='seconds to send requests for')
+    parser.add_argument('--concurrency', type=int, default=64, help='most requests in flight at once')
+    parser.add_argument('--mix', help="operation weights, e.g. 'tasks.*=5,auth.login=1' (default: a read-heavy mix)")
+    parser.add_argument('--employees', type=int, default=200, help='employees created before the run')
+    parser.add_argument('--projects', type=int, default=20, help='projects created before the run')
+    parser.add_argument('--tasks', type=int, default=500, help='tasks created before the run')
+    parser.add_argument('--timeout', type=float, default=30, help='seconds before a request counts as failed')
+    parser.add_argument('--report-interval', type=float, default=5, help='seconds between progress lines')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--skip-check', action='store_true', help='skip the consistency check')
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    args = parser.parse_args()
+
+    try:
+        weights = parse_mix(args.mix)
+    except ValueError as err:
+        parser.error(str(err))
+
+    process = workdir = None
+    url = args.url
+    if args.serve:
+        process, url, workdir = start_server(args)
+    try:
+        session = Session(url, args.timeout)
+        pool = Pool()
+        email = setup(session, pool, args, random.Random(args.seed))
+        recorder = run_load(session, pool, email, weights, args)
+        results = summarize(recorder)
+        problems = [] if args.skip_check else check_consistency(session, pool)
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    total = results['total']
+    print(f"\n{'operation':<26} {'requests':>9} {'errors':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for name, result in results['operations'].items():
+        print(f"{name:<26} {result['requests']:>9} {result['errors']:>7} "
+              f"{result['p50_ms']:>8.1f} {result['p95_ms']:>8.1f} {result['p99_ms']:>8.1f}")
+    print(f"\n{total['requests']} requests in {recorder.elapsed:.1f}s, {total['throughput_rps']} req/s, "
+          f"{total['error_rate']:.2%} errors, p50 {total['p50_ms']} ms, p95 {total['p95_ms']} ms, "
+          f"p99 {total['p99_ms']} ms")
+
+    if not args.skip_check:
+        if problems:
+            print(f'\nConsistency check failed, {len(problems)} problems:')
+            for problem in problems[:20]:
+                print(f'  {problem}')
+        else:
+            print('\nConsistency check passed')
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump({**results, 'consistency_problems': problems}, file, indent=2)
+            file.write('\n')
+
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == '__main__':
+    main()
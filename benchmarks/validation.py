@@ -0,0 +1,49 @@
+"""Compare compiled request validation against marshmallow's Schema.load.
+
+Run from the repository root:
+
+    python -m benchmarks.validation [--number 20000]
+"""
+import argparse
+import timeit
+from app.schemas.compiled import compile_loader
+from app.schemas.employee import EmployeeUpdateSchema
+from app.schemas.project import ProjectUpdateSchema
+from app.schemas.task import TaskCreateSchema, TaskUpdateSchema
+
+CASES = [
+    ('TaskUpdateSchema status', TaskUpdateSchema, {'status': 'completed'}),
+    ('TaskCreateSchema', TaskCreateSchema, {
+        'name': 'Write release notes', 'project_id': '0b6f4d1e-6a51-4f3c-9d7e-2f1c5a9b8e01',
+        'description': 'Summarize the sprint', 'status': 'in_progress', 'priority': 'high',
+        'labels': 'docs,release', 'billable': True, 'deadline': 1767225600000
+    }),
+    ('EmployeeUpdateSchema', EmployeeUpdateSchema, {
+        'name': 'Ann Lee', 'email': 'ann.lee@example.com', 'projects': ['p-1', 'p-2', 'p-1']
+    }),
+    ('ProjectUpdateSchema', ProjectUpdateSchema, {
+        'name': 'Apollo', 'archived': False, 'employees': [f'e-{i}' for i in range(20)]
+    }),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=20000, help='loads per measurement')
+    args = parser.parse_args()
+
+    print(f"{'schema':<26} {'Schema.load':>12} {'compiled':>12} {'speedup':>8}")
+    for label, schema_class, data in CASES:
+        schema = schema_class()
+        compiled = compile_loader(schema_class())
+        assert compiled.load(data) == schema.load(data)
+
+        baseline = min(timeit.repeat(lambda: schema.load(data), number=args.number, repeat=3))
+        fast = min(timeit.repeat(lambda: compiled.load(data), number=args.number, repeat=3))
+        baseline_us = baseline / args.number * 1e6
+        fast_us = fast / args.number * 1e6
+        print(f'{label:<26} {baseline_us:>10.2f}us {fast_us:>10.2f}us {baseline / fast:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
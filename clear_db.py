@@ -8,12 +8,14 @@ import sys
 from app import create_app, db
 from app.models.user import User
 from app.models.employee import Employee
+from app.models.employee_project import EmployeeProject
 
 def clear_all_data():
     """Clear all data from all tables."""
     print("🗑️  Clearing all data from database...")
     
     # Delete all records from each table
+    EmployeeProject.query.delete()
     Employee.query.delete()
     User.query.delete()
     
@@ -23,6 +25,7 @@ def clear_all_data():
 def clear_employees():
     """Clear only employee data."""
     print("🗑️  Clearing employee data...")
+    EmployeeProject.query.delete()
     Employee.query.delete()
     db.session.commit()
     print("✅ Employee data cleared successfully!")
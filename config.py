@@ -4,6 +4,56 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+basedir = os.path.abspath(os.path.dirname(__file__))
+
+def engine_options(database_uri):
+    """
+    Build SQLALCHEMY_ENGINE_OPTIONS for a database URI, tunable through DB_* env vars.
+
+    Server databases get a sized, pre-pinged connection pool. SQLite keeps
+    SQLAlchemy's default pool, since writes are serialized by the file lock
+    anyway, and is tuned through SQLITE_PRAGMAS instead.
+    """
+    options = {
+        # Compiled SQL kept per engine, so repeated queries skip compilation
+        'query_cache_size': int(os.environ.get('DB_QUERY_CACHE_SIZE') or 1000),
+    }
+    if database_uri.startswith('sqlite'):
+        # Prepared statements kept per connection by the sqlite3 driver
+        options['connect_args'] = {'cached_statements': int(os.environ.get('SQLITE_CACHED_STATEMENTS') or 256)}
+        return options
+
+    options.update({
+        'pool_size': int(os.environ.get('DB_POOL_SIZE') or 10),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW') or 20),
+        'pool_timeout': int(os.environ.get('DB_POOL_TIMEOUT') or 30),  # seconds
+        'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE') or 1800),  # seconds
+        'pool_pre_ping': os.environ.get('DB_POOL_PRE_PING', 'true').lower() == 'true',
+    })
+    return options
+
+def sqlite_pragmas(database_uri):
+    """
+    Return the PRAGMAs run on every new SQLite connection, tunable through SQLITE_* env vars.
+
+    WAL lets readers run alongside the single writer, and busy_timeout makes
+    a writer wait for the lock instead of failing with "database is locked".
+    """
+    if not database_uri.startswith('sqlite'):
+        return {}
+    pragmas = {
+        'busy_timeout': int(os.environ.get('SQLITE_BUSY_TIMEOUT') or 5000),  # milliseconds
+        'cache_size': int(os.environ.get('SQLITE_CACHE_SIZE') or -65536),  # negative means KiB
+        'temp_store': 'MEMORY',
+    }
+    if database_uri != 'sqlite://' and ':memory:' not in database_uri:
+        pragmas.update({
+            'journal_mode': os.environ.get('SQLITE_JOURNAL_MODE') or 'WAL',
+            'synchronous': os.environ.get('SQLITE_SYNCHRONOUS') or 'NORMAL',
+            'mmap_size': int(os.environ.get('SQLITE_MMAP_SIZE') or 268435456),  # bytes
+        })
+    return pragmas
+
 class Config:
     """Base configuration."""
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
@@ -11,21 +61,68 @@ class Config:
     JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY') or 'jwt-secret-key-change-in-production'
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=24)
     JWT_REFRESH_TOKEN_EXPIRES = timedelta(days=30)
+    # Level of app.logger; Python's default of WARNING would hide the startup settings
+    LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
+    # GET endpoints read from this database when set, see app.utils.replica
+    SQLALCHEMY_BINDS = {'replica': os.environ['READ_REPLICA_URL']} if os.environ.get('READ_REPLICA_URL') else {}
+    READ_REPLICA_STICKY_SECONDS = int(os.environ.get('READ_REPLICA_STICKY_SECONDS') or 5)
+    # Funnel write requests through one writer thread with group commit (SQLite)
+    WRITE_QUEUE_ENABLED = os.environ.get('WRITE_QUEUE_ENABLED', 'false').lower() == 'true'
+    WRITE_QUEUE_MAX_BATCH = int(os.environ.get('WRITE_QUEUE_MAX_BATCH') or 32)
+    SLOW_QUERY_MS = float(os.environ.get('SLOW_QUERY_MS') or 200)  # log statements slower than this
+    N_PLUS_ONE_THRESHOLD = int(os.environ.get('N_PLUS_ONE_THRESHOLD') or 10)  # identical statements per request
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'true').lower() == 'true'
+    # Shared by the worker processes of one server, see app.utils.metrics
+    METRICS_DIR = os.environ.get('METRICS_DIR')
+    METRICS_FLUSH_INTERVAL = float(os.environ.get('METRICS_FLUSH_INTERVAL') or 1)  # seconds
+    # tracemalloc per request, see app.utils.memory; slows every allocation down
+    MEMORY_TRACKING_ENABLED = os.environ.get('MEMORY_TRACKING_ENABLED', 'false').lower() == 'true'
+    MEMORY_TRACE_FRAMES = int(os.environ.get('MEMORY_TRACE_FRAMES') or 25)  # stack frames kept per allocation
+    MEMORY_TOP_SITES = int(os.environ.get('MEMORY_TOP_SITES') or 5)  # allocation sites reported per request
+    # Sampling profiler, see app.utils.profiler
+    PROFILE_ENABLED = os.environ.get('PROFILE_ENABLED', 'false').lower() == 'true'
+    PROFILE_SAMPLE_RATE = float(os.environ.get('PROFILE_SAMPLE_RATE') or 0)  # share of requests profiled
+    PROFILE_INTERVAL_MS = float(os.environ.get('PROFILE_INTERVAL_MS') or 5)
+    PROFILE_DIR = os.path.abspath(os.environ.get('PROFILE_DIR') or os.path.join(basedir, 'instance', 'profiles'))
+    PROFILE_KEEP = int(os.environ.get('PROFILE_KEEP') or 100)  # profiles kept on disk
+    PROFILE_TOKEN_MAX_AGE = int(os.environ.get('PROFILE_TOKEN_MAX_AGE') or 3600)  # seconds
+    JWT_DECODE_CACHE_SIZE = int(os.environ.get('JWT_DECODE_CACHE_SIZE') or 1024)  # verified tokens kept, 0 disables
+    PAGINATION_MAX_PER_PAGE = int(os.environ.get('PAGINATION_MAX_PER_PAGE') or 100)
+    STREAM_BATCH_SIZE = int(os.environ.get('STREAM_BATCH_SIZE') or 500)
+    BULK_MAX_ITEMS = int(os.environ.get('BULK_MAX_ITEMS') or 1000)
+    ENTITY_CACHE_ENABLED = os.environ.get('ENTITY_CACHE_ENABLED', 'true').lower() == 'true'
+    ENTITY_CACHE_SIZE = int(os.environ.get('ENTITY_CACHE_SIZE') or 1024)
+    ENTITY_CACHE_TTL = int(os.environ.get('ENTITY_CACHE_TTL') or 10)  # seconds
+    # bcrypt cost; calibrated at startup towards BCRYPT_TARGET_MS per hash when unset
+    BCRYPT_ROUNDS = int(os.environ['BCRYPT_ROUNDS']) if os.environ.get('BCRYPT_ROUNDS') else None
+    BCRYPT_TARGET_MS = int(os.environ.get('BCRYPT_TARGET_MS') or 250)
+    BCRYPT_MIN_ROUNDS = int(os.environ.get('BCRYPT_MIN_ROUNDS') or 10)
+    BCRYPT_WORKERS = int(os.environ.get('BCRYPT_WORKERS') or 2)
+    BCRYPT_MAX_PENDING = int(os.environ.get('BCRYPT_MAX_PENDING') or 16)  # running plus queued hashes
+    BCRYPT_RETRY_AFTER = int(os.environ.get('BCRYPT_RETRY_AFTER') or 1)  # seconds
 
 class DevelopmentConfig(Config):
     """Development configuration."""
     DEBUG = True
     SQLALCHEMY_DATABASE_URI = os.environ.get('DEV_DATABASE_URL') or 'sqlite:///dev.db'
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(SQLALCHEMY_DATABASE_URI)
+    SQLITE_PRAGMAS = sqlite_pragmas(SQLALCHEMY_DATABASE_URI)
 
 class ProductionConfig(Config):
     """Production configuration."""
     DEBUG = False
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///prod.db'
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(SQLALCHEMY_DATABASE_URI)
+    SQLITE_PRAGMAS = sqlite_pragmas(SQLALCHEMY_DATABASE_URI)
 
 class TestingConfig(Config):
     """Testing configuration."""
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(SQLALCHEMY_DATABASE_URI)
+    SQLITE_PRAGMAS = sqlite_pragmas(SQLALCHEMY_DATABASE_URI)
+    SQLALCHEMY_BINDS = {}
+    BCRYPT_ROUNDS = 4
 
 config = {
     'development': DevelopmentConfig,
@@ -0,0 +1,168 @@
+"""Move employee/project membership into the employee_project table
+
+Revision ID: 3f2b9c1d7a10
+Revises:
+Create Date: 2026-10-17 09:00:00.000000
+
+Databases created with db.create_all() before this revision keep memberships
+as JSON arrays in employees.projects and projects.employees. This revision
+creates the employee_project association table, copies both arrays into it in
+chunks and drops the array columns. It is safe to run against a database that
+db.create_all() already created with the new schema.
+
+"""
+import json
+import time
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f2b9c1d7a10'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# Rows read from employees/projects per round trip during the backfill
+CHUNK_SIZE = 1000
+
+employee_project = sa.table(
+    'employee_project',
+    sa.column('employee_id', sa.String),
+    sa.column('project_id', sa.String),
+    sa.column('created_at', sa.BigInteger),
+)
+
+
+def _column_names(table_name):
+    return {column['name'] for column in sa.inspect(op.get_bind()).get_columns(table_name)}
+
+
+def _decode_ids(value):
+    """Decode a membership array stored either as JSON text or a native JSON value."""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        value = json.loads(value)
+    return value or []
+
+
+def _iter_chunks(table_name, column_name):
+    """Yield (id, ids) rows from a table in keyset-ordered chunks."""
+    bind = op.get_bind()
+    statement = sa.text(
+        f'SELECT id, {column_name} FROM {table_name} '
+        'WHERE id > :after ORDER BY id LIMIT :limit'
+    )
+    after = ''
+    while True:
+        rows = bind.execute(statement, {'after': after, 'limit': CHUNK_SIZE}).fetchall()
+        if not rows:
+            return
+        yield [(row[0], _decode_ids(row[1])) for row in rows]
+        after = rows[-1][0]
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not inspector.has_table('employee_project'):
+        op.create_table(
+            'employee_project',
+            sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column('employee_id', sa.String(length=36), nullable=False),
+            sa.Column('project_id', sa.String(length=36), nullable=False),
+            sa.Column('created_at', sa.BigInteger(), nullable=False),
+            sa.ForeignKeyConstraint(['employee_id'], ['employees.id'], ondelete='CASCADE'),
+            sa.UniqueConstraint('employee_id', 'project_id', name='uq_employee_project_employee_project'),
+        )
+        op.create_index(
+            'ix_employee_project_project_employee', 'employee_project', ['project_id', 'employee_id']
+        )
+
+    has_employee_array = 'projects' in _column_names('employees')
+    has_project_array = 'employees' in _column_names('projects')
+    if not has_employee_array and not has_project_array:
+        return
+
+    # Both sides of the old arrays could disagree, so the union of them is copied
+    existing_employees = set()
+    seen = set()
+    now = int(time.time() * 1000)
+
+    def insert_pairs(pairs):
+        rows = []
+        for employee_id, project_id in pairs:
+            if (employee_id, project_id) in seen:
+                continue
+            seen.add((employee_id, project_id))
+            rows.append({'employee_id': employee_id, 'project_id': project_id, 'created_at': now})
+        if rows:
+            op.bulk_insert(employee_project, rows)
+
+    if has_employee_array:
+        for chunk in _iter_chunks('employees', 'projects'):
+            existing_employees.update(employee_id for employee_id, _ in chunk)
+            insert_pairs(
+                (employee_id, project_id)
+                for employee_id, project_ids in chunk
+                for project_id in project_ids
+            )
+    else:
+        existing_employees.update(row[0] for row in bind.execute(sa.text('SELECT id FROM employees')))
+
+    if has_project_array:
+        for chunk in _iter_chunks('projects', 'employees'):
+            # Project arrays may still name employees that no longer exist
+            insert_pairs(
+                (employee_id, project_id)
+                for project_id, employee_ids in chunk
+                for employee_id in employee_ids
+                if employee_id in existing_employees
+            )
+
+    if has_employee_array:
+        with op.batch_alter_table('employees') as batch_op:
+            batch_op.drop_column('projects')
+    if has_project_array:
+        with op.batch_alter_table('projects') as batch_op:
+            batch_op.drop_column('employees')
+
+
+def downgrade():
+    bind = op.get_bind()
+
+    with op.batch_alter_table('employees') as batch_op:
+        batch_op.add_column(sa.Column('projects', sa.Text(), nullable=False, server_default='[]'))
+    with op.batch_alter_table('projects') as batch_op:
+        batch_op.add_column(sa.Column('employees', sa.JSON(), nullable=False, server_default='[]'))
+
+    employee_arrays = {}
+    project_arrays = {}
+    after = 0
+    while True:
+        rows = bind.execute(
+            sa.text(
+                'SELECT id, employee_id, project_id FROM employee_project '
+                'WHERE id > :after ORDER BY id LIMIT :limit'
+            ),
+            {'after': after, 'limit': CHUNK_SIZE},
+        ).fetchall()
+        if not rows:
+            break
+        for _, employee_id, project_id in rows:
+            employee_arrays.setdefault(employee_id, []).append(project_id)
+            project_arrays.setdefault(project_id, []).append(employee_id)
+        after = rows[-1][0]
+
+    update_employee = sa.text('UPDATE employees SET projects = :ids WHERE id = :id')
+    for employee_id, project_ids in employee_arrays.items():
+        bind.execute(update_employee, {'id': employee_id, 'ids': json.dumps(project_ids)})
+    update_project = sa.text('UPDATE projects SET employees = :ids WHERE id = :id')
+    for project_id, employee_ids in project_arrays.items():
+        bind.execute(update_project, {'id': project_id, 'ids': json.dumps(employee_ids)})
+
+    op.drop_index('ix_employee_project_project_employee', table_name='employee_project')
+    op.drop_table('employee_project')
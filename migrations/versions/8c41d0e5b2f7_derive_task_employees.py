@@ -0,0 +1,43 @@
+"""Drop tasks.employees, task assignees are resolved from the project
+
+Revision ID: 8c41d0e5b2f7
+Revises: 3f2b9c1d7a10
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+import json
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8c41d0e5b2f7'
+down_revision = '3f2b9c1d7a10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    columns = {column['name'] for column in sa.inspect(op.get_bind()).get_columns('tasks')}
+    if 'employees' in columns:
+        with op.batch_alter_table('tasks') as batch_op:
+            batch_op.drop_column('employees')
+
+
+def downgrade():
+    bind = op.get_bind()
+
+    with op.batch_alter_table('tasks') as batch_op:
+        batch_op.add_column(sa.Column('employees', sa.JSON(), nullable=False, server_default='[]'))
+
+    # Rebuild each project's array once and copy it to all of its tasks
+    members = {}
+    for employee_id, project_id in bind.execute(
+        sa.text('SELECT employee_id, project_id FROM employee_project ORDER BY id')
+    ):
+        members.setdefault(project_id, []).append(employee_id)
+
+    update_tasks = sa.text('UPDATE tasks SET employees = :ids WHERE project_id = :project_id')
+    for project_id, employee_ids in members.items():
+        bind.execute(update_tasks, {'project_id': project_id, 'ids': json.dumps(employee_ids)})
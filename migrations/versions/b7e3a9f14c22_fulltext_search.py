@@ -0,0 +1,31 @@
+"""Add FTS5 search indexes for employees, projects and tasks
+
+Revision ID: b7e3a9f14c22
+Revises: 8c41d0e5b2f7
+Create Date: 2026-10-17 11:00:00.000000
+
+Only applies to SQLite builds with FTS5; other databases keep using ILIKE.
+
+"""
+from alembic import op
+
+from app.models.fulltext import SEARCH_COLUMNS, drop_fts, rebuild_fts
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e3a9f14c22'
+down_revision = '8c41d0e5b2f7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    connection = op.get_bind()
+    for model in SEARCH_COLUMNS:
+        rebuild_fts(connection, model)
+
+
+def downgrade():
+    connection = op.get_bind()
+    for model in SEARCH_COLUMNS:
+        drop_fts(connection, model)
@@ -0,0 +1,57 @@
+"""Add composite indexes for the list endpoint filters
+
+Revision ID: d4a8f2c6e913
+Revises: b7e3a9f14c22
+Create Date: 2026-10-17 12:00:00.000000
+
+Each index leads with the equality filters a list endpoint applies and ends
+with (created_at, id), so filtered pages are read in sort order without a
+temporary B-tree. ix_tasks_project_id is replaced by ix_tasks_project_created_at,
+which serves the same lookups.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4a8f2c6e913'
+down_revision = 'b7e3a9f14c22'
+branch_labels = None
+depends_on = None
+
+ACTIVE_EMPLOYEES = sa.text('deactivated IS NULL')
+
+# (name, table, columns, extra create_index kwargs)
+INDEXES = [
+    ('ix_employees_created_at', 'employees', ['created_at', 'id'], {}),
+    ('ix_employees_active_created_at', 'employees', ['created_at', 'id'],
+     {'sqlite_where': ACTIVE_EMPLOYEES, 'postgresql_where': ACTIVE_EMPLOYEES}),
+    ('ix_projects_created_at', 'projects', ['created_at', 'id'], {}),
+    ('ix_projects_archived_created_at', 'projects', ['archived', 'created_at', 'id'], {}),
+    ('ix_projects_archived_billable_created_at', 'projects', ['archived', 'billable', 'created_at', 'id'], {}),
+    ('ix_projects_billable_created_at', 'projects', ['billable', 'created_at', 'id'], {}),
+    ('ix_tasks_created_at', 'tasks', ['created_at', 'id'], {}),
+    ('ix_tasks_project_created_at', 'tasks', ['project_id', 'created_at', 'id'], {}),
+    ('ix_tasks_project_status_created_at', 'tasks', ['project_id', 'status', 'created_at', 'id'], {}),
+    ('ix_tasks_status_created_at', 'tasks', ['status', 'created_at', 'id'], {}),
+]
+
+
+def _index_names(table_name):
+    return {index['name'] for index in sa.inspect(op.get_bind()).get_indexes(table_name)}
+
+
+def upgrade():
+    existing = {table: _index_names(table) for table in ('employees', 'projects', 'tasks')}
+    for name, table, columns, kwargs in INDEXES:
+        if name not in existing[table]:
+            op.create_index(name, table, columns, **kwargs)
+    if 'ix_tasks_project_id' in existing['tasks']:
+        op.drop_index('ix_tasks_project_id', table_name='tasks')
+
+
+def downgrade():
+    op.create_index('ix_tasks_project_id', 'tasks', ['project_id'])
+    for name, table, _, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
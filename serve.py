@@ -0,0 +1,259 @@
+"""Production server: one preloaded app, forked into worker processes.
+
+The master builds the app once through create_app, imports everything the
+requests will need and freezes the garbage collector, so the forked
+workers share those pages instead of each copying them on the first
+collection. Each worker serves the shared listening socket with a fixed
+pool of threads and is replaced after a number of requests.
+
+Signals sent to the master:
+    SIGHUP           Graceful reload: re-executes the master with the same
+                     socket, starts new workers on the new code and lets the
+                     old ones finish their requests
+    SIGTERM, SIGINT  Graceful shutdown
+
+Usage:
+    python serve.py [--workers N] [--threads N] [--max-requests N] [--create-db]
+"""
+import argparse
+import gc
+import os
+import random
+import signal
+import socket
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+
+LISTEN_FD_ENV = 'SERVE_LISTEN_FD'
+OLD_WORKERS_ENV = 'SERVE_OLD_WORKERS'
+
+
+class RequestHandler(WSGIRequestHandler):
+    # One request per connection, so idle keep-alive connections cannot hold pool threads
+    protocol_version = 'HTTP/1.0'
+
+
+class PooledWSGIServer(BaseWSGIServer):
+    """WSGI server handling requests on a fixed pool of threads."""
+
+    multithread = True
+
+    def __init__(self, host, port, app, fd, threads):
+        super().__init__(host, port, app, handler=RequestHandler, fd=fd)
+        self.executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix='request')
+
+    def process_request(self, request, client_address):
+        self.executor.submit(self._handle, request, client_address)
+
+    def _handle(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+
+class RequestLimit:
+    """WSGI middleware stopping the worker's server after a number of requests."""
+
+    def __init__(self, app, max_requests, stop):
+        self.app = app
+        self.remaining = max_requests
+        self.stop = stop
+        self._lock = threading.Lock()
+
+    def __call__(self, environ, start_response):
+        with self._lock:
+            self.remaining -= 1
+            if self.remaining == 0:
+                self.stop()
+        return self.app(environ, start_response)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Run the API with preforked workers.')
+    parser.add_argument('--host', default=os.environ.get('HOST', '127.0.0.1'))
+    parser.add_argument('--port', type=int, default=int(os.environ.get('PORT', 5000)))
+    parser.add_argument('--workers', type=int, default=int(os.environ.get('SERVE_WORKERS') or os.cpu_count() or 1))
+    parser.add_argument('--threads', type=int, default=int(os.environ.get('SERVE_THREADS') or 8),
+                        help='Request threads per worker')
+    parser.add_argument('--max-requests', type=int, default=int(os.environ.get('SERVE_MAX_REQUESTS') or 10000),
+                        help='Replace a worker after this many requests, 0 to never replace')
+    parser.add_argument('--max-requests-jitter', type=int,
+                        default=int(os.environ.get('SERVE_MAX_REQUESTS_JITTER') or 1000),
+                        help='Random extra requests per worker, so workers are not replaced together')
+    parser.add_argument('--graceful-timeout', type=float,
+                        default=float(os.environ.get('SERVE_GRACEFUL_TIMEOUT') or 30),
+                        help='Seconds a stopping worker may take to finish its requests')
+    parser.add_argument('--create-db', action='store_true', help='Create missing tables before starting')
+    return parser.parse_args()
+
+
+def preload(args):
+    """Build the app and load everything the workers share, then freeze it out of GC."""
+    from sqlalchemy.orm import configure_mappers
+    from app import create_app, db
+
+    app = create_app(os.environ.get('FLASK_ENV') or 'production')
+    if args.create_db:
+        with app.app_context():
+            db.create_all(bind_key=None)
+    # Blueprints, schemas and models are imported by create_app
+    configure_mappers()
+    with app.app_context():
+        for engine in db.engines.values():
+            # Connections must not be shared with the workers
+            engine.dispose()
+
+    gc.collect()
+    gc.freeze()
+    return app
+
+
+def clear_metrics(app):
+    """Remove the worker metrics files left by a previous server."""
+    directory = app.config.get('METRICS_DIR')
+    if directory and os.path.isdir(directory):
+        for filename in os.listdir(directory):
+            if filename.endswith('.json'):
+                os.remove(os.path.join(directory, filename))
+
+
+def listening_socket(host, port):
+    """Return the socket inherited over a reload, or bind a new one."""
+    fd = os.environ.pop(LISTEN_FD_ENV, None)
+    if fd is not None:
+        return socket.socket(fileno=int(fd))
+    family = socket.AF_INET6 if ':' in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    return sock
+
+
+def run_worker(app, sock, args):
+    """Serve requests in a forked worker until stopped or recycled."""
+    for sig in (signal.SIGHUP, signal.SIGINT):
+        signal.signal(sig, signal.SIG_IGN)
+    gc.enable()
+
+    host, port = sock.getsockname()[:2]
+    server = PooledWSGIServer(host, port, app, fd=sock.fileno(), threads=args.threads)
+    stop = lambda *_: threading.Thread(target=server.shutdown).start()
+    signal.signal(signal.SIGTERM, stop)
+    if args.max_requests:
+        limit = args.max_requests + random.randint(0, args.max_requests_jitter)
+        server.app = RequestLimit(app, limit, stop)
+
+    server.serve_forever()
+    server.executor.shutdown(wait=True)
+    if 'metrics' in app.extensions:
+        app.extensions['metrics'].flush()
+
+
+class Master:
+    """Keeps the configured number of workers running."""
+
+    def __init__(self, app, sock, args):
+        self.app = app
+        self.sock = sock
+        self.args = args
+        self.workers = set()
+        self.retiring = set()
+        self.signal = None
+
+    def run(self):
+        for sig in (signal.SIGHUP, signal.SIGTERM, signal.SIGINT):
+            signal.signal(sig, self._on_signal)
+        host, port = self.sock.getsockname()[:2]
+        print(f'Serving on http://{host}:{port} with {self.args.workers} workers '
+              f'x {self.args.threads} threads (master {os.getpid()})', flush=True)
+
+        # Workers of the previous generation stop once the new one is serving
+        old_workers = os.environ.pop(OLD_WORKERS_ENV, '')
+        self.retiring = {int(pid) for pid in old_workers.split(',') if pid}
+        while len(self.workers) < self.args.workers:
+            self._spawn()
+        self._kill(self.retiring, signal.SIGTERM)
+
+        while True:
+            self._reap()
+            if self.signal in (signal.SIGTERM, signal.SIGINT):
+                self._stop()
+                return
+            if self.signal == signal.SIGHUP:
+                self._reload()
+            while len(self.workers) < self.args.workers:
+                self._spawn()
+            time.sleep(0.5)
+
+    def _on_signal(self, sig, frame):
+        self.signal = sig
+
+    def _spawn(self):
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                run_worker(self.app, self.sock, self.args)
+            except BaseException:
+                traceback.print_exc()
+                code = 1
+            finally:
+                os._exit(code)
+        self.workers.add(pid)
+
+    def _reap(self):
+        while True:
+            try:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            self.workers.discard(pid)
+            self.retiring.discard(pid)
+
+    def _kill(self, pids, sig):
+        for pid in list(pids):
+            try:
+                os.kill(pid, sig)
+            except ProcessLookupError:
+                pids.discard(pid)
+
+    def _stop(self):
+        self._kill(self.workers | self.retiring, signal.SIGTERM)
+        deadline = time.monotonic() + self.args.graceful_timeout
+        while (self.workers or self.retiring) and time.monotonic() < deadline:
+            time.sleep(0.1)
+            self._reap()
+        self._kill(self.workers | self.retiring, signal.SIGKILL)
+
+    def _reload(self):
+        # The same process re-executes, so the running workers stay its children
+        self.sock.set_inheritable(True)
+        os.environ[LISTEN_FD_ENV] = str(self.sock.fileno())
+        os.environ[OLD_WORKERS_ENV] = ','.join(str(pid) for pid in self.workers | self.retiring)
+        os.execv(sys.executable, [sys.executable] + sys.orig_argv[1:])
+
+
+def main():
+    args = parse_args()
+    # Collections before the fork would only touch pages the workers share
+    gc.disable()
+    reloading = LISTEN_FD_ENV in os.environ
+    sock = listening_socket(args.host, args.port)
+    app = preload(args)
+    if not reloading:
+        clear_metrics(app)
+    Master(app, sock, args).run()
+
+
+if __name__ == '__main__':
+    main()
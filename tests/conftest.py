@@ -3,8 +3,12 @@ import time
 from app import create_app, db
 from app.models.user import User
 from app.models.employee import Employee
+from app.models.employee_project import EmployeeProject
 from flask_jwt_extended import create_access_token
 import bcrypt
+from contextlib import contextmanager
+from app.utils.queries import count_queries
+from config import TestingConfig, config, engine_options, sqlite_pragmas
 
 @pytest.fixture(scope='session')
 def app():
@@ -23,6 +27,39 @@ def app():
         finally:
             db.session.close()
 
+@pytest.fixture
+def make_app(tmp_path, monkeypatch):
+    """Factory for apps with TestingConfig plus overrides, separate from the session app.
+    
+    ``database`` names a SQLite file in tmp_path to use instead of the
+    in-memory database. Tables are created on the primary bind, and engines
+    are disposed of after the test.
+    """
+    apps = []
+    
+    def factory(database=None, **overrides):
+        if database is not None:
+            uri = f'sqlite:///{tmp_path / database}'
+            overrides = {
+                'SQLALCHEMY_DATABASE_URI': uri,
+                'SQLALCHEMY_ENGINE_OPTIONS': engine_options(uri),
+                'SQLITE_PRAGMAS': sqlite_pragmas(uri),
+                **overrides
+            }
+        name = f'test_app_{len(apps)}'
+        monkeypatch.setitem(config, name, type('OverriddenConfig', (TestingConfig,), overrides))
+        app = create_app(name)
+        with app.app_context():
+            db.create_all(bind_key=None)
+        apps.append(app)
+        return app
+    
+    yield factory
+    for app in apps:
+        with app.app_context():
+            for engine in db.engines.values():
+                engine.dispose()
+
 @pytest.fixture(scope='function')
 def client(app):
     """Create a test client for the Flask app."""
@@ -34,6 +71,7 @@ def clean_db(app):
     with app.app_context():
         # Clean up any existing data
         try:
+            db.session.query(EmployeeProject).delete()
             db.session.query(Employee).delete()
             db.session.query(User).delete()
             db.session.commit()
@@ -44,6 +82,7 @@ def clean_db(app):
         
         # Clean up after test
         try:
+            db.session.query(EmployeeProject).delete()
             db.session.query(Employee).delete()
             db.session.query(User).delete()
             db.session.commit()
@@ -95,4 +134,16 @@ def created_employee(app, clean_db, sample_employee_data):
         db.session.expunge_all()  # Clear session
         # Get fresh instance
         fresh_employee = db.session.get(Employee, employee_id)
-        return fresh_employee 
\ No newline at end of file
+        return fresh_employee 
+
+@pytest.fixture
+def query_budget():
+    """Assert that a block runs at most a given number of SQL queries."""
+    @contextmanager
+    def budget(max_queries):
+        with count_queries() as statements:
+            yield statements
+        assert len(statements) <= max_queries, (
+            f'{len(statements)} queries, budget {max_queries}:\n' + '\n'.join(statements)
+        )
+    return budget
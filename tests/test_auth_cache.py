@@ -0,0 +1,75 @@
+import pytest
+import json
+import time
+from flask_jwt_extended import create_access_token
+from app.utils.tokens import TokenCache
+
+
+class TestTokenCache:
+    """Test cases for the verified token cache."""
+    
+    def test_entries_expire_with_token(self):
+        """Test claims are only served until the token's exp."""
+        cache = TokenCache(max_size=2)
+        cache.set(b'live', {'sub': '1', 'exp': time.time() + 60})
+        cache.set(b'expired', {'sub': '2', 'exp': time.time() - 1})
+        
+        assert cache.get(b'live')['sub'] == '1'
+        assert cache.get(b'expired') is None
+    
+    def test_lru_eviction(self):
+        """Test the least recently used token is evicted first."""
+        cache = TokenCache(max_size=2)
+        exp = time.time() + 60
+        cache.set(b'a', {'exp': exp})
+        cache.set(b'b', {'exp': exp})
+        cache.get(b'a')
+        cache.set(b'c', {'exp': exp})
+        
+        assert cache.get(b'b') is None
+        assert cache.get(b'a') is not None
+    
+    def test_repeated_requests_hit_cache(self, client, auth_headers):
+        """Test a token is verified once and then served from the cache."""
+        client.get('/api/auth/me', headers=auth_headers)
+        stats = json.loads(client.get('/api/status').data)['token_cache']
+        client.get('/api/auth/me', headers=auth_headers)
+        
+        assert json.loads(client.get('/api/status').data)['token_cache']['hits'] == stats['hits'] + 1
+    
+    def test_tampered_token_rejected(self, client, auth_headers):
+        """Test a token differing from a cached one is still verified."""
+        client.get('/api/auth/me', headers=auth_headers)
+        headers = {'Authorization': auth_headers['Authorization'][:-2] + 'xx'}
+        
+        response = client.get('/api/auth/me', headers=headers)
+        assert response.status_code == 422
+    
+    def test_expired_token_rejected(self, app, client, test_user):
+        """Test expired tokens are never served from the cache."""
+        with app.app_context():
+            token = create_access_token(identity=str(test_user), expires_delta=-1 * app.config['JWT_ACCESS_TOKEN_EXPIRES'])
+        
+        response = client.get('/api/auth/me', headers={'Authorization': f'Bearer {token}'})
+        assert response.status_code == 401
+
+
+class TestCurrentUser:
+    """Test cases for resolving the authenticated user."""
+    
+    def test_profile_reflects_update(self, client, auth_headers, test_user):
+        """Test the cached profile is dropped when the user is updated."""
+        assert json.loads(client.get('/api/auth/me', headers=auth_headers).data)['user']['name'] == 'Test User'
+        
+        response = client.put(f'/api/users/{test_user}', json={'name': 'Renamed'}, headers=auth_headers)
+        assert response.status_code == 200
+        
+        assert json.loads(client.get('/api/auth/me', headers=auth_headers).data)['user']['name'] == 'Renamed'
+    
+    def test_deleted_user_not_found(self, client, auth_headers, test_user):
+        """Test a deleted user's token no longer resolves to a profile."""
+        client.get('/api/auth/me', headers=auth_headers)
+        assert client.delete(f'/api/users/{test_user}', headers=auth_headers).status_code == 200
+        
+        assert client.get('/api/auth/me', headers=auth_headers).status_code == 404
+        assert client.get(f'/api/users/{test_user}', headers=auth_headers).status_code == 404
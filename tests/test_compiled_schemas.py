@@ -0,0 +1,153 @@
+import pytest
+import json
+from types import SimpleNamespace
+from marshmallow import Schema, ValidationError, fields, post_dump
+from app.models.employee import Employee
+from app.models.project import Project
+from app.models.task import Task
+from app.schemas.compiled import compile_loader, compile_schema
+from app.schemas.employee import EmployeeCreateSchema, EmployeeResponseSchema, EmployeeUpdateSchema
+from app.schemas.project import ProjectCreateSchema, ProjectResponseSchema, ProjectUpdateSchema
+from app.schemas.task import TaskCreateSchema, TaskResponseSchema, TaskUpdateSchema
+from app import db
+
+
+def _json(app, data):
+    """Encode like the API responses do."""
+    return app.json.dumps(data).encode('utf-8')
+
+
+@pytest.fixture
+def sample_rows(app, clean_db):
+    """Create employees, projects and tasks covering empty, None and unicode values."""
+    with app.app_context():
+        employees = [
+            Employee(name='Ann', email='ann@example.com', projects=['p-1', 'p-2'], invited=1700000000000),
+            Employee(name='Zoë Ünïcode', email='zoe@example.com', deactivated=1700000000001),
+        ]
+        db.session.add_all(employees)
+        db.session.flush()
+        projects = [
+            Project(name='Apollo', description='Moon', billable=True, deadline=1800000000000),
+            Project(name='Empty', description=None),
+        ]
+        db.session.add_all(projects)
+        db.session.flush()
+        projects[0].employees = [employee.id for employee in employees]
+        tasks = [
+            Task(name='Design', project_id=projects[0].id, labels='ui,ux', billable=True, deadline=5),
+            Task(name='Orphan', project_id='missing-project', description='No project'),
+        ]
+        db.session.add_all(tasks)
+        db.session.commit()
+        yield employees, projects, tasks
+        Task.query.delete()
+        Project.query.delete()
+        db.session.commit()
+
+
+class TestCompiledSchemas:
+    """Compiled response schemas must produce byte-identical JSON to marshmallow."""
+    
+    @pytest.mark.parametrize('schema_class, index', [
+        (EmployeeResponseSchema, 0), (ProjectResponseSchema, 1), (TaskResponseSchema, 2)
+    ])
+    def test_model_rows_match_marshmallow(self, app, sample_rows, schema_class, index):
+        """Test single and many dumps of model rows."""
+        with app.app_context():
+            rows = sample_rows[index]
+            for many in (False, True):
+                schema = schema_class(many=many)
+                compiled = compile_schema(schema_class(many=many))
+                obj = rows if many else rows[0]
+                assert _json(app, compiled.dump(obj)) == _json(app, schema.dump(obj))
+            for row in rows:
+                assert _json(app, compile_schema(schema_class()).dump(row)) == _json(app, schema_class().dump(row))
+    
+    def test_loose_types_match_marshmallow(self, app):
+        """Test values that need converting, and dictionaries with absent keys."""
+        rows = [
+            SimpleNamespace(id=7, name=b'bytes', email=None, projects=('a', 3), deactivated='12',
+                            invited=1.9, created_at=True, updated_at=None),
+            {'id': 'only-id', 'projects': None},
+        ]
+        schema = EmployeeResponseSchema(many=True)
+        assert _json(app, compile_schema(schema).dump(rows)) == _json(app, schema.dump(rows))
+        
+        task = SimpleNamespace(id='t', name='n', project_id='p', description=None, status='pending',
+                               priority='low', labels=None, billable=1, employees=[], deadline=None,
+                               created_at=1, updated_at=2)
+        assert compile_schema(TaskResponseSchema()).dump(task) == TaskResponseSchema().dump(task)
+    
+    def test_unsupported_fields_and_hooks_fall_back(self, app):
+        """Test fields without an inline form and dump hooks still match marshmallow."""
+        class CustomSchema(Schema):
+            name = fields.String(data_key='title')
+            score = fields.Float()
+            nested = fields.Dict()
+            
+        class HookSchema(Schema):
+            name = fields.String()
+            
+            @post_dump
+            def shout(self, data, **kwargs):
+                data['name'] = data['name'].upper()
+                return data
+        
+        obj = SimpleNamespace(name='x', score=1, nested={'a': 1})
+        for schema in (CustomSchema(), HookSchema()):
+            assert compile_schema(schema).dump(obj) == schema.dump(obj)
+
+
+LOAD_CASES = {
+    TaskCreateSchema: [
+        {'name': 'a', 'project_id': 'p'},
+        {'name': 'a', 'project_id': 'p', 'billable': 'true', 'labels': None, 'deadline': None},
+        {'name': 'a', 'project_id': 'p', 'status': 'bogus'},
+        {'name': '', 'project_id': 'p'},
+        {'project_id': 'p'},
+        {'name': 'a', 'project_id': 'p', 'deadline': True},
+        {'name': 'a', 'project_id': 'p', 'deadline': '12'},
+        {'name': 'a', 'project_id': 'p', 'deadline': -1},
+        {'name': 'a', 'project_id': 'p', 'unknown': 1},
+        'not a dict',
+    ],
+    TaskUpdateSchema: [{'status': 'completed'}, {}, {'status': None}, {'description': None}, {'deadline': 1.0}],
+    EmployeeCreateSchema: [{'name': 'x', 'email': 'a@b.co', 'projects': ['z', 'a', 'z']}, {'name': 'x'}],
+    EmployeeUpdateSchema: [
+        {'name': 'x', 'email': 'a@b.co', 'projects': ['b', 'a', 'b']},
+        {'email': 'bad'},
+        {'projects': None},
+        {'projects': ['a', 1]},
+        {'projects': 'abc'},
+        {'invited': None, 'deactivated': 5},
+    ],
+    ProjectCreateSchema: [{'name': 'p'}, {'name': 'p', 'employees': None}],
+    ProjectUpdateSchema: [{'employees': ['b', 'a', 'b'], 'archived': True}, {'name': 'x' * 300}],
+}
+
+
+def _outcome(load):
+    try:
+        return 'ok', load()
+    except ValidationError as err:
+        return 'error', err.messages, err.valid_data
+
+
+class TestCompiledLoaders:
+    """Compiled request schemas must load, and reject, exactly like marshmallow."""
+    
+    @pytest.mark.parametrize('schema_class', list(LOAD_CASES), ids=lambda cls: cls.__name__)
+    def test_loads_match_marshmallow(self, schema_class):
+        """Test valid and invalid inputs, one at a time and as a list."""
+        compiled = compile_loader(schema_class())
+        cases = LOAD_CASES[schema_class]
+        for data in cases:
+            assert _outcome(lambda: compiled.load(data)) == _outcome(lambda: schema_class().load(data))
+        assert _outcome(lambda: compiled.load(cases, many=True)) == \
+            _outcome(lambda: schema_class().load(cases, many=True))
+    
+    def test_duplicates_removed_in_order(self):
+        """Test membership lists keep their first-seen order."""
+        compiled = compile_loader(EmployeeUpdateSchema())
+        assert compiled.load({'projects': ['b', 'a', 'b', 'c']})['projects'] == ['b', 'a', 'c']
@@ -0,0 +1,64 @@
+import pytest
+import logging
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool
+from app import create_app, db
+from config import ProductionConfig, config, engine_options, sqlite_pragmas
+
+
+class TestEngineProfiles:
+    """Test cases for the database engine settings."""
+    
+    def test_server_database_gets_pool(self):
+        """Test server databases get a sized, pre-pinged pool."""
+        options = engine_options('postgresql://user:secret@db/app')
+        assert options['pool_size'] > 0
+        assert options['pool_pre_ping'] is True
+        assert sqlite_pragmas('postgresql://user:secret@db/app') == {}
+    
+    def test_sqlite_file_uses_wal(self):
+        """Test file databases use WAL, memory databases keep their journal."""
+        assert 'pool_size' not in engine_options('sqlite:///app.db')
+        assert sqlite_pragmas('sqlite:///app.db')['journal_mode'] == 'WAL'
+        assert 'journal_mode' not in sqlite_pragmas('sqlite:///:memory:')
+    
+    def test_pragmas_applied_on_connect(self, app):
+        """Test SQLITE_PRAGMAS are set on the app's connections."""
+        with app.app_context():
+            busy_timeout = db.session.execute(text('PRAGMA busy_timeout')).scalar()
+        assert busy_timeout == app.config['SQLITE_PRAGMAS']['busy_timeout']
+    
+    def test_startup_settings_logged_in_production(self, tmp_path, monkeypatch, caplog):
+        """Test the engine and bcrypt settings reach the log under the production config."""
+        uri = f'sqlite:///{tmp_path / "prod.db"}'
+        monkeypatch.setitem(config, 'production_logging', type('LoggingConfig', (ProductionConfig,), {
+            'SQLALCHEMY_DATABASE_URI': uri,
+            'SQLALCHEMY_ENGINE_OPTIONS': engine_options(uri),
+            'BCRYPT_ROUNDS': None,
+            'BCRYPT_TARGET_MS': 1,
+            'BCRYPT_MIN_ROUNDS': 4
+        }))
+        # Back to Python's default, which the session app has already changed
+        logger = logging.getLogger('app')
+        level = logger.level
+        logger.setLevel(logging.NOTSET)
+        try:
+            app = create_app('production_logging')
+        finally:
+            logger.setLevel(level)
+        with app.app_context():
+            db.engine.dispose()
+        
+        messages = [record.getMessage() for record in caplog.records if record.name == 'app']
+        assert any(message.startswith(f'Database {uri}: pool=') for message in messages)
+        assert 'Calibrated bcrypt to 4 rounds' in messages
+    
+    def test_pool_settings_logged(self, make_app, caplog):
+        """Test the startup log reports the configured pool settings."""
+        make_app('pool.db', SQLALCHEMY_ENGINE_OPTIONS={
+            'poolclass': QueuePool, 'pool_size': 3, 'max_overflow': 7, 'pool_timeout': 9, 'pool_pre_ping': True
+        })
+        messages = [record.getMessage() for record in caplog.records if record.name == 'app']
+        assert any(
+            'pool=QueuePool size=3 overflow=7 timeout=9 pre_ping=True' in message for message in messages
+        )
@@ -9,7 +9,7 @@ class TestEmployeeAPI:
     
     def test_get_employees_empty(self, client, auth_headers, clean_db):
         """Test getting employees when none exist."""
-        response = client.get('/api/employees/', headers=auth_headers)
+        response = client.get('/api/v1/employee/', headers=auth_headers)
         assert response.status_code == 200
         data = json.loads(response.data)
         assert data['employees'] == []
@@ -17,7 +17,7 @@ class TestEmployeeAPI:
     
     def test_get_employees_with_data(self, client, auth_headers, created_employee):
         """Test getting employees with existing data."""
-        response = client.get('/api/employees/', headers=auth_headers)
+        response = client.get('/api/v1/employee/', headers=auth_headers)
         assert response.status_code == 200
         data = json.loads(response.data)
         assert len(data['employees']) == 1
@@ -37,7 +37,7 @@ class TestEmployeeAPI:
             db.session.commit()
         
         # Test first page
-        response = client.get('/api/employees/?page=1&per_page=10', headers=auth_headers)
+        response = client.get('/api/v1/employee/?page=1&per_page=10', headers=auth_headers)
         assert response.status_code == 200
         data = json.loads(response.data)
         assert len(data['employees']) == 10
@@ -46,7 +46,7 @@ class TestEmployeeAPI:
         assert data['pagination']['has_next'] is True
         
         # Test second page
-        response = client.get('/api/employees/?page=2&per_page=10', headers=auth_headers)
+        response = client.get('/api/v1/employee/?page=2&per_page=10', headers=auth_headers)
         assert response.status_code == 200
         data = json.loads(response.data)
         assert len(data['employees']) == 5
@@ -63,13 +63,13 @@ class TestEmployeeAPI:
             db.session.commit()
         
         # Search by name
-        response = client.get('/api/employees/?search=John', headers=auth_headers)
+        response = client.get('/api/v1/employee/?search=John', headers=auth_headers)
         assert response.status_code == 200
         data = json.loads(response.data)
         assert len(data['employees']) == 2  # John Smith and Bob Johnson
         
         # Search by email domain
-        response = client.get('/api/employees/?search=example.com', headers=auth_headers)
+        response = client.get('/api/v1/employee/?search=example.com', headers=auth_headers)
         assert response.status_code == 200
         data = json.loads(response.data)
         assert len(data['employees']) == 2  # john@example.com and bob@example.com
@@ -85,13 +85,13 @@ class TestEmployeeAPI:
             db.session.commit()
         
         # Get all employees
-        response = client.get('/api/employees/', headers=auth_headers)
+        response = client.get('/api/v1/employee/', headers=auth_headers)
         assert response.status_code == 200
         data = json.loads(response.data)
         assert len(data['employees']) == 2
         
         # Get active employees only
-        response = client.get('/api/employees/?active_only=true', headers=auth_headers)
+        response = client.get('/api/v1/employee/?active_only=true', headers=auth_headers)
         assert response.status_code == 200
         data = json.loads(response.data)
         assert len(data['employees']) == 1
@@ -106,7 +106,7 @@ class TestEmployeeAPI:
             'invited': int(time.time() * 1000)
         }
         
-        response = client.post('/api/employees/', 
+        response = client.post('/api/v1/employee/', 
                              headers=auth_headers,
                              data=json.dumps(employee_data),
                              content_type='application/json')
@@ -121,7 +121,7 @@ class TestEmployeeAPI:
     def test_create_employee_validation_error(self, client, auth_headers, clean_db):
         """Test employee creation with validation errors."""
         # Missing required fields
-        response = client.post('/api/employees/', 
+        response = client.post('/api/v1/employee/', 
                              headers=auth_headers,
                              data=json.dumps({}),
                              content_type='application/json')
@@ -138,7 +138,7 @@ class TestEmployeeAPI:
             'email': 'john.doe@example.com'  # Same as created_employee
         }
         
-        response = client.post('/api/employees/', 
+        response = client.post('/api/v1/employee/', 
                              headers=auth_headers,
                              data=json.dumps(employee_data),
                              content_type='application/json')
@@ -149,7 +149,7 @@ class TestEmployeeAPI:
     
     def test_get_employee_success(self, client, auth_headers, created_employee):
         """Test getting a specific employee."""
-        response = client.get(f'/api/employees/{created_employee.id}', headers=auth_headers)
+        response = client.get(f'/api/v1/employee/{created_employee.id}', headers=auth_headers)
         
         assert response.status_code == 200
         data = json.loads(response.data)
@@ -159,7 +159,7 @@ class TestEmployeeAPI:
     
     def test_get_employee_not_found(self, client, auth_headers, clean_db):
         """Test getting non-existent employee."""
-        response = client.get('/api/employees/non-existent-id', headers=auth_headers)
+        response = client.get('/api/v1/employee/non-existent-id', headers=auth_headers)
         
         assert response.status_code == 404
         data = json.loads(response.data)
@@ -173,7 +173,7 @@ class TestEmployeeAPI:
             'projects': ['new-project']
         }
         
-        response = client.put(f'/api/employees/{created_employee.id}',
+        response = client.put(f'/api/v1/employee/{created_employee.id}',
                             headers=auth_headers,
                             data=json.dumps(update_data),
                             content_type='application/json')
@@ -189,7 +189,7 @@ class TestEmployeeAPI:
         """Test updating non-existent employee."""
         update_data = {'name': 'New Name'}
         
-        response = client.put('/api/employees/non-existent-id',
+        response = client.put('/api/v1/employee/non-existent-id',
                             headers=auth_headers,
                             data=json.dumps(update_data),
                             content_type='application/json')
@@ -210,7 +210,7 @@ class TestEmployeeAPI:
             # Try to update emp1 with emp2's email
             update_data = {'email': 'emp2@example.com'}
             
-            response = client.put(f'/api/employees/{emp1.id}',
+            response = client.put(f'/api/v1/employee/{emp1.id}',
                                 headers=auth_headers,
                                 data=json.dumps(update_data),
                                 content_type='application/json')
@@ -221,19 +221,19 @@ class TestEmployeeAPI:
     
     def test_delete_employee_success(self, client, auth_headers, created_employee):
         """Test successful employee deletion."""
-        response = client.delete(f'/api/employees/{created_employee.id}', headers=auth_headers)
+        response = client.delete(f'/api/v1/employee/{created_employee.id}', headers=auth_headers)
         
         assert response.status_code == 200
         data = json.loads(response.data)
         assert data['message'] == 'Employee deleted successfully'
         
         # Verify employee is actually deleted
-        get_response = client.get(f'/api/employees/{created_employee.id}', headers=auth_headers)
+        get_response = client.get(f'/api/v1/employee/{created_employee.id}', headers=auth_headers)
         assert get_response.status_code == 404
     
     def test_delete_employee_not_found(self, client, auth_headers, clean_db):
         """Test deleting non-existent employee."""
-        response = client.delete('/api/employees/non-existent-id', headers=auth_headers)
+        response = client.delete('/api/v1/employee/non-existent-id', headers=auth_headers)
         
         assert response.status_code == 404
         data = json.loads(response.data)
@@ -243,7 +243,7 @@ class TestEmployeeAPI:
         """Test adding project to employee."""
         project_data = {'project_id': 'new-project-id'}
         
-        response = client.post(f'/api/employees/{created_employee.id}/projects',
+        response = client.post(f'/api/v1/employee/{created_employee.id}/projects',
                              headers=auth_headers,
                              data=json.dumps(project_data),
                              content_type='application/json')
@@ -258,7 +258,7 @@ class TestEmployeeAPI:
         # created_employee already has 'project-1'
         project_data = {'project_id': 'project-1'}
         
-        response = client.post(f'/api/employees/{created_employee.id}/projects',
+        response = client.post(f'/api/v1/employee/{created_employee.id}/projects',
                              headers=auth_headers,
                              data=json.dumps(project_data),
                              content_type='application/json')
@@ -270,7 +270,7 @@ class TestEmployeeAPI:
     def test_remove_project_from_employee(self, client, auth_headers, created_employee):
         """Test removing project from employee."""
         # created_employee has 'project-1'
-        response = client.delete(f'/api/employees/{created_employee.id}/projects/project-1',
+        response = client.delete(f'/api/v1/employee/{created_employee.id}/projects/project-1',
                                headers=auth_headers)
         
         assert response.status_code == 200
@@ -280,7 +280,7 @@ class TestEmployeeAPI:
     
     def test_remove_non_existent_project_from_employee(self, client, auth_headers, created_employee):
         """Test removing non-existent project from employee."""
-        response = client.delete(f'/api/employees/{created_employee.id}/projects/non-existent-project',
+        response = client.delete(f'/api/v1/employee/{created_employee.id}/projects/non-existent-project',
                                headers=auth_headers)
         
         assert response.status_code == 404
@@ -289,7 +289,7 @@ class TestEmployeeAPI:
     
     def test_deactivate_employee(self, client, auth_headers, created_employee):
         """Test deactivating employee."""
-        response = client.post(f'/api/employees/{created_employee.id}/deactivate',
+        response = client.post(f'/api/v1/employee/{created_employee.id}/deactivate',
                              headers=auth_headers)
         
         assert response.status_code == 200
@@ -305,7 +305,7 @@ class TestEmployeeAPI:
             db.session.add(employee)
             db.session.commit()
             
-            response = client.post(f'/api/employees/{employee.id}/deactivate',
+            response = client.post(f'/api/v1/employee/{employee.id}/deactivate',
                                  headers=auth_headers)
             
             assert response.status_code == 409
@@ -320,7 +320,7 @@ class TestEmployeeAPI:
             db.session.add(employee)
             db.session.commit()
             
-            response = client.post(f'/api/employees/{employee.id}/reactivate',
+            response = client.post(f'/api/v1/employee/{employee.id}/reactivate',
                                  headers=auth_headers)
             
             assert response.status_code == 200
@@ -330,7 +330,7 @@ class TestEmployeeAPI:
     
     def test_reactivate_active_employee(self, client, auth_headers, created_employee):
         """Test reactivating already active employee."""
-        response = client.post(f'/api/employees/{created_employee.id}/reactivate',
+        response = client.post(f'/api/v1/employee/{created_employee.id}/reactivate',
                              headers=auth_headers)
         
         assert response.status_code == 409
@@ -341,17 +341,71 @@ class TestEmployeeAPI:
         """Test accessing employee endpoints without authentication."""
         # Test various endpoints without auth headers
         endpoints = [
-            ('GET', '/api/employees/'),
-            ('POST', '/api/employees/'),
-            ('GET', '/api/employees/some-id'),
-            ('PUT', '/api/employees/some-id'),
-            ('DELETE', '/api/employees/some-id'),
-            ('POST', '/api/employees/some-id/projects'),
-            ('DELETE', '/api/employees/some-id/projects/proj-id'),
-            ('POST', '/api/employees/some-id/deactivate'),
-            ('POST', '/api/employees/some-id/reactivate'),
+            ('GET', '/api/v1/employee/'),
+            ('POST', '/api/v1/employee/'),
+            ('GET', '/api/v1/employee/some-id'),
+            ('PUT', '/api/v1/employee/some-id'),
+            ('DELETE', '/api/v1/employee/some-id'),
+            ('POST', '/api/v1/employee/some-id/projects'),
+            ('DELETE', '/api/v1/employee/some-id/projects/proj-id'),
+            ('POST', '/api/v1/employee/some-id/deactivate'),
+            ('POST', '/api/v1/employee/some-id/reactivate'),
         ]
         
         for method, endpoint in endpoints:
             response = getattr(client, method.lower())(endpoint)
-            assert response.status_code == 401 
\ No newline at end of file
+            assert response.status_code == 401 
+    
+    def test_bulk_create_employees_reports_item_errors(self, client, auth_headers, created_employee):
+        """Test bulk creation inserts the valid items and reports the rest by index."""
+        payload = [
+            {'name': 'Ann', 'email': 'ann@example.com', 'projects': ['project-1']},
+            {'name': 'Taken', 'email': 'john.doe@example.com'},  # Already in the database
+            {'name': 'Ann Again', 'email': 'ann@example.com'},  # Duplicate within the request
+            {'name': 'Bad', 'email': 'not-an-email'},
+            {'name': 'Bob', 'email': 'bob@example.com'}
+        ]
+        response = client.post('/api/v1/employee/bulk', json=payload, headers=auth_headers)
+        assert response.status_code == 207
+        data = json.loads(response.data)
+        assert [emp['email'] for emp in data['employees']] == ['ann@example.com', 'bob@example.com']
+        assert data['employees'][0]['projects'] == ['project-1']
+        assert [error['index'] for error in data['errors']] == [1, 2, 3]
+        assert 'email' in data['errors'][2]['messages']
+        
+        with client.application.app_context():
+            ann = Employee.query.filter_by(email='ann@example.com').one()
+            assert ann.projects == ['project-1']
+            assert Employee.query.count() == 3
+    
+    def test_bulk_create_employees_rejects_non_list(self, client, auth_headers, clean_db):
+        """Test bulk creation requires a non-empty list."""
+        response = client.post('/api/v1/employee/bulk', json={'name': 'Ann'}, headers=auth_headers)
+        assert response.status_code == 400
+    
+    def test_get_employee_not_modified(self, client, auth_headers, created_employee):
+        """Test a matching If-None-Match gets a 304 until the employee changes."""
+        url = f'/api/v1/employee/{created_employee.id}'
+        etag = client.get(url, headers=auth_headers).headers['ETag']
+        
+        response = client.get(url, headers={**auth_headers, 'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.data == b''
+        
+        time.sleep(0.002)  # updated_at has millisecond resolution
+        client.put(url, json={'name': 'Renamed'}, headers=auth_headers)
+        response = client.get(url, headers={**auth_headers, 'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+    
+    def test_list_employees_not_modified(self, client, auth_headers, created_employee):
+        """Test the list ETag covers the query parameters and new rows."""
+        url = '/api/v1/employee/?per_page=5'
+        etag = client.get(url, headers=auth_headers).headers['ETag']
+        
+        assert client.get(url, headers={**auth_headers, 'If-None-Match': etag}).status_code == 304
+        response = client.get('/api/v1/employee/?per_page=6', headers={**auth_headers, 'If-None-Match': etag})
+        assert response.status_code == 200
+        
+        client.post('/api/v1/employee/', json={'name': 'Ann', 'email': 'ann@example.com'}, headers=auth_headers)
+        assert client.get(url, headers={**auth_headers, 'If-None-Match': etag}).status_code == 200
@@ -136,4 +136,49 @@ class TestEmployeeModel:
             assert employee_dict['invited'] == current_time
             assert employee_dict['deactivated'] is None
             assert employee_dict['created_at'] is not None
-            assert employee_dict['updated_at'] is not None 
\ No newline at end of file
+            assert employee_dict['updated_at'] is not None
+    
+    def test_project_membership_is_shared(self, app, clean_db):
+        """Test that employee and project views read the same membership rows."""
+        from app.models.project import Project
+        from app.models.employee_project import EmployeeProject
+        with app.app_context():
+            employee = Employee(name='Test User', email='test@example.com')
+            project = Project(name='Shared Project')
+            db.session.add_all([employee, project])
+            db.session.commit()
+            
+            employee.add_project(project.id)
+            db.session.commit()
+            assert project.employees == [employee.id]
+            
+            project.remove_employee(employee.id)
+            db.session.commit()
+            assert employee.projects == []
+            assert EmployeeProject.query.filter_by(project_id=project.id).count() == 0
+            
+            db.session.delete(project)
+            db.session.commit()
+    
+    def test_project_employees_assignment(self, app, clean_db):
+        """Test assigning project employees round-trips without flushing, and rejects unknown IDs."""
+        from app.models.project import Project
+        with app.app_context():
+            first = Employee(name='First', email='first@example.com')
+            second = Employee(name='Second', email='second@example.com')
+            project = Project(name='Roster')
+            db.session.add_all([first, second, project])
+            db.session.commit()
+            
+            project.employees = [second.id, first.id, second.id]
+            assert db.session.new  # The membership rows wait for the next flush
+            assert project.employees == [second.id, first.id]
+            
+            with pytest.raises(ValueError, match='missing-employee'):
+                project.employees = [first.id, 'missing-employee']
+            assert project.employees == [second.id, first.id]
+            
+            db.session.commit()
+            assert project.employees == [second.id, first.id]
+            db.session.delete(project)
+            db.session.commit()
@@ -262,4 +262,17 @@ class TestEmployeeSchemas:
         
         with pytest.raises(ValidationError) as exc_info:
             schema.load(data)
-        assert 'project_id' in exc_info.value.messages 
\ No newline at end of file
+        assert 'project_id' in exc_info.value.messages
+    
+    def test_employee_list_schema_cursor(self):
+        """Test EmployeeListSchema decodes an opaque pagination cursor."""
+        from app.schemas.pagination import encode_cursor
+        schema = EmployeeListSchema()
+        cursor = encode_cursor(1640995200000, 'employee-id')
+        
+        result = schema.load({'cursor': cursor})
+        assert result['cursor'] == (1640995200000, 'employee-id')
+        
+        with pytest.raises(ValidationError) as exc_info:
+            schema.load({'cursor': 'not-a-cursor'})
+        assert 'cursor' in exc_info.value.messages
@@ -0,0 +1,96 @@
+import pytest
+import json
+import os
+from app.utils.cache import EntityCache, entity_cache
+
+
+class TestEntityCache:
+    """Test cases for the in-process entity cache."""
+    
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted first."""
+        cache = EntityCache(max_size=2, ttl=60)
+        cache.set(('tasks', 'a'), {'id': 'a'}, cache.token())
+        cache.set(('tasks', 'b'), {'id': 'b'}, cache.token())
+        cache.get(('tasks', 'a'))
+        cache.set(('tasks', 'c'), {'id': 'c'}, cache.token())
+        
+        assert cache.get(('tasks', 'b')) is None
+        assert cache.get(('tasks', 'a')) == {'id': 'a'}
+        assert cache.stats()['evictions'] == 1
+    
+    def test_expired_entries_miss(self):
+        """Test entries are not served past their time to live."""
+        cache = EntityCache(max_size=2, ttl=-1)
+        cache.set(('tasks', 'a'), {'id': 'a'}, cache.token())
+        assert cache.get(('tasks', 'a')) is None
+        assert cache.stats()['misses'] == 1
+    
+    def test_invalidate_drops_dependents_and_tables(self):
+        """Test invalidating a key drops its dependents, and a None id drops a table."""
+        cache = EntityCache(max_size=10, ttl=60)
+        cache.set(('projects', 'p'), {'id': 'p'}, cache.token())
+        cache.set(('tasks', 't'), {'id': 't'}, cache.token(), depends_on=[('projects', 'p')])
+        cache.set(('employees', 'e'), {'id': 'e'}, cache.token())
+        
+        cache.invalidate({('projects', 'p')})
+        assert cache.get(('tasks', 't')) is None
+        assert cache.get(('employees', 'e')) == {'id': 'e'}
+        
+        cache.invalidate({('employees', None)})
+        assert cache.get(('employees', 'e')) is None
+    
+    def test_set_after_invalidation_is_ignored(self):
+        """Test a value read before a committed write is not cached."""
+        cache = EntityCache(max_size=10, ttl=60)
+        token = cache.token()
+        cache.invalidate({('employees', 'e')})
+        cache.set(('employees', 'e'), {'name': 'stale'}, token)
+        assert cache.get(('employees', 'e')) is None
+    
+    def test_update_invalidates_cached_employee(self, client, auth_headers, app, created_employee):
+        """Test a cached employee is dropped when it is updated."""
+        url = f'/api/v1/employee/{created_employee.id}'
+        client.get(url, headers=auth_headers)
+        client.get(url, headers=auth_headers)
+        with app.app_context():
+            assert entity_cache().stats()['hits'] >= 1
+        
+        client.put(url, json={'name': 'Renamed'}, headers=auth_headers)
+        response = client.get(url, headers=auth_headers)
+        assert json.loads(response.data)['employee']['name'] == 'Renamed'
+    
+    def test_invalidation_reaches_other_processes(self):
+        """Test an invalidation in a forked process drops the entry cached here."""
+        cache = EntityCache(max_size=10, ttl=60)
+        cache.set(('employees', 'e'), {'name': 'stale'}, cache.token())
+        
+        pid = os.fork()
+        if pid == 0:
+            EntityCache().invalidate({('employees', 'e')})
+            os._exit(0)
+        os.waitpid(pid, 0)
+        
+        assert ('employees', 'e') not in cache
+        assert cache.get(('employees', 'e')) is None
+    
+    def test_write_through_one_app_changes_etag_of_another(self, make_app, auth_headers):
+        """Test a write through one app instance is seen by another serving the same database."""
+        writer, reader = make_app('cache.db'), make_app('cache.db')
+        response = writer.test_client().post('/api/v1/employee/', json={
+            'name': 'Ada', 'email': 'ada@example.com'
+        }, headers=auth_headers)
+        url = f"/api/v1/employee/{json.loads(response.data)['employee']['id']}"
+        
+        client = reader.test_client()
+        etag = client.get(url, headers=auth_headers).headers['ETag']
+        response = client.get(url, headers={**auth_headers, 'If-None-Match': etag})
+        assert response.status_code == 304
+        with reader.app_context():
+            assert entity_cache().stats()['hits'] >= 1
+        
+        writer.test_client().put(url, json={'name': 'Renamed'}, headers=auth_headers)
+        response = client.get(url, headers={**auth_headers, 'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+        assert json.loads(response.data)['employee']['name'] == 'Renamed'
@@ -0,0 +1,76 @@
+import pytest
+import json
+import os
+import time
+import tracemalloc
+from app import db
+from app.models.employee import Employee
+from app.utils.memory import top_sites
+
+
+@pytest.fixture
+def traced_app(make_app):
+    """App in debug mode with per-request memory tracking."""
+    app = make_app(DEBUG=True, MEMORY_TRACKING_ENABLED=True)
+    with app.app_context():
+        invited = int(time.time() * 1000)
+        db.session.add_all([
+            Employee(name=f'Employee {index}', email=f'employee{index}@example.com', invited=invited)
+            for index in range(50)
+        ])
+        db.session.commit()
+    return app
+
+
+class TestMemoryTracking:
+    """Test cases for per-request memory tracking."""
+    
+    def test_debug_headers_report_peak_and_sites(self, traced_app, auth_headers):
+        """Test list responses carry their peak allocation and top allocation sites."""
+        app = traced_app
+        response = app.test_client().get('/api/v1/employee/?per_page=50', headers=auth_headers)
+        
+        assert response.status_code == 200
+        assert int(response.headers['X-Memory-Peak']) > len(response.data)
+        sites = response.headers['X-Memory-Top'].split(', ')
+        assert 0 < len(sites) <= app.config['MEMORY_TOP_SITES']
+        assert all(int(site.rsplit('=', 1)[1]) > 0 for site in sites)
+    
+    def test_metrics_report_memory_per_endpoint(self, traced_app, auth_headers):
+        """Test /metrics has the peak histogram and allocation sites per endpoint."""
+        app = traced_app
+        client = app.test_client()
+        client.get('/api/v1/employee/', headers=auth_headers)
+        body = client.get('/metrics').data.decode()
+        
+        assert 'http_request_memory_peak_bytes_count{blueprint="employees",endpoint="employees.get_employees"} 1' in body
+        assert 'http_request_allocated_bytes_total{blueprint="employees",endpoint="employees.get_employees",site="' in body
+    
+    def test_disabled_by_default(self, client, auth_headers):
+        """Test no memory headers are added without MEMORY_TRACKING_ENABLED."""
+        response = client.get('/api/v1/employee/', headers=auth_headers)
+        
+        assert 'X-Memory-Peak' not in response.headers
+        assert not tracemalloc.is_tracing()
+    
+    def test_tracing_stops_after_request(self, traced_app, auth_headers):
+        """Test tracemalloc only runs while a request is traced."""
+        app = traced_app
+        app.test_client().get('/api/v1/employee/', headers=auth_headers)
+        
+        assert not tracemalloc.is_tracing()
+    
+    def test_sites_are_charged_to_project_code(self):
+        """Test allocations are reported at the innermost line under the project root."""
+        tracemalloc.start(10)
+        try:
+            kept = [json.dumps({'index': index}) for index in range(2000)]
+            snapshot = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        site, size = top_sites(snapshot, 1, root)[0]
+        assert site.startswith(os.path.join('tests', 'test_memory.py:'))
+        assert size > 0
+        assert kept
@@ -0,0 +1,68 @@
+import pytest
+import json
+import os
+import threading
+from app.utils.metrics import Metrics, render
+
+
+class TestMetrics:
+    """Test cases for request metrics."""
+    
+    def test_requests_are_recorded(self, client, auth_headers):
+        """Test /metrics reports counts, latency and phases per endpoint."""
+        client.get('/api/v1/employee/', headers=auth_headers)
+        body = client.get('/metrics').data.decode()
+        
+        assert 'http_requests_total{blueprint="employees",endpoint="employees.get_employees",method="GET",status="200"}' in body
+        assert 'http_request_duration_seconds_bucket{blueprint="employees",endpoint="employees.get_employees",method="GET",le="+Inf"}' in body
+        assert 'http_request_phase_seconds_count{blueprint="employees",endpoint="employees.get_employees",phase="db"}' in body
+        assert 'http_response_size_bytes_sum{blueprint="employees",endpoint="employees.get_employees"}' in body
+    
+    def test_histogram_buckets_are_cumulative(self):
+        """Test histogram buckets accumulate and end in the total count."""
+        registry = Metrics()
+        labels = (('blueprint', 'tasks'), ('endpoint', 'tasks.get_task'), ('method', 'GET'))
+        for seconds in (0.0005, 0.003, 20.0):
+            registry.observe('http_request_duration_seconds', labels, seconds)
+        body = render(*registry.snapshot())
+        
+        assert 'le="0.001"} 1\n' in body
+        assert 'le="0.005"} 2\n' in body
+        assert 'le="10.0"} 2\n' in body
+        assert 'le="+Inf"} 3\n' in body
+        assert 'http_request_duration_seconds_count{blueprint="tasks",endpoint="tasks.get_task",method="GET"} 3' in body
+    
+    def test_worker_files_are_merged(self, tmp_path):
+        """Test totals written by other workers are added to this one's."""
+        labels = (('blueprint', 'tasks'), ('endpoint', 'tasks.get_tasks'), ('method', 'GET'), ('status', '200'))
+        other = {'counters': [['http_requests_total', [list(pair) for pair in labels], 5]], 'histograms': []}
+        (tmp_path / '1.json').write_text(json.dumps(other))
+        
+        registry = Metrics(directory=str(tmp_path))
+        registry.inc('http_requests_total', labels, 2)
+        counters, _ = registry.collect()
+        
+        assert counters[('http_requests_total', labels)] == 7
+        assert (tmp_path / f'{os.getpid()}.json').exists()
+    
+    def test_finished_threads_are_folded_into_retired_totals(self):
+        """Test shards do not outlive their threads and their counts are kept."""
+        registry = Metrics()
+        labels = (('blueprint', 'tasks'), ('endpoint', 'tasks.get_task'), ('method', 'GET'))
+        
+        def record():
+            registry.inc('http_requests_total', labels)
+            registry.observe('http_request_duration_seconds', labels, 0.003)
+        
+        for _ in range(50):
+            thread = threading.Thread(target=record)
+            thread.start()
+            thread.join()
+        assert len(registry._shards) <= 1
+        
+        record()
+        counters, histograms = registry.snapshot()
+        assert list(registry._shards) == [threading.current_thread()]
+        assert counters[('http_requests_total', labels)] == 51
+        assert histograms[('http_request_duration_seconds', labels)][-2:] == [0, pytest.approx(0.153)]
+        assert sum(histograms[('http_request_duration_seconds', labels)][:-1]) == 51
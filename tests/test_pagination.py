@@ -0,0 +1,171 @@
+import pytest
+import json
+import time
+from app import db
+from app.models.employee import Employee
+from app.models.project import Project
+from app.models.task import Task
+from app.schemas.pagination import Cursor
+
+CREATED_AT = 1640995200000
+
+# list URL, response key
+ENDPOINTS = {
+    'employees': ('/api/v1/employee/', 'employees'),
+    'projects': ('/api/v1/project/', 'projects'),
+    'tasks': ('/api/v1/task/', 'tasks'),
+}
+
+
+@pytest.fixture
+def listed_rows(app, clean_db):
+    """Create 7 rows of each entity, several sharing a created_at so the id breaks the tie."""
+    with app.app_context():
+        project = Project(name='Owner', created_at=CREATED_AT - 1000)
+        db.session.add(project)
+        db.session.flush()
+        ids = {'employees': [], 'projects': [project.id], 'tasks': []}
+        for i in range(7):
+            created_at = CREATED_AT + (i // 3)  # 3, 3 and 1 rows per timestamp
+            employee = Employee(name=f'Worker {i}', email=f'worker{i}@example.com', created_at=created_at)
+            other = Project(name=f'Project {i}', created_at=created_at)
+            task = Task(name=f'Task {i}', project_id=project.id, created_at=created_at)
+            db.session.add_all([employee, other, task])
+            db.session.flush()
+            ids['employees'].append(employee.id)
+            ids['projects'].append(other.id)
+            ids['tasks'].append(task.id)
+        db.session.commit()
+        yield ids
+        Task.query.delete()
+        Project.query.delete()
+        db.session.commit()
+
+
+def _walk(client, headers, url, per_page, **params):
+    """Follow next_cursor from the first page to the last, returning the IDs in order."""
+    key = next(key for prefix, key in ENDPOINTS.values() if url.startswith(prefix))
+    query = {'per_page': per_page, **params}
+    seen, pages = [], 0
+    while True:
+        response = client.get(url, query_string=query, headers=headers)
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        seen.extend(row['id'] for row in data[key])
+        pages += 1
+        pagination = data['pagination']
+        assert pagination['has_next'] is (pagination['next_cursor'] is not None)
+        if not pagination['has_next']:
+            return seen, pages
+        query['cursor'] = pagination['next_cursor']
+
+
+class TestCursorPagination:
+    """Test cases for keyset cursor pagination on the list endpoints."""
+
+    @pytest.mark.parametrize('entity', ENDPOINTS)
+    def test_cursor_walks_every_row_once(self, client, auth_headers, app, listed_rows, entity):
+        """Test following next_cursor returns each row exactly once, newest first."""
+        url, _ = ENDPOINTS[entity]
+        seen, pages = _walk(client, auth_headers, url, per_page=2)
+
+        assert len(seen) == len(set(seen)) == len(listed_rows[entity])
+        assert pages == -(-len(listed_rows[entity]) // 2)
+        with app.app_context():
+            model = {'employees': Employee, 'projects': Project, 'tasks': Task}[entity]
+            expected = [row.id for row in model.query.order_by(model.created_at.desc(), model.id.desc())]
+        assert seen == expected
+
+    @pytest.mark.parametrize('entity', ENDPOINTS)
+    def test_cursor_page_ends_inside_a_tie(self, client, auth_headers, listed_rows, entity):
+        """Test a page boundary between rows with the same created_at neither skips nor repeats."""
+        url, _ = ENDPOINTS[entity]
+        # Pages of 1 and 4 end inside the groups of rows sharing a timestamp
+        for per_page in (1, 4):
+            seen, _ = _walk(client, auth_headers, url, per_page=per_page)
+            assert sorted(seen) == sorted(listed_rows[entity])
+
+    def test_cursor_keeps_filters(self, client, auth_headers, listed_rows):
+        """Test the cursor pages through the filtered rows only."""
+        seen, _ = _walk(client, auth_headers, '/api/v1/task/', per_page=2, status='pending')
+        assert sorted(seen) == sorted(listed_rows['tasks'])
+        seen, _ = _walk(client, auth_headers, '/api/v1/task/', per_page=2, status='completed')
+        assert seen == []
+
+    def test_cursor_with_search_rank(self, client, auth_headers, listed_rows):
+        """Test ranked search results page with their rank in the cursor."""
+        response = client.get('/api/v1/employee/?search=Worker&per_page=2', headers=auth_headers)
+        cursor = json.loads(response.data)['pagination']['next_cursor']
+        assert len(Cursor().deserialize(cursor)) == 3
+
+        seen, _ = _walk(client, auth_headers, '/api/v1/employee/', per_page=2, search='Worker')
+        assert sorted(seen) == sorted(listed_rows['employees'])
+
+    @pytest.mark.parametrize('entity', ENDPOINTS)
+    @pytest.mark.parametrize('cursor', ['not-a-cursor', 'WzEsMiwzLDRd', 'eyJhIjoxfQ'])
+    def test_invalid_cursor_is_rejected(self, client, auth_headers, listed_rows, entity, cursor):
+        """Test a malformed cursor is a 400, not a server error or an empty page."""
+        url, _ = ENDPOINTS[entity]
+        response = client.get(url, query_string={'cursor': cursor}, headers=auth_headers)
+        assert response.status_code == 400
+        assert 'cursor' in json.loads(response.data)['messages']
+
+
+@pytest.fixture
+def frozen_ms(monkeypatch):
+    """Make every write in the test happen within the same millisecond."""
+    monkeypatch.setattr(time, 'time', lambda: (CREATED_AT + 5000) / 1000)
+
+
+class TestPageETags:
+    """Test cases for the ETags of list pages."""
+
+    def _etag(self, client, headers, url, **params):
+        response = client.get(url, query_string={'per_page': 100, **params}, headers=headers)
+        assert response.status_code == 200
+        return response.headers['ETag']
+
+    def _is_current(self, client, headers, url, etag, **params):
+        response = client.get(
+            url, query_string={'per_page': 100, **params}, headers={**headers, 'If-None-Match': etag}
+        )
+        return response.status_code == 304
+
+    def test_edits_within_one_millisecond(self, client, auth_headers, listed_rows, frozen_ms):
+        """Test an edit or a delete and insert with the same count and latest updated_at changes the ETag."""
+        first, second, third = listed_rows['projects'][1:4]
+        url = '/api/v1/project/'
+        client.put(f'{url}{first}', json={'name': 'Edited'}, headers=auth_headers)
+        etag = self._etag(client, auth_headers, url)
+        assert self._is_current(client, auth_headers, url, etag)
+
+        client.put(f'{url}{second}', json={'name': 'Edited too'}, headers=auth_headers)
+        assert not self._is_current(client, auth_headers, url, etag)
+
+        etag = self._etag(client, auth_headers, url)
+        assert client.delete(f'{url}{third}', headers=auth_headers).status_code == 200
+        client.post(url, json={'name': 'Replacement'}, headers=auth_headers)
+        assert not self._is_current(client, auth_headers, url, etag)
+
+    def test_task_etag_follows_memberships(self, client, auth_headers, listed_rows, frozen_ms):
+        """Test a task page changes when its project gains a member, however close in time."""
+        owner = listed_rows['projects'][0]
+        client.put(f'/api/v1/project/{owner}', json={'name': 'Touched'}, headers=auth_headers)
+        etag = self._etag(client, auth_headers, '/api/v1/task/')
+
+        employee = listed_rows['employees'][0]
+        client.put(f'/api/v1/employee/{employee}', json={'projects': [owner]}, headers=auth_headers)
+        assert not self._is_current(client, auth_headers, '/api/v1/task/', etag)
+
+    def test_cursor_page_etag(self, client, auth_headers, listed_rows):
+        """Test a cursor page gets a 304 while its rows are unchanged and a new one after an edit."""
+        url = '/api/v1/employee/'
+        response = client.get(url, query_string={'per_page': 2}, headers=auth_headers)
+        cursor = json.loads(response.data)['pagination']['next_cursor']
+        response = client.get(url, query_string={'per_page': 2, 'cursor': cursor}, headers=auth_headers)
+        etag, employee_id = response.headers['ETag'], json.loads(response.data)['employees'][0]['id']
+        assert self._is_current(client, auth_headers, url, etag, per_page=2, cursor=cursor)
+
+        time.sleep(0.002)  # updated_at has millisecond resolution
+        client.put(f'{url}{employee_id}', json={'name': 'Renamed'}, headers=auth_headers)
+        assert not self._is_current(client, auth_headers, url, etag, per_page=2, cursor=cursor)
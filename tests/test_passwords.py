@@ -0,0 +1,83 @@
+import pytest
+import json
+import threading
+from app import db
+from app.models.user import User
+from app.utils.passwords import HasherBusy, PasswordHasher, calibrate_rounds, hash_rounds
+
+
+class TestPasswordHasher:
+    """Test cases for the bounded password hashing pool."""
+
+    def test_hash_and_check(self):
+        """Test hashes use the configured cost and verify."""
+        hasher = PasswordHasher(rounds=4, workers=1, max_pending=2)
+        password_hash = hasher.hash('secret')
+
+        assert hash_rounds(password_hash) == 4
+        assert hasher.check('secret', password_hash)
+        assert not hasher.check('wrong', password_hash)
+        assert not hasher.needs_rehash(password_hash)
+        assert PasswordHasher(rounds=5).needs_rehash(password_hash)
+
+    def test_full_queue_raises(self):
+        """Test work is refused once every slot is taken."""
+        hasher = PasswordHasher(rounds=4, workers=1, max_pending=1)
+        started, release = threading.Event(), threading.Event()
+
+        def block():
+            started.set()
+            release.wait(5)
+
+        worker = threading.Thread(target=hasher._run, args=(block,))
+        worker.start()
+        started.wait(5)
+        try:
+            with pytest.raises(HasherBusy):
+                hasher.hash('secret')
+        finally:
+            release.set()
+            worker.join()
+        assert hash_rounds(hasher.hash('secret')) == 4
+
+    def test_calibrate_rounds_bounds(self):
+        """Test calibration stays within the allowed costs."""
+        assert calibrate_rounds(0, min_rounds=4, max_rounds=6) == 4
+        assert calibrate_rounds(10 ** 9, min_rounds=4, max_rounds=6) == 6
+
+
+class TestPasswordAuth:
+    """Test cases for the auth endpoints using the hashing pool."""
+
+    def test_login_rehashes_to_configured_cost(self, client, app, test_user):
+        """Test a login with a hash of another cost stores a new hash."""
+        response = client.post('/api/auth/login', json={
+            'email': 'test@example.com', 'password': 'testpassword'
+        })
+        assert response.status_code == 200
+
+        with app.app_context():
+            user = db.session.get(User, test_user)
+            assert hash_rounds(user.password_hash) == app.config['BCRYPT_ROUNDS']
+
+        response = client.post('/api/auth/login', json={
+            'email': 'test@example.com', 'password': 'testpassword'
+        })
+        assert response.status_code == 200
+
+    def test_busy_hasher_returns_503(self, client, app, clean_db, monkeypatch):
+        """Test a saturated hashing pool answers 503 with Retry-After."""
+        hasher = app.extensions['password_hasher']
+
+        def busy(*args):
+            raise HasherBusy()
+
+        monkeypatch.setattr(hasher, '_run', busy)
+        response = client.post('/api/auth/register', json={
+            'email': 'new@example.com', 'name': 'New User',
+            'password': 'password123', 'confirm_password': 'password123'
+        })
+
+        assert response.status_code == 503
+        assert response.headers['Retry-After'] == str(app.config['BCRYPT_RETRY_AFTER'])
+        assert 'error' in json.loads(response.data)
@@ -0,0 +1,141 @@
+import pytest
+import json
+import os
+import threading
+import time
+from app.utils import profiler
+from app.utils.profiler import INDEX_FILE, Profile, Sampler, collapsed, make_profile_token, speedscope
+
+
+@pytest.fixture
+def profiled_app(make_app, tmp_path):
+    """App with profiling enabled, writing profiles to a temporary directory."""
+    app = make_app(
+        PROFILE_ENABLED=True,
+        PROFILE_INTERVAL_MS=1,
+        PROFILE_DIR=str(tmp_path / 'profiles'),
+        PROFILE_KEEP=2
+    )
+    
+    @app.route('/slow')
+    def slow():
+        time.sleep(0.05)
+        return {'ok': True}
+    
+    return app
+
+
+def _sample_profile():
+    profile = Profile(threading.get_ident())
+    profile.samples[(('main', '/srv/app.py', 1), ('handler', '/srv/views.py', 10))] = 3
+    profile.samples[(('main', '/srv/app.py', 1),)] = 1
+    profile.duration = 0.004
+    return profile
+
+
+class TestProfiler:
+    """Test cases for the request profiler."""
+    
+    def test_signed_header_profiles_request(self, profiled_app, auth_headers):
+        """Test a request with a valid X-Profile token is profiled and listed."""
+        app = profiled_app
+        client = app.test_client()
+        
+        response = client.get('/slow', headers={'X-Profile': make_profile_token(app)})
+        assert response.status_code == 200
+        
+        response = client.get('/api/admin/profiles', headers=auth_headers)
+        assert response.status_code == 200
+        profiles = json.loads(response.data)['profiles']
+        assert len(profiles) == 1
+        assert profiles[0]['endpoint'] == 'slow'
+        assert profiles[0]['method'] == 'GET'
+        assert profiles[0]['duration_ms'] >= 50
+        
+        name = profiles[0]['name']
+        folded = client.get(f'/api/admin/profiles/{name}/folded', headers=auth_headers)
+        assert folded.status_code == 200
+        assert b'slow (test_profiler.py' in folded.data
+        scope = client.get(f'/api/admin/profiles/{name}/speedscope', headers=auth_headers)
+        assert json.loads(scope.data)['profiles'][0]['type'] == 'sampled'
+    
+    def test_requests_without_valid_token_are_not_profiled(self, profiled_app, auth_headers):
+        """Test requests without a token, or with a forged one, are not profiled."""
+        app = profiled_app
+        client = app.test_client()
+        
+        client.get('/slow')
+        client.get('/slow', headers={'X-Profile': 'forged'})
+        
+        response = client.get('/api/admin/profiles', headers=auth_headers)
+        assert json.loads(response.data)['profiles'] == []
+    
+    def test_old_profiles_are_pruned(self, profiled_app, auth_headers):
+        """Test only PROFILE_KEEP profiles are kept and listed."""
+        app = profiled_app
+        client = app.test_client()
+        token = make_profile_token(app)
+        
+        for _ in range(4):
+            client.get('/slow', headers={'X-Profile': token})
+        
+        profiles = json.loads(client.get('/api/admin/profiles', headers=auth_headers).data)['profiles']
+        assert len(profiles) == 2
+        
+        # The index is rewritten along with the files, instead of growing forever
+        directory = app.config['PROFILE_DIR']
+        with open(os.path.join(directory, INDEX_FILE)) as file:
+            indexed = [json.loads(line)['name'] for line in file]
+        assert indexed == [profile['name'] for profile in reversed(profiles)]
+        assert len(os.listdir(directory)) == 2 * 2 + 1
+    
+    def test_samples_are_frozen_when_stopped(self, monkeypatch):
+        """Test the sampler cannot add samples to a profile after stop() returns."""
+        walking = threading.Event()
+        
+        def slow_stack(frame):
+            # Keep the sampler mid-sweep long enough for stop() to run
+            walking.set()
+            time.sleep(0.01)
+            return (('worker', 'worker.py', 1),)
+        
+        monkeypatch.setattr(profiler, '_stack', slow_stack)
+        sampler = Sampler(0.0001)
+        done = threading.Event()
+        worker = threading.Thread(target=done.wait)
+        worker.start()
+        try:
+            profile = sampler.start(worker.ident)
+            walking.wait(1)
+            sampler.stop(profile)
+            stopped = dict(profile.samples)
+            time.sleep(0.05)
+            assert dict(profile.samples) == stopped
+        finally:
+            done.set()
+            worker.join()
+    
+    def test_disabled_profiler_registers_nothing(self, app, client, auth_headers):
+        """Test the testing config has no profiler and the admin endpoint says so."""
+        assert 'profiler' not in app.extensions
+        response = client.get('/api/admin/profiles', headers=auth_headers)
+        assert response.status_code == 404
+    
+    def test_collapsed_format(self):
+        """Test collapsed stacks list frames root first, most sampled first."""
+        lines = collapsed(_sample_profile()).splitlines()
+        
+        assert lines == [
+            'main (app.py:1);handler (views.py:10) 3',
+            'main (app.py:1) 1',
+        ]
+    
+    def test_speedscope_format(self):
+        """Test the speedscope file shares frames between samples and weights them by time."""
+        data = speedscope(_sample_profile(), 'GET /slow', 0.001)
+        
+        assert [frame['name'] for frame in data['shared']['frames']] == ['main', 'handler']
+        profile = data['profiles'][0]
+        assert profile['samples'] == [[0, 1], [0]]
+        assert profile['weights'] == [3.0, 1.0]
+        assert profile['endValue'] == 4.0
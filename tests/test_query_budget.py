@@ -0,0 +1,94 @@
+import pytest
+import json
+from app import db
+from app.models.employee import Employee
+from app.models.project import Project
+from app.models.task import Task
+from app.utils.queries import RequestQueries, statement_shape
+
+
+@pytest.fixture
+def staffed_project(app, clean_db):
+    """Create a project with five members and five tasks."""
+    with app.app_context():
+        project = Project(name='Apollo')
+        db.session.add(project)
+        db.session.flush()
+        for i in range(5):
+            db.session.add(Employee(
+                name=f'Member {i}', email=f'member{i}@example.com', projects=[project.id], invited=0
+            ))
+            db.session.add(Task(name=f'Task {i}', project_id=project.id))
+        db.session.commit()
+        project_id = project.id
+        yield project_id
+        Task.query.delete()
+        Project.query.delete()
+        db.session.commit()
+
+
+class TestQueryBudgets:
+    """Test cases holding endpoints to a fixed number of queries, whatever the row count."""
+    
+    @pytest.mark.parametrize('url', ['/api/v1/employee/', '/api/v1/project/', '/api/v1/task/'])
+    def test_list_endpoints(self, client, auth_headers, staffed_project, query_budget, url):
+        """Test list endpoints do not query per row."""
+        with query_budget(4):
+            assert client.get(url, headers=auth_headers).status_code == 200
+    
+    @pytest.mark.parametrize('url', ['/api/v1/employee/', '/api/v1/project/', '/api/v1/task/'])
+    def test_cursor_pages(self, client, auth_headers, app, staffed_project, query_budget, url):
+        """Test cursor pages read the page and its memberships only, without counting the table."""
+        with app.app_context():
+            db.session.add(Project(name='Gemini'))
+            db.session.commit()
+        response = client.get(url, query_string={'per_page': 1}, headers=auth_headers)
+        cursor = json.loads(response.data)['pagination']['next_cursor']
+        
+        with query_budget(3) as statements:
+            response = client.get(url, query_string={'per_page': 1, 'cursor': cursor}, headers=auth_headers)
+            assert response.status_code == 200
+        assert not any('count(' in statement for statement in statements)
+    
+    def test_get_project(self, client, auth_headers, staffed_project, query_budget):
+        """Test a project and its members load in a fixed number of queries."""
+        with query_budget(2):
+            assert client.get(f'/api/v1/project/{staffed_project}', headers=auth_headers).status_code == 200
+    
+    def test_update_project_members(self, client, auth_headers, staffed_project, query_budget):
+        """Test replacing a project's members does not query per member."""
+        with query_budget(10):
+            response = client.put(
+                f'/api/v1/project/{staffed_project}', json={'employees': []}, headers=auth_headers
+            )
+            assert response.status_code == 200
+    
+    def test_delete_project(self, client, auth_headers, staffed_project, query_budget):
+        """Test deleting a project does not query per member."""
+        with query_budget(4):
+            assert client.delete(f'/api/v1/project/{staffed_project}', headers=auth_headers).status_code == 200
+
+
+class TestQueryTracking:
+    """Test cases for per-request query tracking."""
+    
+    def test_in_lists_share_a_shape(self):
+        """Test IN lists of different lengths count as the same statement."""
+        assert statement_shape('SELECT * FROM t WHERE id IN (?, ?, ?)') == statement_shape(
+            'SELECT * FROM t\n WHERE id IN (?)'
+        )
+    
+    def test_repeated_statements_are_suspects(self):
+        """Test statements repeated past the threshold are reported."""
+        queries = RequestQueries(slow_ms=100)
+        queries.shapes.update(['SELECT a'] * 12 + ['SELECT b'] * 2)
+        assert queries.suspects(10) == [('SELECT a', 12)]
+    
+    def test_server_timing_in_debug(self, app, client, auth_headers, staffed_project):
+        """Test debug responses report query count and database time."""
+        app.debug = True
+        try:
+            response = client.get('/api/v1/project/', headers=auth_headers)
+        finally:
+            app.debug = False
+        assert response.headers['Server-Timing'].startswith('db;dur=')
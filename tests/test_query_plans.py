@@ -0,0 +1,67 @@
+import itertools
+import pytest
+from sqlalchemy import text
+from app import db
+from app.api.employees import _build_employee_list_query
+from app.api.projects import _build_project_list_query
+from app.api.tasks import _build_task_list_query
+from app.models.employee import Employee
+from app.models.project import Project
+from app.models.task import Task
+from app.schemas.employee import EmployeeListSchema
+from app.schemas.project import ProjectListSchema
+from app.schemas.task import TaskListSchema
+from app.utils.pagination import sort_order
+
+
+def _combinations(**filters):
+    """Yield every subset of the given filters as query-string args."""
+    names = list(filters)
+    for picked in itertools.product([False, True], repeat=len(names)):
+        yield {name: filters[name] for name, use in zip(names, picked) if use}
+
+
+def _plan(query, model):
+    """Return the EXPLAIN QUERY PLAN details for one page of a list query."""
+    query = query.order_by(*sort_order(model)).limit(11)
+    sql = str(query.statement.compile(dialect=db.engine.dialect, compile_kwargs={'literal_binds': True}))
+    return [row[3] for row in db.session.execute(text(f'EXPLAIN QUERY PLAN {sql}'))]
+
+
+def _assert_indexed(plan, table, allow_sort=False):
+    assert f'SCAN {table}' not in plan, plan
+    assert any(table in step and 'USING' in step and 'INDEX' in step for step in plan), plan
+    if not allow_sort:
+        assert 'USE TEMP B-TREE FOR ORDER BY' not in plan, plan
+
+
+TASK_FILTERS = list(_combinations(
+    project_id='proj-1', status='pending', priority='high', billable='true', employee_id='emp-1'
+))
+PROJECT_FILTERS = list(_combinations(active_only='true', billable_only='true'))
+EMPLOYEE_FILTERS = list(_combinations(active_only='true'))
+
+
+class TestListQueryPlans:
+    """List endpoint queries should be served from an index in sort order."""
+
+    @pytest.mark.parametrize('args', TASK_FILTERS, ids=lambda args: ','.join(args) or 'none')
+    def test_task_list_uses_index(self, app, args):
+        with app.app_context():
+            query, _ = _build_task_list_query(TaskListSchema().load(args))
+            # employee_id alone expands to an IN over that employee's projects; each
+            # project is an index range, but merging them needs a (bounded) sort
+            allow_sort = 'employee_id' in args and 'project_id' not in args
+            _assert_indexed(_plan(query, Task), 'tasks', allow_sort=allow_sort)
+
+    @pytest.mark.parametrize('args', PROJECT_FILTERS, ids=lambda args: ','.join(args) or 'none')
+    def test_project_list_uses_index(self, app, args):
+        with app.app_context():
+            query, _ = _build_project_list_query(ProjectListSchema().load(args))
+            _assert_indexed(_plan(query, Project), 'projects')
+
+    @pytest.mark.parametrize('args', EMPLOYEE_FILTERS, ids=lambda args: ','.join(args) or 'none')
+    def test_employee_list_uses_index(self, app, args):
+        with app.app_context():
+            query, _ = _build_employee_list_query(EmployeeListSchema().load(args))
+            _assert_indexed(_plan(query, Employee), 'employees')
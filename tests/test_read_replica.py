@@ -0,0 +1,62 @@
+import pytest
+import json
+import time
+from app import db
+from app.utils.replica import STICKY_COOKIE, sync_sqlite
+
+
+@pytest.fixture
+def replica_app(make_app, tmp_path):
+    """App with a primary and a replica SQLite file, synced by hand."""
+    primary, replica = tmp_path / 'primary.db', tmp_path / 'replica.db'
+    app = make_app(
+        'primary.db',
+        SQLALCHEMY_BINDS={'replica': f'sqlite:///{replica}'},
+        ENTITY_CACHE_ENABLED=False
+    )
+    sync_sqlite(str(primary), str(replica))
+    return app, lambda: sync_sqlite(str(primary), str(replica))
+
+
+class TestReadReplica:
+    """Test cases for routing reads to the replica."""
+    
+    def employee_data(self):
+        return {'name': 'Jane', 'email': 'jane@example.com', 'invited': int(time.time() * 1000)}
+    
+    def test_reads_use_replica_until_synced(self, replica_app, auth_headers):
+        """Test other clients read from the replica, which lags until synced."""
+        app, sync = replica_app
+        response = app.test_client().post('/api/v1/employee/', json=self.employee_data(), headers=auth_headers)
+        assert response.status_code == 201
+        employee_id = json.loads(response.data)['employee']['id']
+        
+        reader = app.test_client()
+        assert reader.get(f'/api/v1/employee/{employee_id}', headers=auth_headers).status_code == 404
+        sync()
+        assert reader.get(f'/api/v1/employee/{employee_id}', headers=auth_headers).status_code == 200
+    
+    def test_writer_reads_own_writes(self, replica_app, auth_headers):
+        """Test a client that just wrote reads from the primary, by cookie or header."""
+        app, sync = replica_app
+        writer = app.test_client()
+        response = writer.post('/api/v1/employee/', json=self.employee_data(), headers=auth_headers)
+        employee_id = json.loads(response.data)['employee']['id']
+        assert writer.get_cookie(STICKY_COOKIE) is not None
+        
+        assert writer.get(f'/api/v1/employee/{employee_id}', headers=auth_headers).status_code == 200
+        
+        sticky = {**auth_headers, 'X-Read-Primary-Until': response.headers['X-Read-Primary-Until']}
+        assert app.test_client().get(f'/api/v1/employee/{employee_id}', headers=sticky).status_code == 200
+    
+    def test_writes_go_to_primary(self, replica_app, auth_headers):
+        """Test writes are not routed to the replica."""
+        app, sync = replica_app
+        client = app.test_client()
+        client.post('/api/v1/employee/', json=self.employee_data(), headers=auth_headers)
+        
+        with app.app_context():
+            assert db.session.execute(db.text('SELECT COUNT(*) FROM employees')).scalar() == 1
+            replica = db.engines['replica']
+            with replica.connect() as connection:
+                assert connection.exec_driver_sql('SELECT COUNT(*) FROM employees').scalar() == 0
@@ -0,0 +1,143 @@
+import pytest
+import json
+import sqlite3
+from sqlalchemy import inspect, text, update
+from app import db
+from app.models import fulltext
+from app.models.employee import Employee
+from app.models.fulltext import fts_in_sync, fts_table_name
+from app.models.project import Project
+
+with sqlite3.connect(':memory:') as _connection:
+    requires_fts5 = pytest.mark.skipif(
+        ('ENABLE_FTS5',) not in _connection.execute('PRAGMA compile_options').fetchall(),
+        reason='SQLite was built without FTS5'
+    )
+
+
+def _search(client, headers, url, term):
+    response = client.get(url, query_string={'search': term, 'per_page': 100}, headers=headers)
+    assert response.status_code == 200
+    key = 'employees' if 'employee' in url else 'projects'
+    return [row['name'] for row in json.loads(response.data)[key]]
+
+
+@pytest.fixture
+def projects(app, clean_db):
+    """Remove the projects created by a test."""
+    yield
+    with app.app_context():
+        Project.query.delete()
+        db.session.commit()
+
+
+@requires_fts5
+class TestFullTextSearch:
+    """Test cases for list search backed by the FTS5 indexes."""
+
+    def test_triggers_follow_inserts_updates_and_deletes(self, client, auth_headers, projects):
+        """Test API writes are searchable at once and stop matching when changed or deleted."""
+        response = client.post('/api/v1/project/', json={
+            'name': 'Compiler', 'description': 'Hopper team'
+        }, headers=auth_headers)
+        project_id = json.loads(response.data)['project']['id']
+        assert _search(client, auth_headers, '/api/v1/project/', 'hopp') == ['Compiler']
+
+        response = client.put(
+            f'/api/v1/project/{project_id}', json={'description': 'Brewster team'}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert _search(client, auth_headers, '/api/v1/project/', 'hopper') == []
+        assert _search(client, auth_headers, '/api/v1/project/', 'brewster') == ['Compiler']
+
+        assert client.delete(f'/api/v1/project/{project_id}', headers=auth_headers).status_code == 200
+        assert _search(client, auth_headers, '/api/v1/project/', 'compiler') == []
+
+    def test_triggers_cover_bulk_statements(self, client, auth_headers, app, clean_db):
+        """Test set-based SQL updates outside the ORM unit of work are indexed too."""
+        with app.app_context():
+            db.session.add(Employee(name='Alan Turing', email='alan@example.com'))
+            db.session.commit()
+            db.session.execute(update(Employee).values(name='Alan Mathison Turing'))
+            db.session.commit()
+
+        assert _search(client, auth_headers, '/api/v1/employee/', 'mathison') == ['Alan Mathison Turing']
+        with app.app_context():
+            with db.engine.connect() as connection:
+                assert fts_in_sync(connection, Employee)
+
+    def test_results_are_ranked_by_relevance(self, client, auth_headers, app, projects):
+        """Test better matches come first even when they are older."""
+        with app.app_context():
+            db.session.add_all([
+                Project(name='Falcon', created_at=1),
+                Project(name='Falcon rollout', description='Falcon hardware for the falcon team', created_at=2),
+                Project(name='Harbor', description='Mentions falcon once among many other words', created_at=3),
+            ])
+            db.session.commit()
+
+        # Newest first would put Harbor first
+        names = _search(client, auth_headers, '/api/v1/project/', 'falcon')
+        assert sorted(names[:2]) == ['Falcon', 'Falcon rollout']
+        assert names[2] == 'Harbor'
+
+    def test_every_word_must_match_as_a_prefix(self, client, auth_headers, app, projects):
+        """Test multi-word searches match rows containing all words, as prefixes only."""
+        with app.app_context():
+            db.session.add_all([Project(name='Falcon rollout'), Project(name='Falcon audit')])
+            db.session.commit()
+
+        assert _search(client, auth_headers, '/api/v1/project/', 'fal roll') == ['Falcon rollout']
+        assert _search(client, auth_headers, '/api/v1/project/', 'alcon') == []
+
+
+class TestSearchFallback:
+    """Test cases for search without FTS5."""
+
+    def test_like_fallback_without_fts5(self, make_app, auth_headers, monkeypatch):
+        """Test search matches substrings, newest first, when the FTS5 tables cannot be created."""
+        monkeypatch.setattr(fulltext, 'fts5_supported', lambda connection: False)
+        app = make_app()
+        with app.app_context():
+            assert not inspect(db.engine).has_table(fts_table_name(Employee))
+            db.session.add_all([
+                Employee(name='Falcon Fan', email='fan@example.com', created_at=1),
+                Employee(name='Ada', email='ada@falcon.example.com', created_at=2),
+                Employee(name='Other', email='other@example.com', created_at=3),
+            ])
+            db.session.commit()
+
+        client = app.test_client()
+        assert _search(client, auth_headers, '/api/v1/employee/', 'ALCON') == ['Ada', 'Falcon Fan']
+        assert _search(client, auth_headers, '/api/v1/employee/', 'nothing') == []
+
+
+@requires_fts5
+class TestSearchRebuild:
+    """Test cases for indexes left behind by a table rebuild."""
+
+    def test_rebuilt_table_is_detected_and_reindexed(self, make_app, auth_headers):
+        """Test renumbered rowids are reported by `flask search check` and fixed by rebuild."""
+        app = make_app('search.db')
+        with app.app_context():
+            db.session.add_all([Employee(name=name, email=f'{name}@example.com') for name in ('Ben', 'Ada', 'Cy')])
+            db.session.commit()
+            # What a batch migration does: copy into a new table (here in another order) and swap
+            with db.engine.begin() as connection:
+                connection.execute(text('CREATE TABLE employees_copy AS SELECT * FROM employees ORDER BY name'))
+                connection.execute(text('DROP TABLE employees'))
+                connection.execute(text('ALTER TABLE employees_copy RENAME TO employees'))
+
+        client = app.test_client()
+        assert _search(client, auth_headers, '/api/v1/employee/', 'ada') != ['Ada']
+
+        runner = app.test_cli_runner()
+        # Pushed so the commands do not reuse the session app's context
+        with app.app_context():
+            result = runner.invoke(args=['search', 'check'])
+            assert result.exit_code == 1
+            assert 'employees_fts is out of sync' in result.output
+
+            assert runner.invoke(args=['search', 'rebuild']).exit_code == 0
+            assert runner.invoke(args=['search', 'check']).exit_code == 0
+        assert _search(client, auth_headers, '/api/v1/employee/', 'ada') == ['Ada']
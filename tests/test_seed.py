@@ -0,0 +1,91 @@
+import pytest
+from sqlalchemy import create_engine, func, inspect, select
+from sqlalchemy.exc import IntegrityError
+from app import db
+from app.models.employee import Employee
+from app.models.employee_project import EmployeeProject
+from app.models.fulltext import SEARCH_COLUMNS, fts_in_sync, fts_table_name
+from app.models.project import Project
+from app.models.task import Task
+from app.utils.seed import Sizes, seed_database
+
+
+def _seeded(path, workers, batch_size):
+    engine = create_engine(f'sqlite:///{path}')
+    db.metadata.create_all(engine)
+    seed_database(engine, Sizes(200, 20, 1000, seed=7), workers=workers, batch_size=batch_size)
+    with engine.connect() as connection:
+        rows = {
+            table.name: connection.execute(select(table).order_by(*table.primary_key.columns)).all()
+            for table in (Employee.__table__, Project.__table__, EmployeeProject.__table__, Task.__table__)
+        }
+    engine.dispose()
+    return rows
+
+
+@pytest.fixture
+def seed_app(make_app):
+    """App on an empty SQLite file."""
+    app = make_app('seed.db')
+    # Pushed so the command does not reuse the session app's context
+    with app.app_context():
+        yield app
+
+
+class TestSeed:
+    """Test cases for the synthetic data generator."""
+
+    def test_same_data_for_any_worker_count(self, tmp_path):
+        """Test the seed and sizes alone decide the generated rows."""
+        single = _seeded(tmp_path / 'single.db', workers=1, batch_size=1000)
+        parallel = _seeded(tmp_path / 'parallel.db', workers=2, batch_size=1000)
+        assert single == parallel
+        assert len(single['employees']) == 200
+        assert len(single['tasks']) == 1000
+
+    def test_links_point_at_seeded_rows(self, tmp_path):
+        """Test memberships and tasks only reference generated employees and projects."""
+        rows = _seeded(tmp_path / 'seed.db', workers=1, batch_size=64)
+        employee_ids = {row.id for row in rows['employees']}
+        project_ids = {row.id for row in rows['projects']}
+
+        assert rows['employee_project']
+        assert {row.employee_id for row in rows['employee_project']} == employee_ids
+        assert {row.project_id for row in rows['employee_project']} <= project_ids
+        assert {row.project_id for row in rows['tasks']} <= project_ids
+
+    def test_failed_seed_keeps_search_indexes(self, tmp_path):
+        """Test the FTS tables dropped for the load are rebuilt when an insert fails."""
+        engine = create_engine(f'sqlite:///{tmp_path / "seed.db"}')
+        db.metadata.create_all(engine)
+        sizes = Sizes(20, 5, 50, seed=7)
+        seed_database(engine, sizes, workers=1)
+        with engine.connect() as connection:
+            searched = [model for model in SEARCH_COLUMNS if inspect(connection).has_table(fts_table_name(model))]
+
+        # The same seed generates the same primary keys again
+        with pytest.raises(IntegrityError):
+            seed_database(engine, sizes, workers=1)
+        with engine.connect() as connection:
+            for model in searched:
+                assert inspect(connection).has_table(fts_table_name(model))
+                assert fts_in_sync(connection, model)
+        engine.dispose()
+
+    def test_seed_command(self, seed_app):
+        """Test flask seed fills an empty database and refuses a full one without --reset."""
+        runner = seed_app.test_cli_runner()
+        args = ['seed', '--employees', '50', '--projects', '5', '--tasks', '300', '--workers', '1']
+
+        result = runner.invoke(args=args)
+        assert result.exit_code == 0, result.output
+        assert 'rows/s' in result.output
+
+        result = runner.invoke(args=args)
+        assert result.exit_code != 0
+        assert '--reset' in result.output
+
+        result = runner.invoke(args=args + ['--reset', '--tasks', '100'])
+        assert result.exit_code == 0, result.output
+        assert db.session.scalar(select(func.count()).select_from(Task)) == 100
+        assert db.session.scalar(select(func.count()).select_from(Employee)) == 50
@@ -0,0 +1,103 @@
+import pytest
+import json
+from flask import request_finished
+from app import db
+from app.models.employee import Employee
+from app.models.project import Project
+from app.models.task import Task
+
+
+@pytest.fixture
+def stream_rows(app, clean_db):
+    """Create employees, projects and tasks with a mix of filterable values."""
+    with app.app_context():
+        project = Project(name='Stream')
+        db.session.add(project)
+        db.session.flush()
+        for i in range(6):
+            db.session.add(Employee(
+                name=f'Streamer {i}', email=f'streamer{i}@example.com',
+                deactivated=1640995200000 if i % 3 == 0 else None
+            ))
+            db.session.add(Project(name=f'Archive {i}', archived=i % 2 == 0, billable=i < 3))
+            db.session.add(Task(
+                name=f'Chunk {i}', project_id=project.id,
+                status='completed' if i % 2 else 'pending', priority='high' if i < 2 else 'low'
+            ))
+        db.session.commit()
+        yield
+        Task.query.delete()
+        Project.query.delete()
+        db.session.commit()
+
+
+@pytest.fixture
+def sent(app):
+    """Responses as the app returned them, before the test client buffers their body."""
+    responses = []
+    
+    def record(sender, response, **extra):
+        responses.append(response)
+    
+    with request_finished.connected_to(record, app):
+        yield responses
+
+
+def _lines(response):
+    body = response.get_data(as_text=True)
+    assert body.endswith('\n')
+    return [json.loads(line) for line in body.splitlines()]
+
+
+def _paged_ids(client, headers, url, key, params):
+    response = client.get(url, query_string={**params, 'per_page': 100}, headers=headers)
+    assert response.status_code == 200
+    return [row['id'] for row in json.loads(response.data)[key]]
+
+
+class TestNDJSONStreaming:
+    """Test cases for streaming the list endpoints as NDJSON."""
+
+    @pytest.mark.parametrize('url, key, params', [
+        ('/api/v1/employee/', 'employees', {}),
+        ('/api/v1/employee/', 'employees', {'active_only': 'true'}),
+        ('/api/v1/employee/', 'employees', {'search': 'Streamer'}),
+        ('/api/v1/project/', 'projects', {}),
+        ('/api/v1/project/', 'projects', {'archived_only': 'true', 'billable_only': 'true'}),
+        ('/api/v1/task/', 'tasks', {}),
+        ('/api/v1/task/', 'tasks', {'status': 'completed', 'priority': 'low'}),
+    ])
+    def test_stream_matches_paginated_list(self, client, auth_headers, stream_rows, sent, url, key, params):
+        """Test the stream has one object per line with the same rows and order as the list."""
+        response = client.get(url, query_string={**params, 'stream': 'true'}, headers=auth_headers)
+        assert response.status_code == 200
+        assert response.mimetype == 'application/x-ndjson'
+        assert sent[-1].is_streamed
+
+        rows = _lines(response)
+        assert all(isinstance(row, dict) for row in rows)
+        assert [row['id'] for row in rows] == _paged_ids(client, auth_headers, url, key, params)
+
+    def test_accept_header_selects_stream(self, client, auth_headers, stream_rows, sent):
+        """Test Accept: application/x-ndjson streams without the stream parameter."""
+        headers = {**auth_headers, 'Accept': 'application/x-ndjson'}
+        response = client.get('/api/v1/task/', headers=headers)
+        assert sent[-1].is_streamed
+        assert len(_lines(response)) == 6
+
+        response = client.get('/api/v1/task/', headers=auth_headers)
+        assert response.mimetype == 'application/json'
+        assert not sent[-1].is_streamed
+
+    def test_stream_is_written_in_batches(self, client, auth_headers, app, stream_rows, monkeypatch):
+        """Test rows are sent STREAM_BATCH_SIZE at a time rather than as one body."""
+        monkeypatch.setitem(app.config, 'STREAM_BATCH_SIZE', 4)
+        response = client.get('/api/v1/task/?stream=true', headers=auth_headers)
+        chunks = [chunk for chunk in response.iter_encoded() if chunk]
+        assert [chunk.count(b'\n') for chunk in chunks] == [4, 2]
+
+    def test_stream_rejects_invalid_filters(self, client, auth_headers, stream_rows, sent):
+        """Test filters are validated before anything is streamed."""
+        response = client.get('/api/v1/task/?stream=true&status=unknown', headers=auth_headers)
+        assert response.status_code == 400
+        assert not sent[-1].is_streamed
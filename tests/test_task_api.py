@@ -0,0 +1,155 @@
+import pytest
+import json
+from app.models.employee import Employee
+from app.models.project import Project
+from app.models.task import Task
+from app import db
+
+
+@pytest.fixture
+def project_tasks(app, clean_db):
+    """Create a project with two pending and two in-progress tasks."""
+    with app.app_context():
+        project = Project(name='Sprint')
+        db.session.add(project)
+        db.session.flush()
+        for i, status in enumerate(['pending', 'pending', 'in_progress', 'in_progress']):
+            db.session.add(Task(name=f'Task {i}', project_id=project.id, status=status))
+        db.session.commit()
+        project_id = project.id
+        yield project_id
+        Task.query.delete()
+        Project.query.delete()
+        db.session.commit()
+
+
+class TestTaskBulkAPI:
+    """Test cases for the bulk task update and delete endpoints."""
+    
+    def test_bulk_update_by_filter(self, client, auth_headers, app, project_tasks):
+        """Test a filter patch updates only the matching tasks."""
+        payload = {
+            'filter': {'project_id': project_tasks, 'status': 'in_progress'},
+            'changes': {'status': 'completed'}
+        }
+        response = client.patch('/api/v1/task/bulk', json=payload, headers=auth_headers)
+        assert response.status_code == 200
+        assert json.loads(response.data)['updated'] == 2
+        
+        with app.app_context():
+            statuses = sorted(task.status for task in Task.query.all())
+            assert statuses == ['completed', 'completed', 'pending', 'pending']
+    
+    def test_bulk_update_by_ids(self, client, auth_headers, app, project_tasks):
+        """Test an ID patch updates the listed tasks."""
+        with app.app_context():
+            task_id = Task.query.filter_by(name='Task 0').one().id
+        
+        payload = {'ids': [task_id, 'missing'], 'changes': {'priority': 'urgent'}}
+        response = client.patch('/api/v1/task/bulk', json=payload, headers=auth_headers)
+        assert response.status_code == 200
+        assert json.loads(response.data)['updated'] == 1
+        
+        with app.app_context():
+            assert db.session.get(Task, task_id).priority == 'urgent'
+    
+    def test_bulk_update_requires_a_selection(self, client, auth_headers, project_tasks):
+        """Test an empty filter is rejected instead of updating every task."""
+        payload = {'filter': {}, 'changes': {'status': 'completed'}}
+        response = client.patch('/api/v1/task/bulk', json=payload, headers=auth_headers)
+        assert response.status_code == 400
+    
+    def test_bulk_delete_by_filter(self, client, auth_headers, app, project_tasks):
+        """Test a filter delete removes only the matching tasks."""
+        payload = {'filter': {'status': 'pending'}}
+        response = client.delete('/api/v1/task/bulk', json=payload, headers=auth_headers)
+        assert response.status_code == 200
+        assert json.loads(response.data)['deleted'] == 2
+        
+        with app.app_context():
+            assert Task.query.count() == 2
+
+
+@pytest.fixture
+def staffed_task(app, clean_db):
+    """Create a project with one member and one task."""
+    with app.app_context():
+        employee = Employee(name='Ada Lovelace', email='ada@example.com')
+        project = Project(name='Engine')
+        db.session.add_all([employee, project])
+        db.session.flush()
+        employee.projects = [project.id]
+        task = Task(name='Design', project_id=project.id)
+        db.session.add(task)
+        db.session.commit()
+        ids = {'employee': employee.id, 'project': project.id, 'task': task.id}
+        yield ids
+        Task.query.delete()
+        Project.query.delete()
+        db.session.commit()
+
+
+class TestTaskEmployees:
+    """Test cases for task assignees resolved from the owning project."""
+    
+    def test_employees_follow_project_membership(self, client, auth_headers, app, staffed_task):
+        """Test a task's employees change when its project's members do."""
+        url = f"/api/v1/task/{staffed_task['task']}"
+        response = client.get(url, headers=auth_headers)
+        assert json.loads(response.data)['task']['employees'] == [staffed_task['employee']]
+        
+        with app.app_context():
+            other = Employee(name='Charles Babbage', email='charles@example.com')
+            db.session.add(other)
+            db.session.commit()
+            other_id = other.id
+        
+        response = client.post(
+            f"/api/v1/project/{staffed_task['project']}/employees",
+            json={'employee_id': other_id}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        response = client.get(url, headers=auth_headers)
+        assert json.loads(response.data)['task']['employees'] == [staffed_task['employee'], other_id]
+        
+        response = client.delete(
+            f"/api/v1/project/{staffed_task['project']}/employees/{staffed_task['employee']}",
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        response = client.get(url, headers=auth_headers)
+        assert json.loads(response.data)['task']['employees'] == [other_id]
+    
+    def test_unknown_project_employees_are_rejected(self, client, auth_headers, staffed_task):
+        """Test creating or updating a project with an unknown employee is a 400 that changes nothing."""
+        response = client.post(
+            '/api/v1/project/', json={'name': 'Ghost', 'employees': ['missing-employee']}, headers=auth_headers
+        )
+        assert response.status_code == 400
+        assert 'missing-employee' in json.loads(response.data)['error']
+        
+        url = f"/api/v1/project/{staffed_task['project']}"
+        response = client.put(url, json={'employees': ['missing-employee']}, headers=auth_headers)
+        assert response.status_code == 400
+        response = client.get(url, headers=auth_headers)
+        assert json.loads(response.data)['project']['employees'] == [staffed_task['employee']]
+    
+    def test_employees_cannot_be_written_on_the_task(self, client, auth_headers, app, staffed_task):
+        """Test assignees are only changed through the project."""
+        response = client.put(
+            f"/api/v1/task/{staffed_task['task']}", json={'employees': []}, headers=auth_headers
+        )
+        assert response.status_code == 400
+        
+        with app.app_context():
+            task = db.session.get(Task, staffed_task['task'])
+            with pytest.raises(AttributeError):
+                task.employees = []
+            
+            # The project relationship is view-only, assigning it does not move the task
+            task.project = Project(name='Elsewhere')
+            db.session.commit()
+            db.session.expire_all()
+            task = db.session.get(Task, staffed_task['task'])
+            assert task.project_id == staffed_task['project']
+            assert task.employees == [staffed_task['employee']]
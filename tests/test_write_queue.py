@@ -0,0 +1,58 @@
+import pytest
+import json
+import threading
+import time
+from app import db
+from app.models.employee import Employee
+
+
+@pytest.fixture
+def queued_app(make_app):
+    """App on a SQLite file with write requests going through the write queue."""
+    return make_app('queue.db', WRITE_QUEUE_ENABLED=True)
+
+
+class TestWriteQueue:
+    """Test cases for the single-writer queue."""
+    
+    def test_concurrent_creates_are_batched(self, queued_app, auth_headers):
+        """Test concurrent writes all commit, sharing batches."""
+        statuses = []
+        
+        def create(index):
+            response = queued_app.test_client().post('/api/v1/employee/', json={
+                'name': f'Employee {index}',
+                'email': f'employee{index}@example.com',
+                'invited': int(time.time() * 1000)
+            }, headers=auth_headers)
+            statuses.append(response.status_code)
+        
+        threads = [threading.Thread(target=create, args=(index,)) for index in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert statuses == [201] * 20
+        with queued_app.app_context():
+            assert db.session.query(Employee).count() == 20
+        
+        stats = json.loads(queued_app.test_client().get('/api/status').data)['write_queue']
+        assert stats['jobs'] == 20
+        assert stats['batches'] <= 20
+    
+    def test_failed_write_does_not_affect_batch(self, queued_app, auth_headers):
+        """Test a failing write rolls back alone and keeps its error response."""
+        client = queued_app.test_client()
+        data = {'name': 'Jane', 'email': 'jane@example.com', 'invited': int(time.time() * 1000)}
+        
+        assert client.post('/api/v1/employee/', json=data, headers=auth_headers).status_code == 201
+        assert client.post('/api/v1/employee/', json=data, headers=auth_headers).status_code == 409
+        assert client.put('/api/v1/employee/missing', json={'name': 'X'}, headers=auth_headers).status_code == 404
+        
+        employee_id = json.loads(client.get('/api/v1/employee/', headers=auth_headers).data)['employees'][0]['id']
+        response = client.put(f'/api/v1/employee/{employee_id}', json={'name': 'Jane Doe'}, headers=auth_headers)
+        assert response.status_code == 200
+        
+        response = client.get(f'/api/v1/employee/{employee_id}', headers=auth_headers)
+        assert json.loads(response.data)['employee']['name'] == 'Jane Doe'